@@ -0,0 +1,189 @@
+"""Benchmarks for the scoring, graph, storage and ingestion hot paths.
+
+    python benchmarks/run.py --scales 1000,10000 --output results.json
+    python benchmarks/run.py --baseline results.json --threshold 0.2
+
+Each benchmark runs on seeded synthetic data at every scale and reports the best
+of `--repeat` runs. With `--baseline`, benchmarks that got slower than the stored
+result by more than `--threshold` are reported and the exit status is 1.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from logos_engine.agents.orchestrator import Orchestrator
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.reasoning.scoring import compute_argument_strength, compute_claim_confidence
+from logos_engine.reasoning.trace import TRACE_OFF
+from logos_engine.rules.rulebook import Rulebook
+from logos_engine.storage.json_graph_store import load_graph, save_graph
+from logos_engine.synthetic.documents import generate_document
+from logos_engine.synthetic.graphs import SyntheticGraphSpec, generate_graph
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SCALES = (100, 1000, 10000)
+
+Benchmark = Callable[[OntologyGraph, Rulebook, Path], int]
+
+
+def bench_claim_confidence(graph: OntologyGraph, rulebook: Rulebook, workdir: Path) -> int:
+    compiled = rulebook.compile()
+    claim_ids = list(graph.entities["Claim"])
+    for claim_id in claim_ids:
+        compute_claim_confidence(claim_id, graph, compiled, trace_level=TRACE_OFF)
+    return len(claim_ids)
+
+
+def bench_argument_strength(graph: OntologyGraph, rulebook: Rulebook, workdir: Path) -> int:
+    compiled = rulebook.compile()
+    argument_ids = list(graph.entities["Argument"])
+    for argument_id in argument_ids:
+        compute_argument_strength(argument_id, graph, compiled, trace_level=TRACE_OFF)
+    return len(argument_ids)
+
+
+def bench_get_relations(graph: OntologyGraph, rulebook: Rulebook, workdir: Path) -> int:
+    claim_ids = list(graph.entities["Claim"])
+    for claim_id in claim_ids:
+        graph.get_relations(dst_id=claim_id)
+    return len(claim_ids)
+
+
+def bench_get_entity(graph: OntologyGraph, rulebook: Rulebook, workdir: Path) -> int:
+    entity_ids = [entity_id for bucket in graph.entities.values() for entity_id in bucket]
+    for entity_id in entity_ids:
+        graph.get_entity(entity_id)
+    return len(entity_ids)
+
+
+def bench_save_graph(graph: OntologyGraph, rulebook: Rulebook, workdir: Path) -> int:
+    save_graph(graph, workdir / "graph.json")
+    return 1
+
+
+def bench_load_graph(graph: OntologyGraph, rulebook: Rulebook, workdir: Path) -> int:
+    path = workdir / "graph.json"
+    if not path.exists():
+        save_graph(graph, path)
+    load_graph(path)
+    return 1
+
+
+def bench_orchestrator(graph: OntologyGraph, rulebook: Rulebook, workdir: Path) -> int:
+    # One document whose length follows the scale (one paragraph per 10 claims).
+    path = workdir / "document.txt"
+    if not path.exists():
+        paragraphs = max(len(graph.entities["Claim"]) // 10, 1)
+        path.write_text(generate_document(paragraphs=paragraphs), encoding="utf-8")
+    Orchestrator().run(OntologyGraph(), {"path": str(path)})
+    return 1
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "claim_confidence": bench_claim_confidence,
+    "argument_strength": bench_argument_strength,
+    "get_relations": bench_get_relations,
+    "get_entity": bench_get_entity,
+    "save_graph": bench_save_graph,
+    "load_graph": bench_load_graph,
+    "orchestrator_run": bench_orchestrator,
+}
+
+
+def run_benchmarks(
+    scales: List[int], names: List[str], repeat: int, rulebook: Rulebook
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for scale in scales:
+        graph = generate_graph(SyntheticGraphSpec(claims=scale))
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            for name in names:
+                timings = []
+                operations = 0
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    operations = BENCHMARKS[name](graph, rulebook, workdir)
+                    timings.append(time.perf_counter() - start)
+                best = min(timings)
+                results.append(
+                    {
+                        "name": name,
+                        "scale": scale,
+                        "operations": operations,
+                        "seconds": best,
+                        "per_operation_us": best / max(operations, 1) * 1e6,
+                    }
+                )
+                print(f"{name:>18} @ {scale:>8}: {best * 1000:10.3f} ms", file=sys.stderr)
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Describe each benchmark slower than its baseline by more than `threshold`."""
+    previous = {(entry["name"], entry["scale"]): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        before = previous.get((entry["name"], entry["scale"]))
+        if before is None or before["seconds"] <= 0:
+            continue
+        ratio = entry["seconds"] / before["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{entry['name']} @ {entry['scale']}: {before['seconds'] * 1000:.3f} ms -> "
+                f"{entry['seconds'] * 1000:.3f} ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)))
+    parser.add_argument("--only", default=",".join(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--rules", default=str(ROOT / "config" / "rules.yaml"))
+    parser.add_argument("--output", default=None, help="Write results as JSON")
+    parser.add_argument("--baseline", default=None, help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    names = [name for name in args.only.split(",") if name]
+    unknown = sorted(set(names) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    scales = [int(scale) for scale in args.scales.split(",") if scale]
+    rulebook = Rulebook.from_path(Path(args.rules))
+    report = {
+        "created": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": run_benchmarks(scales, names, args.repeat, rulebook),
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(report["results"], baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,25 +1,51 @@
 from __future__ import annotations
 
+from typing import List
+
 from ..ontology.graph import OntologyGraph
 from ..ontology.models import Argument
-from ..utils.ids import new_id
+from ..ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
 from .base import AgentResult, BaseAgent
 
 
 class ArgumentBuilder(BaseAgent):
+    """One argument per claim, from the evidence and assumptions linked to that claim.
+
+    Ids are read from the claim's incoming edges (an indexed lookup), so each
+    argument is as large as its claim's neighbourhood. The lists reference the
+    graph's own id strings and the model is built without re-validation, which
+    would copy them.
+    """
+
     name = "argument_builder"
+    version = "2"
+    reads = ("Claim", "Evidence", "Assumption", SUPPORTS, CHALLENGES, UNDERLIES)
+    produces = ("Argument",)
 
     def run(self, graph: OntologyGraph, context: dict) -> AgentResult:
         result = AgentResult()
-        evidence_ids = list(graph.entities.get("Evidence", {}).keys())
-        assumption_ids = list(graph.entities.get("Assumption", {}).keys())
+        evidence = graph.entities.get("Evidence", {})
+        assumptions = graph.entities.get("Assumption", {})
         for claim in graph.entities.get("Claim", {}).values():
+            evidence_ids: List[str] = []
+            assumption_ids: List[str] = []
+            for src_id, relation, _ in graph.get_relations(dst_id=claim.id):
+                if relation == UNDERLIES:
+                    if src_id in assumptions:
+                        assumption_ids.append(src_id)
+                elif relation in (SUPPORTS, CHALLENGES) and src_id in evidence:
+                    evidence_ids.append(src_id)
             argument = Argument(
-                id=new_id("argument"),
+                id=self.make_id("argument", claim.id),
                 claim_id=claim.id,
-                evidence_ids=evidence_ids,
-                assumption_ids=assumption_ids,
+                evidence_ids=_unique(evidence_ids),
+                assumption_ids=_unique(assumption_ids),
             )
             graph.add_entity(argument)
             result.created_entities.append(argument.id)
         return result
+
+
+def _unique(ids: List[str]) -> List[str]:
+    """Drop repeats (an item can both support and challenge a claim), keeping order."""
+    return ids if len(set(ids)) == len(ids) else list(dict.fromkeys(ids))
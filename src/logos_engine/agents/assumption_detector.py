@@ -3,18 +3,19 @@ from __future__ import annotations
 from ..ontology.graph import OntologyGraph
 from ..ontology.models import Assumption
 from ..ontology.relations import UNDERLIES
-from ..utils.ids import new_id
 from .base import AgentResult, BaseAgent
 
 
 class AssumptionDetector(BaseAgent):
     name = "assumption_detector"
+    reads = ("Claim",)
+    produces = ("Assumption", UNDERLIES)
 
     def run(self, graph: OntologyGraph, context: dict) -> AgentResult:
         result = AgentResult()
         for claim in graph.entities.get("Claim", {}).values():
             assumption = Assumption(
-                id=new_id("assumption"),
+                id=self.make_id("assumption", claim.id),
                 text="Methodological assumption: data is representative.",
                 source_id=claim.source_id,
             )
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Set, Union
+
+from ..ontology.graph import OntologyGraph
+from .base import AgentResult
+from .batch_ingest import DocumentResult
+from .orchestrator import Orchestrator, _apply, _stage
+
+Documents = Union[Iterable[str], AsyncIterable[str]]
+_DONE = object()
+
+
+@dataclass
+class AsyncOrchestrator(Orchestrator):
+    """Asyncio version of `Orchestrator` that keeps many documents in flight.
+
+    Agents run through `arun`, so synchronous agents go to worker threads and
+    async-native agents share the event loop. `process` ingests documents
+    concurrently: at most `max_documents` run at once, and at most `max_pending`
+    finished results wait for the consumer before new documents stop starting.
+    """
+
+    name: str = "async_orchestrator"
+    max_documents: int = 8
+    max_pending: int = 16
+
+    async def arun(self, graph: OntologyGraph, context: dict) -> AgentResult:
+        results: Dict[int, AgentResult] = {}
+        for wave in self._waves():
+            agents = [self.agents[position] for position in wave]
+            if len(agents) == 1:
+                wave_results = [await self.instrumentation.acall(agents[0], graph, context)]
+            else:
+                staged = _stage(agents, graph, context)
+                wave_results = list(
+                    await asyncio.gather(
+                        *(
+                            self.instrumentation.acall(agent, agent_graph, agent_context)
+                            for agent, (agent_graph, agent_context) in zip(
+                                agents, staged, strict=True
+                            )
+                        )
+                    )
+                )
+                _apply(staged, context)
+            results.update(zip(wave, wave_results, strict=True))
+        return self._merge(results)
+
+    async def ingest(self, path: str) -> DocumentResult:
+        """Run the pipeline on one document into its own sub-graph."""
+        graph = OntologyGraph()
+        try:
+            result = await self.arun(graph, {"path": path})
+        except Exception as error:  # noqa: BLE001 - reported on the document result
+            return DocumentResult(path=path, graph=graph, error=repr(error))
+        return DocumentResult(path=path, graph=graph, notes_for_auditor=result.notes_for_auditor)
+
+    async def process(self, documents: Documents) -> AsyncIterator[DocumentResult]:
+        """Yield a `DocumentResult` per document path, in completion order."""
+        finished: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending)
+        slots = asyncio.Semaphore(self.max_documents)
+        tasks: Set[asyncio.Task] = set()
+
+        async def ingest_one(path: str) -> None:
+            try:
+                await finished.put(await self.ingest(path))
+            finally:
+                slots.release()
+
+        async def feed() -> None:
+            try:
+                async for path in _iterate(documents):
+                    await slots.acquire()
+                    task = asyncio.create_task(ingest_one(str(path)))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                await asyncio.gather(*tasks)
+            except Exception as error:  # noqa: BLE001 - re-raised by the consumer
+                await finished.put(error)
+            else:
+                await finished.put(_DONE)
+
+        feeder = asyncio.create_task(feed())
+        try:
+            while True:
+                item = await finished.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            for task in (feeder, *tasks):
+                task.cancel()
+
+
+async def _iterate(documents: Documents) -> AsyncIterator[str]:
+    if isinstance(documents, AsyncIterable):
+        async for document in documents:
+            yield document
+    else:
+        for document in documents:
+            yield document
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from ..ontology.graph import OntologyGraph
-from .base import AgentResult, BaseAgent
+from .base import ANY, AgentResult, BaseAgent
 
 
 class LogicAuditor(BaseAgent):
     name = "logic_auditor"
+    reads = (ANY,)
+    produces = ()
 
     def run(self, graph: OntologyGraph, context: dict) -> AgentResult:
         result = AgentResult()
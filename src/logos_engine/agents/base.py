@@ -1,9 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List
+import asyncio
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..ontology.models import ExplanationTrace, UncertaintyMarker
+from ..utils.ids import content_id
+
+
+@dataclass
+class AgentMetrics:
+    """Cost of one agent call on one document."""
+
+    agent: str
+    document: Optional[str] = None
+    wall_time: float = 0.0
+    # Seconds of CPU used by the thread running the agent; None for async-native agents.
+    cpu_time: Optional[float] = None
+    entities_created: int = 0
+    relations_created: int = 0
+    # Bytes allocated above the starting point, when memory tracking is on.
+    peak_memory: Optional[int] = None
+    profile_path: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
 
 @dataclass
@@ -14,10 +35,54 @@ class AgentResult:
     uncertainty_markers: List[UncertaintyMarker] = field(default_factory=list)
     notes_for_auditor: List[str] = field(default_factory=list)
     traces: List[ExplanationTrace] = field(default_factory=list)
+    metrics: List[AgentMetrics] = field(default_factory=list)
+
+
+# Wildcard for `BaseAgent.reads` / `produces`: depends on (or touches) everything.
+ANY = "*"
 
 
 class BaseAgent:
+    """Pipeline step.
+
+    `reads` and `produces` name the entity types, relation names and context keys
+    the agent consumes and writes. The orchestrator uses them to run independent
+    agents concurrently; an agent that declares nothing runs on its own.
+
+    Bump `version` whenever an agent's output changes, so cached ingests made by
+    the old version are not reused.
+    """
+
     name = "base"
+    version = "1"
+    reads: Tuple[str, ...] = (ANY,)
+    produces: Tuple[str, ...] = (ANY,)
 
     def run(self, graph, context) -> AgentResult:  # type: ignore[override]
         raise NotImplementedError
+
+    async def arun(self, graph, context) -> AgentResult:
+        """Async entry point; by default runs `run` in a worker thread."""
+        return await asyncio.to_thread(self.run, graph, context)
+
+    def make_id(self, prefix: str, *parts: str) -> str:
+        """Id for a new entity, derived from the content it was built from.
+
+        `parts` should include the owning source (or an id derived from it), so that
+        identical content in different documents does not share an id.
+        """
+        return content_id(prefix, *parts)
+
+
+class AsyncAgent(BaseAgent):
+    """Base for agents that implement `arun` natively.
+
+    `run` drives `arun` on a private event loop, so these agents also work with the
+    synchronous `Orchestrator` (which must not itself be called from a running loop).
+    """
+
+    def run(self, graph, context) -> AgentResult:  # type: ignore[override]
+        return asyncio.run(self.arun(graph, context))
+
+    async def arun(self, graph, context) -> AgentResult:
+        raise NotImplementedError
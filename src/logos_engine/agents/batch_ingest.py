@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import glob
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..ontology.graph import OntologyGraph
+from ..storage.ingest_cache import CachedIngest, IngestCache
+from ..utils.ids import file_digest
+from .base import AgentMetrics
+from .orchestrator import Orchestrator
+
+
+@dataclass
+class DocumentResult:
+    path: str
+    graph: OntologyGraph
+    notes_for_auditor: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    context: Dict[str, Any] = field(default_factory=dict)
+    metrics: List[AgentMetrics] = field(default_factory=list)
+    # True when the graph came from the ingest cache instead of running the pipeline.
+    cached: bool = False
+
+
+@dataclass
+class BatchIngestResult:
+    graph: OntologyGraph
+    documents: List[str] = field(default_factory=list)
+    # Document path -> ids renamed while merging that document.
+    renamed_ids: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    failures: Dict[str, str] = field(default_factory=dict)
+    notes_for_auditor: List[str] = field(default_factory=list)
+
+
+def discover_documents(target: str) -> List[Path]:
+    """Files under a directory (recursively, skipping hidden files) or matching a glob."""
+    path = Path(target)
+    if path.is_dir():
+        candidates: Iterable[Path] = path.rglob("*")
+    else:
+        candidates = (Path(match) for match in glob.glob(target, recursive=True))
+    return sorted(
+        candidate
+        for candidate in candidates
+        if candidate.is_file() and not candidate.name.startswith(".")
+    )
+
+
+def ingest_document(
+    path: str,
+    cache: Optional[IngestCache] = None,
+    orchestrator: Optional[Orchestrator] = None,
+) -> DocumentResult:
+    """Run the agent pipeline (the default one unless given) on one document.
+
+    With a cache, a document whose path and content are unchanged since the same
+    pipeline ingested it is loaded from the cache
+    instead of being processed again.
+    """
+    orchestrator = orchestrator or Orchestrator()
+    context: Dict[str, Any] = {"path": path}
+    key = None
+    if cache is not None and Path(path).is_file():
+        context["document_hash"] = file_digest(Path(path))
+        key = cache.key(
+            f"{Path(path).resolve()}\x1f{context['document_hash']}",
+            orchestrator.fingerprint(),
+        )
+        entry = cache.get(key)
+        if entry is not None:
+            context.update(entry.context)
+            return DocumentResult(
+                path=path,
+                graph=entry.graph,
+                notes_for_auditor=entry.notes_for_auditor,
+                context=context,
+                cached=True,
+            )
+    graph = OntologyGraph()
+    result = orchestrator.run(graph, context)
+    if cache is not None and key is not None:
+        cache.put(key, CachedIngest(graph, context, result.notes_for_auditor))
+    return DocumentResult(
+        path=path,
+        graph=graph,
+        notes_for_auditor=result.notes_for_auditor,
+        context=context,
+        metrics=result.metrics,
+    )
+
+
+def ingest_batch(
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    cache: Optional[IngestCache] = None,
+) -> BatchIngestResult:
+    """Ingest documents in parallel and merge their sub-graphs in input order.
+
+    Documents run in a process pool (`workers` processes, or the given executor);
+    `workers=1` runs inline. A failing document is recorded in `failures` and does
+    not stop the batch. With `cache`, unchanged documents are loaded from it.
+    """
+    documents = [str(path) for path in paths]
+    batch = BatchIngestResult(graph=OntologyGraph())
+    if workers == 1 and executor is None:
+        for document in documents:
+            try:
+                _merge(batch, ingest_document(document, cache))
+            except Exception as error:  # noqa: BLE001 - recorded per document
+                batch.failures[document] = repr(error)
+        return batch
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures: List[Future] = [
+            pool.submit(ingest_document, document, cache) for document in documents
+        ]
+        for document, future in zip(documents, futures, strict=True):
+            try:
+                _merge(batch, future.result())
+            except Exception as error:  # noqa: BLE001 - recorded per document
+                batch.failures[document] = repr(error)
+    finally:
+        if executor is None:
+            pool.shutdown()
+    return batch
+
+
+def _merge(batch: BatchIngestResult, document: DocumentResult) -> None:
+    renamed = batch.graph.merge(document.graph)
+    if renamed:
+        batch.renamed_ids[document.path] = renamed
+    batch.documents.append(document.path)
+    batch.notes_for_auditor.extend(document.notes_for_auditor)
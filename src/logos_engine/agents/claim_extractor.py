@@ -1,21 +1,45 @@
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Iterable
+
 from ..ontology.graph import OntologyGraph
-from ..ontology.models import Claim
-from ..utils.ids import new_id
-from ..utils.text import extract_claims
+from ..ontology.models import Claim, Span
+from ..utils.text import iter_claims, iter_sentences, read_chunks
 from .base import AgentResult, BaseAgent
 
 
 class ClaimExtractor(BaseAgent):
+    """Adds a claim, with its span, for every claim sentence of the document.
+
+    Reads `context["document_text"]` when given, otherwise streams the file at
+    `context["document_path"]` in chunks.
+    """
+
     name = "claim_extractor"
+    reads = ("document_text", "document_path", "source_id")
+    produces = ("Claim",)
 
     def run(self, graph: OntologyGraph, context: dict) -> AgentResult:
         result = AgentResult()
-        text = context.get("document_text", "")
         source_id = context.get("source_id")
-        for claim_text in extract_claims(text):
-            claim = Claim(id=new_id("claim"), text=claim_text, source_id=source_id)
+        chunks: Iterable[str] = ()
+        if "document_text" in context:
+            chunks = (context["document_text"],)
+        elif context.get("document_path"):
+            chunks = read_chunks(Path(context["document_path"]))
+        for sentence in iter_claims(iter_sentences(chunks)):
+            claim_id = self.make_id(
+                "claim", str(source_id), str(sentence.start_offset), str(sentence.end_offset)
+            )
+            span = Span(
+                span_id=self.make_id("span", claim_id),
+                page=sentence.page,
+                paragraph=sentence.paragraph,
+                start_offset=sentence.start_offset,
+                end_offset=sentence.end_offset,
+            )
+            claim = Claim(id=claim_id, text=sentence.text, source_id=source_id, span=span)
             graph.add_entity(claim)
             result.created_entities.append(claim.id)
         return result
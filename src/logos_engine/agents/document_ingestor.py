@@ -4,28 +4,42 @@ from pathlib import Path
 
 from ..ontology.graph import OntologyGraph
 from ..ontology.models import Source
-from ..utils.ids import new_id
+from ..utils.ids import file_digest
 from .base import AgentResult, BaseAgent
 
+SUMMARY_CHARS = 200
+
 
 class DocumentIngestor(BaseAgent):
+    """Registers the document as a `Source`.
+
+    Only the summary is read here; `ClaimExtractor` streams the document from
+    `context["document_path"]`. The source id is derived from the document's
+    resolved path and content hash (`context["document_hash"]`, computed if
+    missing), so identical files at different paths get distinct ids.
+    """
+
     name = "document_ingestor"
+    reads = ("path",)
+    produces = ("Source", "source_id", "document_path", "document_hash")
 
     def run(self, graph: OntologyGraph, context: dict) -> AgentResult:
         result = AgentResult()
         path = Path(context.get("path", ""))
-        text = ""
-        if path.exists():
-            text = path.read_text(encoding="utf-8")
+        summary = ""
+        if path.is_file():
+            with path.open("r", encoding="utf-8") as handle:
+                summary = handle.read(SUMMARY_CHARS)
+            context["document_path"] = str(path)
+            context.setdefault("document_hash", file_digest(path))
         source = Source(
-            id=new_id("source"),
+            id=self.make_id("source", str(path.resolve()), context.get("document_hash", "")),
             title=path.name or "untitled",
             source_type="local_document",
             uri=str(path) if path else None,
-            summary=text[:200] if text else None,
+            summary=summary or None,
         )
         graph.add_entity(source)
         context["source_id"] = source.id
-        context["document_text"] = text
         result.created_entities.append(source.id)
         return result
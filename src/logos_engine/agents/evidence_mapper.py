@@ -3,18 +3,19 @@ from __future__ import annotations
 from ..ontology.graph import OntologyGraph
 from ..ontology.models import Evidence
 from ..ontology.relations import SUPPORTS
-from ..utils.ids import new_id
 from .base import AgentResult, BaseAgent
 
 
 class EvidenceMapper(BaseAgent):
     name = "evidence_mapper"
+    reads = ("Claim",)
+    produces = ("Evidence", SUPPORTS)
 
     def run(self, graph: OntologyGraph, context: dict) -> AgentResult:
         result = AgentResult()
         for claim in graph.entities.get("Claim", {}).values():
             evidence = Evidence(
-                id=new_id("evidence"),
+                id=self.make_id("evidence", claim.id),
                 text=f"Stub evidence for claim: {claim.text}",
                 evidence_type="empirical",
                 source_id=claim.source_id,
@@ -6,6 +6,8 @@ from .base import AgentResult, BaseAgent
 
 class ExplanationComposer(BaseAgent):
     name = "explanation_composer"
+    reads = ("Claim", "Evidence")
+    produces = ()
 
     def run(self, graph: OntologyGraph, context: dict) -> AgentResult:
         result = AgentResult()
@@ -0,0 +1,169 @@
+"""Per-agent timing, memory and profiling for the orchestrators.
+
+Every agent call is measured (wall time, CPU time of the thread running it and
+the entities/relations it reports). Peak memory uses `tracemalloc` and is opt-in
+because tracing slows allocation-heavy agents down; one agent can also be run
+under cProfile or pyinstrument.
+"""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import itertools
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple
+
+from ..storage.audit_log import AuditLog
+from .base import AgentMetrics, AgentResult, BaseAgent
+
+PROFILER_CPROFILE = "cprofile"
+PROFILER_PYINSTRUMENT = "pyinstrument"
+PROFILERS = (PROFILER_CPROFILE, PROFILER_PYINSTRUMENT)
+
+
+@dataclass
+class Instrumentation:
+    """Measures agent calls and reports them to the audit log.
+
+    `track_memory` records each agent's tracemalloc peak. `profile_agent` names an
+    agent to profile with `profiler`; profiles are written to `profile_dir`. Peaks
+    and profilers are process-wide, so calls that use them hold a lock and never
+    overlap with each other.
+    """
+
+    track_memory: bool = False
+    profile_agent: Optional[str] = None
+    profiler: str = PROFILER_CPROFILE
+    profile_dir: Path = Path("logs/profiles")
+    audit_log: Optional[AuditLog] = None
+    _profile_ids: Iterator[int] = field(default_factory=itertools.count, init=False, repr=False)
+    _exclusive: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.profiler not in PROFILERS:
+            raise ValueError(f"Unknown profiler {self.profiler!r}; expected one of {PROFILERS}")
+
+    def call(self, agent: BaseAgent, graph: Any, context: dict) -> AgentResult:
+        """Run `agent.run` and attach its `AgentMetrics` to the result."""
+        if self.track_memory or agent.name == self.profile_agent:
+            with self._exclusive:
+                return self._call(agent, graph, context)
+        return self._call(agent, graph, context)
+
+    def _call(self, agent: BaseAgent, graph: Any, context: dict) -> AgentResult:
+        profiler = self._start_profiler(agent)
+        memory_start = self._start_memory()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            result = agent.run(graph, context)
+        finally:
+            cpu_time = time.thread_time() - cpu_start
+            wall_time = time.perf_counter() - wall_start
+            peak_memory = self._stop_memory(memory_start)
+            profile_path = self._stop_profiler(agent, profiler)
+        result.metrics.insert(
+            0,
+            _metrics(agent, context, result, wall_time, cpu_time, peak_memory, profile_path),
+        )
+        return result
+
+    async def acall(self, agent: BaseAgent, graph: Any, context: dict) -> AgentResult:
+        """Async counterpart of `call`.
+
+        Agents using the default `arun` run `call` in a worker thread. Async-native
+        agents share the event loop with other tasks, so only their wall time and
+        counts are recorded.
+        """
+        if type(agent).arun is BaseAgent.arun:
+            return await asyncio.to_thread(self.call, agent, graph, context)
+        wall_start = time.perf_counter()
+        result = await agent.arun(graph, context)
+        wall_time = time.perf_counter() - wall_start
+        result.metrics.insert(0, _metrics(agent, context, result, wall_time, None, None, None))
+        return result
+
+    def report(self, metrics: List[AgentMetrics]) -> None:
+        """Append one `agent_metrics` audit event per entry."""
+        if self.audit_log is None:
+            return
+        for entry in metrics:
+            self.audit_log.append({"event": "agent_metrics", **entry.to_dict()})
+
+    def _start_memory(self) -> Optional[Tuple[int, bool]]:
+        """Baseline traced memory, and whether tracing was started for this call."""
+        if not self.track_memory:
+            return None
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0], started
+
+    def _stop_memory(self, start: Optional[Tuple[int, bool]]) -> Optional[int]:
+        if start is None:
+            return None
+        baseline, started = start
+        peak = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+        if started:
+            tracemalloc.stop()
+        return peak
+
+    def _start_profiler(self, agent: BaseAgent) -> Any:
+        if agent.name != self.profile_agent:
+            return None
+        if self.profiler == PROFILER_PYINSTRUMENT:
+            try:
+                from pyinstrument import Profiler
+            except ImportError as error:
+                raise ImportError(
+                    "The pyinstrument profiler requires logos-engine[profile]."
+                ) from error
+            profiler: Any = Profiler()
+            profiler.start()
+            return profiler
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _stop_profiler(self, agent: BaseAgent, profiler: Any) -> Optional[str]:
+        if profiler is None:
+            return None
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        stem = self.profile_dir / f"{agent.name}-{next(self._profile_ids)}"
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            path = stem.with_suffix(".prof")
+            profiler.dump_stats(path)
+        else:
+            profiler.stop()
+            path = stem.with_suffix(".html")
+            path.write_text(profiler.output_html(), encoding="utf-8")
+        return str(path)
+
+
+def _metrics(
+    agent: BaseAgent,
+    context: dict,
+    result: AgentResult,
+    wall_time: float,
+    cpu_time: Optional[float],
+    peak_memory: Optional[int],
+    profile_path: Optional[str],
+) -> AgentMetrics:
+    document = context.get("path")
+    return AgentMetrics(
+        agent=agent.name,
+        document=str(document) if document is not None else None,
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+        entities_created=len(result.created_entities),
+        relations_created=len(result.relations_added),
+        peak_memory=peak_memory,
+        profile_path=profile_path,
+    )
+
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..ontology.graph import OntologyGraph
+from .argument_builder import ArgumentBuilder
 from .assumption_detector import AssumptionDetector
 from .auditors import LogicAuditor
-from .base import AgentResult, BaseAgent
+from .base import ANY, AgentResult, BaseAgent
 from .claim_extractor import ClaimExtractor
 from .document_ingestor import DocumentIngestor
 from .evidence_mapper import EvidenceMapper
 from .explanation_composer import ExplanationComposer
-from .argument_builder import ArgumentBuilder
+from .instrumentation import Instrumentation
 
 
 @dataclass
 class Orchestrator(BaseAgent):
+    """Runs `agents` as a dependency DAG.
+
+    An agent depends on every earlier agent whose outputs it reads, that reads its
+    outputs, or that writes the same thing. Agents are grouped into waves of
+    mutually independent agents; a wave with several agents runs on a thread pool
+    of `max_workers` threads. Each of them sees the graph and context as they were
+    when the wave started, and their writes are applied afterwards in declaration
+    order. The merged `AgentResult` always follows declaration order.
+
+    Every agent call is measured by `instrumentation`; the metrics are on
+    `AgentResult.metrics` and are appended to its audit log, if it has one.
+    """
+
     name: str = "orchestrator"
     agents: List[BaseAgent] = field(
         default_factory=lambda: [
@@ -28,15 +44,153 @@ class Orchestrator(BaseAgent):
             ExplanationComposer(),
         ]
     )
+    max_workers: Optional[int] = 4
+    instrumentation: Instrumentation = field(default_factory=Instrumentation)
+
+    def fingerprint(self) -> str:
+        """Hash of the agents (class, name and version) and their order."""
+        description = "|".join(
+            f"{type(agent).__module__}.{type(agent).__qualname__}:{agent.name}:{agent.version}"
+            for agent in self.agents
+        )
+        return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+    def schedule(self) -> List[List[BaseAgent]]:
+        """Group agents into waves; each wave only depends on earlier waves."""
+        return [[self.agents[position] for position in wave] for wave in self._waves()]
 
     def run(self, graph: OntologyGraph, context: dict) -> AgentResult:
+        waves = self._waves()
+        concurrent = self.max_workers != 1 and any(len(wave) > 1 for wave in waves)
+        pool = ThreadPoolExecutor(max_workers=self.max_workers) if concurrent else None
+        results: Dict[int, AgentResult] = {}
+        try:
+            for wave in waves:
+                agents = [self.agents[position] for position in wave]
+                if pool is None or len(agents) == 1:
+                    wave_results = [
+                        self.instrumentation.call(agent, graph, context) for agent in agents
+                    ]
+                else:
+                    wave_results = _run_wave(pool, agents, graph, context, self.instrumentation)
+                results.update(zip(wave, wave_results, strict=True))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return self._merge(results)
+
+    def _merge(self, results: Dict[int, AgentResult]) -> AgentResult:
         result = AgentResult()
-        for agent in self.agents:
-            agent_result = agent.run(graph, context)
-            result.created_entities.extend(agent_result.created_entities)
-            result.updated_entities.extend(agent_result.updated_entities)
-            result.relations_added.extend(agent_result.relations_added)
-            result.uncertainty_markers.extend(agent_result.uncertainty_markers)
-            result.notes_for_auditor.extend(agent_result.notes_for_auditor)
-            result.traces.extend(agent_result.traces)
+        for position in range(len(self.agents)):
+            _merge_result(result, results[position])
+        self.instrumentation.report(
+            [results[position].metrics[0] for position in range(len(self.agents))]
+        )
         return result
+
+    def _waves(self) -> List[List[int]]:
+        levels: List[int] = []
+        for position, agent in enumerate(self.agents):
+            level = 0
+            for earlier in range(position):
+                if _depends(agent, self.agents[earlier]):
+                    level = max(level, levels[earlier] + 1)
+            levels.append(level)
+        waves: List[List[int]] = [[] for _ in range(max(levels, default=-1) + 1)]
+        for position, level in enumerate(levels):
+            waves[level].append(position)
+        return waves
+
+
+def _depends(agent: BaseAgent, earlier: BaseAgent) -> bool:
+    return (
+        _overlaps(agent.reads, earlier.produces)
+        or _overlaps(agent.produces, earlier.reads)
+        or _overlaps(agent.produces, earlier.produces)
+    )
+
+
+def _overlaps(left: Tuple[str, ...], right: Tuple[str, ...]) -> bool:
+    if not left or not right:
+        return False
+    return ANY in left or ANY in right or not set(left).isdisjoint(right)
+
+
+def _run_wave(
+    pool: ThreadPoolExecutor,
+    wave: List[BaseAgent],
+    graph: OntologyGraph,
+    context: dict,
+    instrumentation: Instrumentation,
+) -> List[AgentResult]:
+    staged = _stage(wave, graph, context)
+    futures = [
+        pool.submit(instrumentation.call, agent, agent_graph, agent_context)
+        for agent, (agent_graph, agent_context) in zip(wave, staged, strict=True)
+    ]
+    results = [future.result() for future in futures]
+    _apply(staged, context)
+    return results
+
+
+Staged = List[Tuple["_StagedGraph", dict]]
+
+
+def _stage(wave: List[BaseAgent], graph: OntologyGraph, context: dict) -> Staged:
+    """A buffered graph and a private context copy for each agent of a wave."""
+    return [(_StagedGraph(graph), dict(context)) for _ in wave]
+
+
+def _apply(staged: Staged, context: dict) -> None:
+    """Apply staged graph writes and context changes in declaration order."""
+    initial = dict(context)
+    for agent_graph, agent_context in staged:
+        agent_graph.apply()
+        for key, value in agent_context.items():
+            if key not in initial or initial[key] is not value:
+                context[key] = value
+
+
+def _merge_result(result: AgentResult, agent_result: AgentResult) -> None:
+    result.created_entities.extend(agent_result.created_entities)
+    result.updated_entities.extend(agent_result.updated_entities)
+    result.relations_added.extend(agent_result.relations_added)
+    result.uncertainty_markers.extend(agent_result.uncertainty_markers)
+    result.notes_for_auditor.extend(agent_result.notes_for_auditor)
+    result.traces.extend(agent_result.traces)
+    result.metrics.extend(agent_result.metrics)
+
+
+class _StagedGraph:
+    """Graph proxy for a concurrent agent: reads pass through, writes are buffered."""
+
+    def __init__(self, graph: OntologyGraph) -> None:
+        self._graph = graph
+        self._writes: List[Tuple[str, Tuple[Any, ...]]] = []
+        self._added: Set[Tuple[str, str, str]] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._graph, name)
+
+    def add_entity(self, entity: Any) -> None:
+        self._writes.append(("add_entity", (entity,)))
+
+    def add_relation(self, src_id: str, relation: str, dst_id: str) -> bool:
+        edge = (src_id, relation, dst_id)
+        self._writes.append(("add_relation", edge))
+        if edge in self._added or self._graph.has_relation(*edge):
+            return False
+        self._added.add(edge)
+        return True
+
+    def add_relations(self, edges: Any) -> int:
+        return sum(self.add_relation(*edge) for edge in edges)
+
+    def remove_relation(self, src_id: str, relation: str, dst_id: str) -> bool:
+        self._writes.append(("remove_relation", (src_id, relation, dst_id)))
+        return self._graph.has_relation(src_id, relation, dst_id)
+
+    def apply(self) -> None:
+        for name, args in self._writes:
+            getattr(self._graph, name)(*args)
+        self._writes.clear()
@@ -1,19 +1,33 @@
 from __future__ import annotations
 
 import argparse
+import json
+from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from rich.console import Console
 from rich.table import Table
 
+from .agents.base import AgentMetrics
+from .agents.batch_ingest import discover_documents, ingest_batch, ingest_document
+from .agents.instrumentation import PROFILER_CPROFILE, PROFILERS, Instrumentation
 from .agents.orchestrator import Orchestrator
 from .config.settings import Settings
 from .ontology.graph import OntologyGraph
-from .reasoning.scoring import compute_argument_strength, compute_claim_confidence
-from .reasoning.trace import TraceLogger
+from .reasoning.batch import GraphScores, score_graph
+from .reasoning.trace import TRACE_FULL, TRACE_LEVELS, LazyTrace, TraceLogger
+from .reasoning.trace_stats import TraceStats, collect_trace_stats, subjects_with_uncertainty
 from .rules.rulebook import Rulebook
-from .storage.audit_log import AuditLog
-
+from .storage.audit_log import BufferedAuditLog
+from .storage.ingest_cache import IngestCache
+from .storage.json_graph_store import save_graph_jsonl
+from .storage.sqlite_index import SQLiteIndex
+from .storage.trace_store import SINK_JSON, TRACE_SINKS, open_trace_reader, open_trace_sink
+from .synthetic.cases import FORMAT_JSONL_GZ, GRAPH_FORMATS, CaseSpec, write_cases
+from .synthetic.graphs import SyntheticGraphSpec
+from .utils.ids import ID_MODES, ID_UUID
 
 console = Console()
 
@@ -24,54 +38,237 @@ def cmd_init() -> None:
     console.print("Initialized data/ and logs/ directories.")
 
 
-def cmd_ingest(path: str) -> None:
+def _audit_log(settings: Settings) -> BufferedAuditLog:
+    return BufferedAuditLog(
+        settings.logs_dir / "audit_log.jsonl", flush_interval=None, fsync=settings.audit_fsync
+    )
+
+
+def cmd_ingest(
+    path: str,
+    track_memory: bool = False,
+    profile_agent: Optional[str] = None,
+    profiler: str = PROFILER_CPROFILE,
+    use_cache: bool = True,
+) -> None:
+    settings = Settings()
+    settings.ensure_dirs()
+    audit = _audit_log(settings)
+    instrumentation = Instrumentation(
+        track_memory=track_memory,
+        profile_agent=profile_agent,
+        profiler=profiler,
+        profile_dir=settings.logs_dir / "profiles",
+        audit_log=audit,
+    )
+    orchestrator = Orchestrator(instrumentation=instrumentation)
+    cache = IngestCache(settings.cache_dir) if use_cache else None
+    with audit:
+        document = ingest_document(path, cache=cache, orchestrator=orchestrator)
+    if document.cached:
+        console.print(f"Loaded source {document.context.get('source_id')} from the ingest cache")
+        return
+    console.print(f"Ingested source {document.context.get('source_id')}")
+    _print_metrics(document.metrics)
+
+
+def _print_metrics(metrics: List[AgentMetrics]) -> None:
+    table = Table(title="Agent Metrics")
+    for column in ("Agent", "Wall (ms)", "CPU (ms)", "Entities", "Relations", "Peak memory"):
+        table.add_column(column)
+    for entry in metrics:
+        table.add_row(
+            entry.agent,
+            f"{entry.wall_time * 1000:.2f}",
+            f"{entry.cpu_time * 1000:.2f}" if entry.cpu_time is not None else "-",
+            str(entry.entities_created),
+            str(entry.relations_created),
+            f"{entry.peak_memory} B" if entry.peak_memory is not None else "-",
+        )
+    console.print(table)
+    for entry in metrics:
+        if entry.profile_path:
+            console.print(f"Profile for {entry.agent} written to {entry.profile_path}")
+
+
+def cmd_ingest_batch(
+    target: str, workers: Optional[int], output: Optional[str], use_cache: bool = True
+) -> None:
     settings = Settings()
     settings.ensure_dirs()
-    graph = OntologyGraph()
-    orchestrator = Orchestrator()
-    context = {"path": path}
-    orchestrator.run(graph, context)
-    console.print(f"Ingested source {context.get('source_id')}")
+    paths = discover_documents(target)
+    cache = IngestCache(settings.cache_dir) if use_cache else None
+    batch = ingest_batch(paths, workers=workers, cache=cache)
+    for path, error in batch.failures.items():
+        console.print(f"Failed to ingest {path}: {error}")
+    claim_count = len(batch.graph.entities.get("Claim", {}))
+    console.print(
+        f"Ingested {len(batch.documents)} of {len(paths)} documents "
+        f"({claim_count} claims, {len(batch.graph.relations)} relations)."
+    )
+    if output:
+        output_path = Path(output)
+        if output_path.suffix == ".db":
+            with SQLiteIndex(output_path) as store:
+                store.write_graph(batch.graph)
+        else:
+            save_graph_jsonl(batch.graph, output_path)
+        console.print(f"Graph saved to {output_path}")
+
+
+def cmd_generate_cases(args: argparse.Namespace) -> None:
+    settings = Settings()
+    settings.ensure_dirs()
+    spec = CaseSpec(
+        graph=SyntheticGraphSpec(
+            claims=args.claims,
+            evidence_per_claim=args.evidence_per_claim,
+            assumption_density=args.assumption_density,
+            assumption_chain=args.assumption_chain,
+            challenge_ratio=args.challenge_ratio,
+            seed=args.seed,
+        ),
+        paragraphs=args.paragraphs,
+        claim_density=args.claim_density,
+        graph_format=args.format,
+    )
+    output_dir = Path(args.output_dir) if args.output_dir else settings.data_dir / "synthetic_cases"
 
+    def report(directory: Path, manifest: Dict[str, Any]) -> None:
+        console.print(
+            f"Wrote {directory}: {manifest['entities']} entities, "
+            f"{manifest['relations']} relations, {manifest['document_bytes']} document bytes"
+        )
 
-def _print_claims(graph: OntologyGraph, rulebook: Rulebook, logger: TraceLogger) -> None:
+    write_cases(output_dir, spec, count=args.count, progress=report)
+
+
+def _print_claims(graph: OntologyGraph, scores: GraphScores) -> None:
     table = Table(title="Claim Confidence")
     table.add_column("Claim ID")
     table.add_column("Text")
     table.add_column("Confidence")
     for claim in graph.entities.get("Claim", {}).values():
-        confidence, trace = compute_claim_confidence(claim.id, graph, rulebook)
-        logger.add_trace(trace)
+        confidence = scores.claim_confidences[claim.id]
         table.add_row(claim.id, claim.text, f"{confidence:.2f}")
     console.print(table)
 
 
-def cmd_evaluate_argument(doc_id: str) -> None:
-    settings = Settings()
+def cmd_evaluate_argument(
+    doc_id: str, trace_level: str = TRACE_FULL, use_cache: bool = True, trace_sink: str = SINK_JSON
+) -> None:
+    settings = Settings(trace_level=trace_level, trace_sink=trace_sink)
     settings.ensure_dirs()
-    graph = OntologyGraph()
-    orchestrator = Orchestrator()
-    context = {"path": doc_id}
-    orchestrator.run(graph, context)
-
     rulebook = Rulebook.from_path(settings.config_dir / "rules.yaml")
-    logger = TraceLogger(settings.logs_dir / "reasoning_traces")
-    _print_claims(graph, rulebook, logger)
-
-    for argument in graph.entities.get("Argument", {}).values():
-        strength, trace = compute_argument_strength(argument.id, graph, rulebook)
-        logger.add_trace(trace)
-        console.print(f"Argument {argument.id} strength: {strength:.2f}")
-        break
-
-    exported = logger.export()
-    audit = AuditLog(settings.logs_dir / "audit_log.jsonl")
-    for path in exported:
-        audit.append({"event": "trace_export", "path": str(path)})
+    cache = IngestCache(settings.cache_dir) if use_cache else None
+    graph = ingest_document(doc_id, cache=cache).graph
+
+    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    trace_dir = settings.logs_dir / "reasoning_traces"
+    with open_trace_sink(settings.trace_sink, trace_dir, timestamp) as sink:
+        logger = TraceLogger(trace_dir, sink=sink)
+        first_argument = next(iter(graph.entities.get("Argument", {})), None)
+
+        def write_trace(trace: LazyTrace) -> None:
+            # Every claim trace, plus the trace of the argument reported below.
+            if trace.subject_id == first_argument or graph.get_claim(trace.subject_id) is not None:
+                logger.add_trace(trace)
+
+        scores = score_graph(graph, rulebook, settings.trace_level, on_trace=write_trace)
+        _print_claims(graph, scores)
+
+        if first_argument is not None:
+            strength = scores.argument_strengths[first_argument]
+            console.print(f"Argument {first_argument} strength: {strength:.2f}")
+
+        exported = logger.export()
+    with _audit_log(settings) as audit:
+        for path in exported:
+            audit.append({"event": "trace_export", "path": str(path)})
     if exported:
         console.print(f"Trace saved to {exported[0]}")
 
 
+def cmd_show_trace(store: str, subject_id: str) -> None:
+    reader = open_trace_reader(Path(store))
+    try:
+        trace = reader.get(subject_id)
+    finally:
+        reader.close()
+    if trace is None:
+        console.print(f"No trace for {subject_id} in {store}")
+        return
+    table = Table(title=f"Trace for {subject_id}")
+    for column in ("Rule", "Description", "Delta", "Score"):
+        table.add_column(column)
+    for step in trace.steps:
+        score = f"{step.resulting_score:.2f}" if step.resulting_score is not None else "-"
+        table.add_row(step.rule_id, step.description, f"{step.delta:+.2f}", score)
+    console.print(table)
+    for marker in trace.uncertainty_markers:
+        console.print(f"Uncertainty: {marker.note}")
+
+
+def cmd_trace_stats(args: argparse.Namespace) -> None:
+    paths = [Path(store) for store in args.stores]
+    if args.subjects_with:
+        for subject_id in subjects_with_uncertainty(paths, args.subjects_with):
+            console.print(subject_id)
+        return
+    stats = collect_trace_stats(paths, delta_bins=args.delta_bins, score_bins=args.score_bins)
+    console.print(f"{stats.traces} traces, {stats.steps} steps, {len(stats.rules)} rules")
+    _print_trace_stats(stats, args.top)
+    if args.output:
+        payload = asdict(stats)
+        payload["uncertainties"] = [
+            {"note": note, "severity": severity, "count": count}
+            for (note, severity), count in stats.uncertainties.items()
+        ]
+        Path(args.output).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        console.print(f"Statistics saved to {args.output}")
+
+
+def _print_trace_stats(stats: TraceStats, top: int) -> None:
+    rules = Table(title="Rules by total |delta|")
+    for column in ("Rule", "Steps", "Mean", "Total |delta|", "Min", "Max", "Histogram"):
+        rules.add_column(column)
+    for rule in stats.top_rules(top):
+        rules.add_row(
+            rule.rule_id,
+            str(rule.count),
+            f"{rule.mean:+.3f}",
+            f"{rule.abs_total:.2f}",
+            f"{rule.minimum:+.2f}",
+            f"{rule.maximum:+.2f}",
+            _sparkline(rule.histogram),
+        )
+    console.print(rules)
+
+    uncertainties = Table(title="Uncertainty markers")
+    for column in ("Note", "Severity", "Count"):
+        uncertainties.add_column(column)
+    ordered = sorted(stats.uncertainties.items(), key=lambda item: (-item[1], item[0][0]))
+    for (note, severity), count in ordered:
+        uncertainties.add_row(note, f"{severity:.2f}" if severity is not None else "-", str(count))
+    console.print(uncertainties)
+
+    scores = Table(title="Final scores")
+    scores.add_column("Range")
+    scores.add_column("Traces")
+    edges = stats.bin_edges(scores=True)
+    for index, count in enumerate(stats.score_histogram):
+        scores.add_row(f"{edges[index]:.2f}-{edges[index + 1]:.2f}", str(count))
+    console.print(scores)
+
+
+def _sparkline(histogram: List[int]) -> str:
+    blocks = " ▁▂▃▄▅▆▇█"
+    peak = max(histogram, default=0)
+    if peak == 0:
+        return ""
+    return "".join(blocks[(count * (len(blocks) - 1) + peak - 1) // peak] for count in histogram)
+
+
 def cmd_evaluate_ethics(scenario_file: str) -> None:
     settings = Settings()
     settings.ensure_dirs()
@@ -81,15 +278,73 @@ def cmd_evaluate_ethics(scenario_file: str) -> None:
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="logos-engine")
+    parser.add_argument("--id-mode", choices=ID_MODES, default=ID_UUID, help="Id generator")
+    parser.add_argument("--id-seed", type=int, default=None, help="Seed for --id-mode seeded")
+    parser.add_argument(
+        "--intern-ids", action="store_true", help="Intern graph ids to save memory"
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     subparsers.add_parser("init")
 
     ingest_parser = subparsers.add_parser("ingest")
     ingest_parser.add_argument("path")
+    ingest_parser.add_argument(
+        "--track-memory", action="store_true", help="Record each agent's peak memory"
+    )
+    ingest_parser.add_argument("--profile-agent", default=None, help="Agent name to profile")
+    ingest_parser.add_argument("--profiler", choices=PROFILERS, default=PROFILER_CPROFILE)
+    ingest_parser.add_argument("--no-cache", action="store_true", help="Ignore the ingest cache")
+
+    batch_parser = subparsers.add_parser("ingest-batch")
+    batch_parser.add_argument("target", help="Directory or glob pattern of documents")
+    batch_parser.add_argument("--workers", type=int, default=None)
+    batch_parser.add_argument(
+        "--output", default=None, help="Write the merged graph (.db for SQLite, else JSONL)"
+    )
+    batch_parser.add_argument("--no-cache", action="store_true", help="Ignore the ingest cache")
+
+    cases_parser = subparsers.add_parser("generate-cases")
+    cases_parser.add_argument("--count", type=int, default=1)
+    cases_parser.add_argument("--claims", type=int, default=1000)
+    cases_parser.add_argument("--evidence-per-claim", type=int, default=3)
+    cases_parser.add_argument("--assumption-density", type=float, default=0.5)
+    cases_parser.add_argument("--assumption-chain", type=int, default=1)
+    cases_parser.add_argument(
+        "--challenge-ratio", type=float, default=0.25, help="Share of challenging evidence"
+    )
+    cases_parser.add_argument("--paragraphs", type=int, default=100)
+    cases_parser.add_argument(
+        "--claim-density", type=float, default=0.5, help="Share of claim-like sentences"
+    )
+    cases_parser.add_argument("--format", choices=GRAPH_FORMATS, default=FORMAT_JSONL_GZ)
+    cases_parser.add_argument("--seed", type=int, default=0)
+    cases_parser.add_argument("--output-dir", default=None)
 
     eval_parser = subparsers.add_parser("evaluate-argument")
     eval_parser.add_argument("doc_id")
+    eval_parser.add_argument("--trace-level", choices=TRACE_LEVELS, default=TRACE_FULL)
+    eval_parser.add_argument("--no-cache", action="store_true", help="Ignore the ingest cache")
+    eval_parser.add_argument(
+        "--trace-sink", choices=TRACE_SINKS, default=SINK_JSON, help="Where traces are exported"
+    )
+
+    show_parser = subparsers.add_parser("show-trace")
+    show_parser.add_argument("store", help="Trace store (.jsonl, .jsonl.gz or .db)")
+    show_parser.add_argument("subject_id")
+
+    stats_parser = subparsers.add_parser("trace-stats")
+    stats_parser.add_argument(
+        "stores", nargs="+", help="Trace stores (.jsonl, .jsonl.gz, .db) or JSON trace directories"
+    )
+    stats_parser.add_argument("--top", type=int, default=20, help="Rules to show")
+    stats_parser.add_argument("--delta-bins", type=int, default=20)
+    stats_parser.add_argument("--score-bins", type=int, default=10)
+    stats_parser.add_argument("--output", default=None, help="Write all statistics as JSON")
+    stats_parser.add_argument(
+        "--subjects-with", default=None, metavar="NOTE",
+        help="Only list subjects with an uncertainty note containing NOTE",
+    )
 
     ethics_parser = subparsers.add_parser("evaluate-ethics")
     ethics_parser.add_argument("scenario_file")
@@ -100,13 +355,28 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+    Settings(
+        id_mode=args.id_mode, id_seed=args.id_seed, intern_ids=args.intern_ids
+    ).configure_ids()
 
     if args.command == "init":
         cmd_init()
     elif args.command == "ingest":
-        cmd_ingest(args.path)
+        cmd_ingest(
+            args.path, args.track_memory, args.profile_agent, args.profiler, not args.no_cache
+        )
+    elif args.command == "generate-cases":
+        cmd_generate_cases(args)
+    elif args.command == "ingest-batch":
+        cmd_ingest_batch(args.target, args.workers, args.output, not args.no_cache)
     elif args.command == "evaluate-argument":
-        cmd_evaluate_argument(args.doc_id)
+        cmd_evaluate_argument(
+            args.doc_id, args.trace_level, not args.no_cache, args.trace_sink
+        )
+    elif args.command == "show-trace":
+        cmd_show_trace(args.store, args.subject_id)
+    elif args.command == "trace-stats":
+        cmd_trace_stats(args)
     elif args.command == "evaluate-ethics":
         cmd_evaluate_ethics(args.scenario_file)
 
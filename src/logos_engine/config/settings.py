@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+
+from ..utils.ids import ID_UUID, configure_ids
 
 
 @dataclass(frozen=True)
@@ -11,9 +14,24 @@ class Settings:
     data_dir: Path = Path("data")
     logs_dir: Path = Path("logs")
     config_dir: Path = Path("config")
+    cache_dir: Path = Path("data/cache")
+    trace_level: str = "full"
+    # Trace store: "json" (a file per trace), "jsonl", "jsonl.gz" or "sqlite".
+    trace_sink: str = "json"
+    # Audit log fsync policy: "flush", "rotate" or "never" (see storage.audit_log).
+    audit_fsync: str = "rotate"
+    # Trace/step id generation: "uuid", "counter" or "seeded" (see utils.ids).
+    id_mode: str = ID_UUID
+    id_seed: Optional[int] = None
+    intern_ids: bool = False
+
+    def configure_ids(self) -> None:
+        """Apply the id settings to this process."""
+        configure_ids(self.id_mode, self.id_seed, self.intern_ids)
 
     def ensure_dirs(self) -> None:
         """Create expected local directories if they do not exist."""
         (self.data_dir / "documents").mkdir(parents=True, exist_ok=True)
         (self.data_dir / "synthetic_cases").mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         (self.logs_dir / "reasoning_traces").mkdir(parents=True, exist_ok=True)
@@ -2,52 +2,222 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
+from ..utils.ids import intern_id, new_id
+from ..utils.text import TokenCache
 from .models import MODEL_REGISTRY, Argument, Assumption, Claim, Evidence, Source
 
 Entity = Union[Source, Claim, Evidence, Assumption, Argument]
+Edge = Tuple[str, str, str]
+# Insertion-ordered edge sets: dict keys give O(1) membership, add and removal.
+EdgeSet = Dict[Edge, None]
+
+_EMPTY: EdgeSet = {}
+
+
+@dataclass
+class GraphChanges:
+    """Entity ids and edges added, replaced or removed since changes were last taken."""
+
+    entities: Set[str] = field(default_factory=set)
+    edges: Set[Edge] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.entities or self.edges)
 
 
 @dataclass
 class OntologyGraph:
     entities: Dict[str, Dict[str, Entity]] = field(default_factory=lambda: defaultdict(dict))
-    relations: List[Tuple[str, str, str]] = field(default_factory=list)
+    _index: Dict[str, Entity] = field(default_factory=dict, init=False, repr=False)
+    _types: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    token_cache: TokenCache = field(
+        default_factory=TokenCache, init=False, repr=False, compare=False
+    )
+    _edges: EdgeSet = field(default_factory=dict, init=False, repr=False)
+    _by_src: Dict[str, EdgeSet] = field(default_factory=dict, init=False, repr=False)
+    _by_dst: Dict[str, EdgeSet] = field(default_factory=dict, init=False, repr=False)
+    _by_relation: Dict[str, EdgeSet] = field(default_factory=dict, init=False, repr=False)
+    _by_dst_relation: Dict[Tuple[str, str], EdgeSet] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # None until `start_tracking()`; most graphs never need change sets.
+    _changes: Optional[GraphChanges] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __init__(
+        self,
+        entities: Optional[Dict[str, Dict[str, Entity]]] = None,
+        relations: Optional[Iterable[Iterable[str]]] = None,
+    ) -> None:
+        """Build a graph, indexing any given entities and relations.
+
+        `relations` is accepted here for construction only; afterwards it is the
+        read-only `relations` property, and edges are added with `add_relation`.
+        """
+        self.entities = defaultdict(dict)
+        self._index = {}
+        self._types = {}
+        self.token_cache = TokenCache()
+        self._edges = {}
+        self._by_src = {}
+        self._by_dst = {}
+        self._by_relation = {}
+        self._by_dst_relation = {}
+        self._changes = None
+        for bucket in (entities or {}).values():
+            for entity in bucket.values():
+                self.add_entity(entity)
+        if relations is not None:
+            self.add_relations(relations)
 
     def add_entity(self, entity: Entity) -> None:
+        entity_id = intern_id(entity.id)
         entity_type = type(entity).__name__
-        self.entities[entity_type][entity.id] = entity
+        previous_type = self._types.get(entity_id)
+        if previous_type is not None and previous_type != entity_type:
+            self.entities[previous_type].pop(entity_id, None)
+        self.entities[entity_type][entity_id] = entity
+        self._index[entity_id] = entity
+        self._types[entity_id] = entity_type
+        self.token_cache.invalidate(entity_id)
+        if self._changes is not None:
+            self._changes.entities.add(entity_id)
 
     def get_entity(self, entity_id: str) -> Optional[Entity]:
-        for entities in self.entities.values():
-            if entity_id in entities:
-                return entities[entity_id]
-        return None
+        return self._index.get(entity_id)
+
+    def get_entity_type(self, entity_id: str) -> Optional[str]:
+        return self._types.get(entity_id)
+
+    def has_entity(self, entity_id: str) -> bool:
+        return entity_id in self._index
+
+    def get_source(self, entity_id: str) -> Optional[Source]:
+        return self._get_typed(entity_id, "Source")  # type: ignore[return-value]
+
+    def get_claim(self, entity_id: str) -> Optional[Claim]:
+        return self._get_typed(entity_id, "Claim")  # type: ignore[return-value]
+
+    def get_evidence(self, entity_id: str) -> Optional[Evidence]:
+        return self._get_typed(entity_id, "Evidence")  # type: ignore[return-value]
+
+    def get_assumption(self, entity_id: str) -> Optional[Assumption]:
+        return self._get_typed(entity_id, "Assumption")  # type: ignore[return-value]
+
+    def get_argument(self, entity_id: str) -> Optional[Argument]:
+        return self._get_typed(entity_id, "Argument")  # type: ignore[return-value]
+
+    def _get_typed(self, entity_id: str, entity_type: str) -> Optional[Entity]:
+        if self._types.get(entity_id) != entity_type:
+            return None
+        return self._index[entity_id]
+
+    @property
+    def relations(self) -> List[Edge]:
+        """A copy of the edges in insertion order; edit them with `add_relation`."""
+        return list(self._edges)
+
+    def add_relation(self, src_id: str, relation: str, dst_id: str) -> bool:
+        """Add an edge, returning False if the identical edge is already present."""
+        edge = (src_id, relation, dst_id)
+        if edge in self._edges:
+            return False
+        src_id, relation, dst_id = intern_id(src_id), intern_id(relation), intern_id(dst_id)
+        edge = (src_id, relation, dst_id)
+        self._edges[edge] = None
+        self._by_src.setdefault(src_id, {})[edge] = None
+        self._by_dst.setdefault(dst_id, {})[edge] = None
+        self._by_relation.setdefault(relation, {})[edge] = None
+        self._by_dst_relation.setdefault((dst_id, relation), {})[edge] = None
+        if self._changes is not None:
+            self._changes.edges.add(edge)
+        return True
 
-    def add_relation(self, src_id: str, relation: str, dst_id: str) -> None:
-        self.relations.append((src_id, relation, dst_id))
+    def add_relations(self, edges: Iterable[Iterable[str]]) -> int:
+        added = 0
+        for src_id, relation, dst_id in edges:
+            added += self.add_relation(src_id, relation, dst_id)
+        return added
+
+    def remove_relation(self, src_id: str, relation: str, dst_id: str) -> bool:
+        """Remove an edge, returning False if it was not present."""
+        edge = (src_id, relation, dst_id)
+        if edge not in self._edges:
+            return False
+        del self._edges[edge]
+        _discard(self._by_src, src_id, edge)
+        _discard(self._by_dst, dst_id, edge)
+        _discard(self._by_relation, relation, edge)
+        _discard(self._by_dst_relation, (dst_id, relation), edge)
+        if self._changes is not None:
+            self._changes.edges.add(edge)
+        return True
+
+    def has_relation(self, src_id: str, relation: str, dst_id: str) -> bool:
+        return (src_id, relation, dst_id) in self._edges
 
     def get_relations(
         self,
         src_id: Optional[str] = None,
         relation: Optional[str] = None,
         dst_id: Optional[str] = None,
-    ) -> List[Tuple[str, str, str]]:
-        results = []
-        for edge in self.relations:
-            if src_id is not None and edge[0] != src_id:
-                continue
-            if relation is not None and edge[1] != relation:
-                continue
-            if dst_id is not None and edge[2] != dst_id:
-                continue
-            results.append(edge)
-        return results
+    ) -> List[Edge]:
+        if src_id is not None and relation is not None and dst_id is not None:
+            edge = (src_id, relation, dst_id)
+            return [edge] if edge in self._edges else []
+        if dst_id is not None and relation is not None:
+            candidates = self._by_dst_relation.get((dst_id, relation), _EMPTY)
+        elif src_id is not None and dst_id is not None:
+            by_src = self._by_src.get(src_id, _EMPTY)
+            by_dst = self._by_dst.get(dst_id, _EMPTY)
+            candidates = by_src if len(by_src) <= len(by_dst) else by_dst
+        elif src_id is not None:
+            candidates = self._by_src.get(src_id, _EMPTY)
+        elif dst_id is not None:
+            candidates = self._by_dst.get(dst_id, _EMPTY)
+        elif relation is not None:
+            candidates = self._by_relation.get(relation, _EMPTY)
+        else:
+            candidates = self._edges
+        return [
+            edge
+            for edge in candidates
+            if (src_id is None or edge[0] == src_id)
+            and (relation is None or edge[1] == relation)
+            and (dst_id is None or edge[2] == dst_id)
+        ]
+
+    @property
+    def tracking_changes(self) -> bool:
+        return self._changes is not None
+
+    def start_tracking(self) -> None:
+        """Record changed entity ids and edges from now on (see `take_changes`)."""
+        if self._changes is None:
+            self._changes = GraphChanges()
+
+    @property
+    def pending_changes(self) -> GraphChanges:
+        return self._changes if self._changes is not None else GraphChanges()
+
+    def take_changes(self) -> GraphChanges:
+        """Return the changes recorded so far and start a new, empty change set.
+
+        Nothing is recorded until `start_tracking()` is called. Changes are consumed,
+        so a graph should feed a single incremental consumer.
+        """
+        if self._changes is None:
+            return GraphChanges()
+        changes, self._changes = self._changes, GraphChanges()
+        return changes
 
     def validate(self) -> List[str]:
         errors: List[str] = []
-        known_ids = {entity.id for bucket in self.entities.values() for entity in bucket.values()}
-        for src_id, _, dst_id in self.relations:
+        known_ids = self._index
+        for src_id, _, dst_id in self._edges:
             if src_id not in known_ids:
                 errors.append(f"Missing src id {src_id}")
             if dst_id not in known_ids:
@@ -66,6 +236,47 @@ class OntologyGraph:
             for entity_type, bucket in self.entities.items()
         }
 
+    def merge(self, other: "OntologyGraph") -> Dict[str, str]:
+        """Add another graph's entities and relations to this one.
+
+        Entities whose id is already taken by an identical entity are shared. Entities
+        whose id collides with a different entity get a fresh id, and every reference
+        to them (relations, source/claim/evidence/assumption ids) is rewritten.
+        Entities are compared after their references are rewritten, so a claim that
+        points at a renamed source is itself renamed instead of overwriting the claim
+        already here. Returns the mapping of renamed ids.
+        """
+        renamed: Dict[str, str] = {}
+        incoming = [entity for bucket in other.entities.values() for entity in bucket.values()]
+        # Each rename can make another entity differ from the one it collides with,
+        # so repeat until no new collisions appear.
+        changed = True
+        while changed:
+            changed = False
+            for entity in incoming:
+                if entity.id in renamed:
+                    continue
+                existing = self._index.get(entity.id)
+                if existing is not None and existing != _rename_references(entity, renamed):
+                    renamed[entity.id] = self._fresh_id(entity.id, other, renamed)
+                    changed = True
+        for entity in incoming:
+            self.add_entity(_rename_references(entity, renamed))
+        for src_id, relation, dst_id in other.get_relations():
+            self.add_relation(
+                renamed.get(src_id, src_id), relation, renamed.get(dst_id, dst_id)
+            )
+        return renamed
+
+    def _fresh_id(self, entity_id: str, other: "OntologyGraph", renamed: Dict[str, str]) -> str:
+        """A new id with `entity_id`'s prefix, unused in either graph and by earlier renames."""
+        prefix = entity_id.rsplit("_", 1)[0] or "entity"
+        taken = set(renamed.values())
+        while True:
+            candidate = new_id(prefix)
+            if not (candidate in self._index or candidate in other._index or candidate in taken):
+                return candidate
+
     @classmethod
     def from_dict(cls, payload: Dict[str, Iterable[Dict[str, object]]]) -> "OntologyGraph":
         graph = cls()
@@ -76,3 +287,31 @@ class OntologyGraph:
             for item in entities:
                 graph.add_entity(model.model_validate(item))
         return graph
+
+
+_REFERENCE_FIELDS = ("id", "source_id", "claim_id")
+_REFERENCE_LIST_FIELDS = ("evidence_ids", "assumption_ids")
+
+
+def _rename_references(entity: Entity, renamed: Dict[str, str]) -> Entity:
+    if not renamed:
+        return entity
+    update: Dict[str, object] = {}
+    for name in _REFERENCE_FIELDS:
+        value = getattr(entity, name, None)
+        if value in renamed:
+            update[name] = renamed[value]
+    for name in _REFERENCE_LIST_FIELDS:
+        values = getattr(entity, name, None)
+        if values and any(value in renamed for value in values):
+            update[name] = [renamed.get(value, value) for value in values]
+    return entity.model_copy(update=update) if update else entity
+
+
+def _discard(index: Dict, key: object, edge: Edge) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.pop(edge, None)
+    if not bucket:
+        del index[key]
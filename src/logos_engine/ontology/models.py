@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type
 
 from pydantic import BaseModel, Field, confloat
 
@@ -115,7 +115,7 @@ class UncertaintyMarker(BaseModel):
     severity: Optional[Score] = None
 
 
-MODEL_REGISTRY = {
+MODEL_REGISTRY: Dict[str, Type[BaseModel]] = {
     "Source": Source,
     "Claim": Claim,
     "Evidence": Evidence,
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..ontology.graph import OntologyGraph
+from ..ontology.models import Argument, Claim
+from ..rules import builtin_rules
+from ..rules.rulebook import RulebookLike
+from .scoring import ScoreResult, _score_argument, _score_claim
+from .trace import (
+    TRACE_FULL,
+    TRACE_OFF,
+    LazyTrace,
+    StepRecord,
+    UncertaintyRecord,
+    check_trace_level,
+)
+
+
+@dataclass
+class GraphScores:
+    claim_confidences: Dict[str, float] = field(default_factory=dict)
+    argument_strengths: Dict[str, float] = field(default_factory=dict)
+    # Empty when scoring with trace level "off" or with an `on_trace` callback.
+    traces: Dict[str, LazyTrace] = field(default_factory=dict)
+
+
+def score_graph(
+    graph: OntologyGraph,
+    rulebook: RulebookLike,
+    trace_level: str = TRACE_FULL,
+    on_trace: Optional[Callable[[LazyTrace], None]] = None,
+) -> GraphScores:
+    """Score every claim and argument in one pass.
+
+    Evidence reliability is computed once per evidence item and relevance once per
+    evidence-claim pair; arguments reuse the confidence of their claim and are scored
+    right after it. Results match `compute_claim_confidence` and
+    `compute_argument_strength`. With `on_trace`, each trace is passed to it as soon
+    as it is built instead of being kept in `traces`.
+    """
+    check_trace_level(trace_level)
+    compiled = rulebook.compile()
+    record = trace_level != TRACE_OFF
+    scores = GraphScores()
+    emit = on_trace if on_trace is not None else _keep_trace(scores.traces)
+    reliability_cache: Dict[str, ScoreResult] = {}
+    relevance_cache: Dict[Tuple[str, str], ScoreResult] = {}
+    coherence_cache: Dict[str, float] = {}
+    arguments_by_claim: Dict[str, List[Argument]] = {}
+    for argument in graph.entities.get("Argument", {}).values():
+        if isinstance(argument, Argument):
+            arguments_by_claim.setdefault(argument.claim_id, []).append(argument)
+
+    for claim in graph.entities.get("Claim", {}).values():
+        if not isinstance(claim, Claim):
+            continue
+        confidence, steps, uncertainties = _score_claim(
+            claim, graph, compiled, trace_level, reliability_cache, relevance_cache
+        )
+        scores.claim_confidences[claim.id] = confidence
+        if record:
+            emit(LazyTrace(claim.id, steps, uncertainties))
+        for argument in arguments_by_claim.get(claim.id, ()):
+            strength = _score_argument(argument, confidence, graph, compiled, coherence_cache)
+            scores.argument_strengths[argument.id] = strength
+            if record:
+                emit(_argument_trace(argument.id, strength, steps, uncertainties))
+    return scores
+
+
+def _keep_trace(traces: Dict[str, LazyTrace]) -> Callable[[LazyTrace], None]:
+    def keep(trace: LazyTrace) -> None:
+        traces[trace.subject_id] = trace
+
+    return keep
+
+
+def _argument_trace(
+    argument_id: str,
+    strength: float,
+    claim_steps: List[StepRecord],
+    claim_uncertainties: List[UncertaintyRecord],
+) -> LazyTrace:
+    step = StepRecord(
+        builtin_rules.ARGUMENT_STRENGTH, "Computed argument strength", strength, strength
+    )
+    return LazyTrace(argument_id, claim_steps + [step], list(claim_uncertainties))
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Set, Tuple
+
+from ..ontology.graph import OntologyGraph
+from ..ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
+from ..rules.rulebook import CompiledRulebook, RulebookLike
+from .scoring import (
+    ScoreResult,
+    _accumulate_claim,
+    _confidence_from_totals,
+    _score_argument,
+)
+from .trace import TRACE_OFF
+
+_CLAIM_INPUTS = (SUPPORTS, CHALLENGES, UNDERLIES)
+
+
+@dataclass
+class IncrementalScorer:
+    """Keeps claim confidences and argument strengths current as a graph changes.
+
+    `refresh()` consumes the graph's recorded changes and rescores only the claims
+    whose evidence or assumptions changed, plus the arguments built on them. Scores
+    match `compute_claim_confidence` and `compute_argument_strength`; use those for
+    traces. The scorer turns on the graph's change tracking and must be its only
+    consumer of `take_changes()`.
+    """
+
+    graph: OntologyGraph
+    rulebook: RulebookLike
+    claim_confidences: Dict[str, float] = field(default_factory=dict, init=False)
+    argument_strengths: Dict[str, float] = field(default_factory=dict, init=False)
+    _compiled: CompiledRulebook = field(init=False, repr=False)
+    _reliability_cache: Dict[str, ScoreResult] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _coherence_cache: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _argument_refs: Dict[str, Tuple[str, Tuple[str, ...]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _arguments_by_claim: Dict[str, Set[str]] = field(default_factory=dict, init=False, repr=False)
+    _arguments_by_evidence: Dict[str, Set[str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self._compiled = self.rulebook.compile()
+        self.graph.start_tracking()
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Discard cached state and score the whole graph."""
+        self.graph.take_changes()
+        self.claim_confidences.clear()
+        self.argument_strengths.clear()
+        self._reliability_cache.clear()
+        self._coherence_cache.clear()
+        self._argument_refs.clear()
+        self._arguments_by_claim.clear()
+        self._arguments_by_evidence.clear()
+        for argument_id in self.graph.entities.get("Argument", {}):
+            self._index_argument(argument_id)
+        for claim_id in self.graph.entities.get("Claim", {}):
+            self._score_claim(claim_id)
+        for argument_id in self.graph.entities.get("Argument", {}):
+            self._score_argument(argument_id)
+
+    def refresh(self) -> Set[str]:
+        """Apply pending graph changes; returns the ids of the rescored claims and arguments."""
+        changes = self.graph.take_changes()
+        if not changes:
+            return set()
+        dirty_claims: Set[str] = set()
+        dirty_arguments: Set[str] = set()
+
+        for entity_id in changes.entities:
+            self._reliability_cache.pop(entity_id, None)
+            self._coherence_cache.pop(entity_id, None)
+            dirty_claims.add(entity_id)
+            for _, relation, dst_id in self.graph.get_relations(src_id=entity_id):
+                if relation in _CLAIM_INPUTS:
+                    dirty_claims.add(dst_id)
+            dirty_arguments.update(self._arguments_by_evidence.get(entity_id, ()))
+            if entity_id in self._argument_refs:
+                self._unindex_argument(entity_id)
+                dirty_arguments.add(entity_id)
+            if self.graph.get_entity_type(entity_id) == "Argument":
+                self._index_argument(entity_id)
+                dirty_arguments.add(entity_id)
+        for _, relation, dst_id in changes.edges:
+            if relation in _CLAIM_INPUTS:
+                dirty_claims.add(dst_id)
+
+        rescored: Set[str] = set()
+        for claim_id in dirty_claims:
+            if self._score_claim(claim_id):
+                rescored.add(claim_id)
+            dirty_arguments.update(self._arguments_by_claim.get(claim_id, ()))
+        for argument_id in dirty_arguments:
+            if self._score_argument(argument_id):
+                rescored.add(argument_id)
+        return rescored
+
+    def _score_claim(self, claim_id: str) -> bool:
+        claim = self.graph.get_claim(claim_id)
+        if claim is None:
+            self.claim_confidences.pop(claim_id, None)
+            return False
+        totals = _accumulate_claim(
+            claim, self.graph, self._compiled, TRACE_OFF, [], [], self._reliability_cache
+        )
+        self.claim_confidences[claim_id] = _confidence_from_totals(totals, self._compiled)
+        return True
+
+    def _score_argument(self, argument_id: str) -> bool:
+        argument = self.graph.get_argument(argument_id)
+        if argument is None or argument.claim_id not in self.claim_confidences:
+            self.argument_strengths.pop(argument_id, None)
+            return False
+        self.argument_strengths[argument_id] = _score_argument(
+            argument,
+            self.claim_confidences[argument.claim_id],
+            self.graph,
+            self._compiled,
+            self._coherence_cache,
+        )
+        return True
+
+    def _index_argument(self, argument_id: str) -> None:
+        argument = self.graph.get_argument(argument_id)
+        if argument is None:
+            return
+        evidence_ids = tuple(argument.evidence_ids)
+        self._argument_refs[argument_id] = (argument.claim_id, evidence_ids)
+        self._arguments_by_claim.setdefault(argument.claim_id, set()).add(argument_id)
+        for evidence_id in evidence_ids:
+            self._arguments_by_evidence.setdefault(evidence_id, set()).add(argument_id)
+
+    def _unindex_argument(self, argument_id: str) -> None:
+        claim_id, evidence_ids = self._argument_refs.pop(argument_id)
+        self._arguments_by_claim.get(claim_id, set()).discard(argument_id)
+        for evidence_id in evidence_ids:
+            self._arguments_by_evidence.get(evidence_id, set()).discard(argument_id)
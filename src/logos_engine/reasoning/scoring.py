@@ -1,72 +1,83 @@
 from __future__ import annotations
 
 import math
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 from ..ontology.graph import OntologyGraph
-from ..ontology.models import (
-    Argument,
-    Assumption,
-    Claim,
-    Evidence,
-    ExplanationTrace,
-    ReasoningStep,
-    UncertaintyMarker,
-)
+from ..ontology.models import Argument, Claim, Evidence
 from ..ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
 from ..rules import builtin_rules
-from ..rules.rulebook import Rulebook
+from ..rules.rulebook import CompiledRulebook, RulebookLike
 from ..utils.clamp import clamp
-from .trace import make_step, make_trace, make_uncertainty
+from ..utils.text import TokenCache, tokenize
+from .trace import (
+    TRACE_FULL,
+    TRACE_OFF,
+    LazyTrace,
+    StepRecord,
+    UncertaintyRecord,
+    check_trace_level,
+)
+
+ScoreResult = Tuple[float, List[StepRecord], List[UncertaintyRecord]]
+
+# Trace levels: "off" records nothing, "summary" records claim/argument level steps and
+# uncertainty markers, "full" also records the per-evidence reliability and relevance steps.
 
 
 def score_evidence_reliability(
-    evidence: Evidence, rulebook: Rulebook
-) -> Tuple[float, List[ReasoningStep], List[UncertaintyMarker]]:
-    steps: List[ReasoningStep] = []
-    uncertainties: List[UncertaintyMarker] = []
-    baseline = rulebook.get_reliability_baseline(evidence.evidence_type)
-    steps.append(
-        make_step(
-            builtin_rules.RELIABILITY_BASELINE,
-            f"Reliability baseline for {evidence.evidence_type}",
-            baseline,
-            baseline,
+    evidence: Evidence, rulebook: RulebookLike, trace_level: str = TRACE_FULL
+) -> ScoreResult:
+    compiled = rulebook.compile()
+    steps: List[StepRecord] = []
+    uncertainties: List[UncertaintyRecord] = []
+    baseline = compiled.reliability_baseline(evidence.evidence_type)
+    if trace_level == TRACE_FULL:
+        steps.append(
+            StepRecord(
+                builtin_rules.RELIABILITY_BASELINE,
+                f"Reliability baseline for {evidence.evidence_type}",
+                baseline,
+                baseline,
+            )
         )
-    )
-    if evidence.evidence_type not in rulebook.evidence_reliability_baselines:
+    if trace_level != TRACE_OFF and evidence.evidence_type not in compiled.reliability_baselines:
         uncertainties.append(
-            make_uncertainty(evidence.id, f"Unknown evidence type {evidence.evidence_type}.", 0.3)
+            UncertaintyRecord(
+                evidence.id, f"Unknown evidence type {evidence.evidence_type}.", 0.3
+            )
         )
     return clamp(baseline), steps, uncertainties
 
 
 def score_evidence_relevance(
-    evidence: Evidence, claim: Claim, rulebook: Rulebook
-) -> Tuple[float, List[ReasoningStep], List[UncertaintyMarker]]:
-    steps: List[ReasoningStep] = []
-    uncertainties: List[UncertaintyMarker] = []
-    constants = rulebook.get_constants()
-    score = constants.get("relevance_baseline", 0.5)
-    steps.append(
-        make_step(
-            builtin_rules.RELEVANCE_BASELINE,
-            "Relevance baseline",
-            score,
-            score,
+    evidence: Evidence,
+    claim: Claim,
+    rulebook: RulebookLike,
+    token_cache: Optional[TokenCache] = None,
+    trace_level: str = TRACE_FULL,
+) -> ScoreResult:
+    compiled = rulebook.compile()
+    steps: List[StepRecord] = []
+    uncertainties: List[UncertaintyRecord] = []
+    record = trace_level == TRACE_FULL
+    score = compiled.relevance_baseline
+    if record:
+        steps.append(
+            StepRecord(builtin_rules.RELEVANCE_BASELINE, "Relevance baseline", score, score)
         )
-    )
-    claim_tokens = set(claim.text.lower().split())
-    evidence_tokens = set(evidence.text.lower().split())
-    for rule in rulebook.get_relevance_rules():
-        rule_id = rule.get("id", "unknown")
-        adjustment = float(rule.get("adjustment", 0.0))
-        if rule_id == "rel.match.title" and claim_tokens.intersection(evidence_tokens):
-            score += adjustment
-            steps.append(make_step(rule_id, rule.get("description", "match"), adjustment, score))
-        elif rule_id == "rel.scope.mismatch" and not claim_tokens.intersection(evidence_tokens):
-            score += adjustment
-            steps.append(make_step(rule_id, rule.get("description", "mismatch"), adjustment, score))
+    if token_cache is None:
+        claim_tokens = tokenize(claim.text)
+        evidence_tokens = tokenize(evidence.text)
+    else:
+        claim_tokens = token_cache.tokens(claim.id, claim.text)
+        evidence_tokens = token_cache.tokens(evidence.id, evidence.text)
+    overlap = not claim_tokens.isdisjoint(evidence_tokens)
+    for rule in compiled.matched_relevance_rules[overlap]:
+        score += rule.adjustment
+        if record:
+            steps.append(StepRecord(rule.rule_id, rule.description, rule.adjustment, score))
     return clamp(score), steps, uncertainties
 
 
@@ -74,94 +85,201 @@ def _net_confidence(support: float, challenge: float, k: float) -> float:
     return (support - challenge) / (support + challenge + k)
 
 
-def compute_claim_confidence(
-    claim_id: str, graph: OntologyGraph, rulebook: Rulebook
-) -> Tuple[float, ExplanationTrace]:
-    claim_entity = graph.get_entity(claim_id)
-    if not isinstance(claim_entity, Claim):
-        raise ValueError(f"Claim {claim_id} not found")
-    constants = rulebook.get_constants()
-    k = constants.get("k", 0.5)
-    steps: List[ReasoningStep] = []
-    uncertainties: List[UncertaintyMarker] = []
-
-    support = 0.0
-    challenge = 0.0
-    evidence_count = 0
-    for src_id, relation, dst_id in graph.get_relations(dst_id=claim_id):
+def _reliability(
+    evidence: Evidence,
+    rulebook: CompiledRulebook,
+    trace_level: str,
+    cache: Optional[Dict[str, ScoreResult]] = None,
+) -> ScoreResult:
+    if cache is None:
+        return score_evidence_reliability(evidence, rulebook, trace_level)
+    cached = cache.get(evidence.id)
+    if cached is None:
+        cached = cache[evidence.id] = score_evidence_reliability(evidence, rulebook, trace_level)
+    return cached
+
+
+def _relevance(
+    evidence: Evidence,
+    claim: Claim,
+    rulebook: CompiledRulebook,
+    token_cache: TokenCache,
+    trace_level: str,
+    cache: Optional[Dict[Tuple[str, str], ScoreResult]] = None,
+) -> ScoreResult:
+    if cache is None:
+        return score_evidence_relevance(evidence, claim, rulebook, token_cache, trace_level)
+    key = (evidence.id, claim.id)
+    cached = cache.get(key)
+    if cached is None:
+        cached = cache[key] = score_evidence_relevance(
+            evidence, claim, rulebook, token_cache, trace_level
+        )
+    return cached
+
+
+@dataclass(slots=True)
+class ClaimTotals:
+    """Per-claim accumulators that determine its confidence."""
+
+    support: float = 0.0
+    challenge: float = 0.0
+    evidence_count: int = 0
+    penalty: float = 0.0
+
+
+def _accumulate_claim(
+    claim: Claim,
+    graph: OntologyGraph,
+    rulebook: CompiledRulebook,
+    trace_level: str,
+    steps: List[StepRecord],
+    uncertainties: List[UncertaintyRecord],
+    reliability_cache: Optional[Dict[str, ScoreResult]] = None,
+    relevance_cache: Optional[Dict[Tuple[str, str], ScoreResult]] = None,
+) -> ClaimTotals:
+    record = trace_level != TRACE_OFF
+    totals = ClaimTotals()
+    for src_id, relation, _ in graph.get_relations(dst_id=claim.id):
         if relation not in {SUPPORTS, CHALLENGES}:
             continue
-        evidence = graph.get_entity(src_id)
-        if not isinstance(evidence, Evidence):
+        evidence = graph.get_evidence(src_id)
+        if evidence is None:
             continue
-        reliability, rel_steps, rel_uncertainties = score_evidence_reliability(evidence, rulebook)
-        relevance, relv_steps, relv_uncertainties = score_evidence_relevance(evidence, claim_entity, rulebook)
-        steps.extend(rel_steps + relv_steps)
-        uncertainties.extend(rel_uncertainties + relv_uncertainties)
-        evidence_count += 1
+        reliability, rel_steps, rel_uncertainties = _reliability(
+            evidence, rulebook, trace_level, reliability_cache
+        )
+        relevance, relv_steps, relv_uncertainties = _relevance(
+            evidence, claim, rulebook, graph.token_cache, trace_level, relevance_cache
+        )
+        if record:
+            steps.extend(rel_steps + relv_steps)
+            uncertainties.extend(rel_uncertainties + relv_uncertainties)
+        totals.evidence_count += 1
         magnitude = reliability * relevance
         if relation == SUPPORTS:
-            support += magnitude
+            totals.support += magnitude
         else:
-            challenge += magnitude
-    net = _net_confidence(support, challenge, k)
+            totals.challenge += magnitude
+
+    for src_id, _, _ in graph.get_relations(relation=UNDERLIES, dst_id=claim.id):
+        if graph.get_assumption(src_id) is not None:
+            totals.penalty += rulebook.default_assumption_penalty
+    return totals
+
+
+def _confidence_from_totals(
+    totals: ClaimTotals, rulebook: CompiledRulebook, steps: Optional[List[StepRecord]] = None
+) -> float:
+    net = _net_confidence(totals.support, totals.challenge, rulebook.k)
     normalized = (net + 1) / 2
-    volume_factor = 1 - math.exp(-evidence_count)
+    volume_factor = 1 - math.exp(-totals.evidence_count)
     score = normalized * volume_factor
-    steps.append(
-        make_step(
-            builtin_rules.CLAIM_CONFIDENCE,
-            "Computed claim confidence",
-            score,
-            score,
+    if steps is not None:
+        steps.append(
+            StepRecord(builtin_rules.CLAIM_CONFIDENCE, "Computed claim confidence", score, score)
         )
-    )
 
-    penalty = 0.0
-    for src_id, relation, dst_id in graph.get_relations(dst_id=claim_id):
-        if relation != UNDERLIES:
-            continue
-        assumption = graph.get_entity(src_id)
-        if isinstance(assumption, Assumption):
-            penalty += rulebook.get_assumption_penalties().get("default", 0.1)
-    penalty_cap = constants.get("penalty_cap", 0.4)
-    penalty = min(penalty, penalty_cap)
+    penalty = min(totals.penalty, rulebook.penalty_cap)
     if penalty:
         score = clamp(score - penalty)
-        steps.append(
-            make_step(
-                builtin_rules.ASSUMPTION_PENALTY,
-                "Applied assumption penalty",
-                -penalty,
-                score,
+        if steps is not None:
+            steps.append(
+                StepRecord(
+                    builtin_rules.ASSUMPTION_PENALTY,
+                    "Applied assumption penalty",
+                    -penalty,
+                    score,
+                )
             )
-        )
-    return clamp(score), make_trace(claim_id, steps, uncertainties)
+    return clamp(score)
 
 
-def compute_argument_strength(
-    argument_id: str, graph: OntologyGraph, rulebook: Rulebook
-) -> Tuple[float, ExplanationTrace]:
-    argument = graph.get_entity(argument_id)
-    if not isinstance(argument, Argument):
-        raise ValueError(f"Argument {argument_id} not found")
-    claim_confidence, trace = compute_claim_confidence(argument.claim_id, graph, rulebook)
+def _score_claim(
+    claim: Claim,
+    graph: OntologyGraph,
+    rulebook: CompiledRulebook,
+    trace_level: str = TRACE_FULL,
+    reliability_cache: Optional[Dict[str, ScoreResult]] = None,
+    relevance_cache: Optional[Dict[Tuple[str, str], ScoreResult]] = None,
+) -> ScoreResult:
+    steps: List[StepRecord] = []
+    uncertainties: List[UncertaintyRecord] = []
+    totals = _accumulate_claim(
+        claim,
+        graph,
+        rulebook,
+        trace_level,
+        steps,
+        uncertainties,
+        reliability_cache,
+        relevance_cache,
+    )
+    score = _confidence_from_totals(
+        totals, rulebook, steps if trace_level != TRACE_OFF else None
+    )
+    return score, steps, uncertainties
+
+
+def _score_argument(
+    argument: Argument,
+    claim_confidence: float,
+    graph: OntologyGraph,
+    rulebook: CompiledRulebook,
+    coherence_cache: Optional[Dict[str, float]] = None,
+) -> float:
+    # Coherence only needs reliability values, so it keeps plain floats rather than
+    # sharing the claims' cache, whose entries must carry the batch's trace records.
     coherence_scores: List[float] = []
     for evidence_id in argument.evidence_ids:
-        evidence = graph.get_entity(evidence_id)
-        if not isinstance(evidence, Evidence):
+        evidence = graph.get_evidence(evidence_id)
+        if evidence is None:
             continue
-        reliability, _, _ = score_evidence_reliability(evidence, rulebook)
+        reliability = None if coherence_cache is None else coherence_cache.get(evidence_id)
+        if reliability is None:
+            reliability = score_evidence_reliability(evidence, rulebook, TRACE_OFF)[0]
+            if coherence_cache is not None:
+                coherence_cache[evidence_id] = reliability
         coherence_scores.append(reliability)
     coherence = sum(coherence_scores) / len(coherence_scores) if coherence_scores else 0.0
-    strength = clamp(0.7 * claim_confidence + 0.3 * coherence)
-    trace.steps.append(
-        make_step(
-            builtin_rules.ARGUMENT_STRENGTH,
-            "Computed argument strength",
-            strength,
-            strength,
-        )
+    return clamp(0.7 * claim_confidence + 0.3 * coherence)
+
+
+def compute_claim_confidence(
+    claim_id: str,
+    graph: OntologyGraph,
+    rulebook: RulebookLike,
+    trace_level: str = TRACE_FULL,
+) -> Tuple[float, LazyTrace]:
+    check_trace_level(trace_level)
+    claim_entity = graph.get_claim(claim_id)
+    if claim_entity is None:
+        raise ValueError(f"Claim {claim_id} not found")
+    score, steps, uncertainties = _score_claim(
+        claim_entity, graph, rulebook.compile(), trace_level
+    )
+    return score, LazyTrace(claim_id, steps, uncertainties)
+
+
+def compute_argument_strength(
+    argument_id: str,
+    graph: OntologyGraph,
+    rulebook: RulebookLike,
+    trace_level: str = TRACE_FULL,
+) -> Tuple[float, LazyTrace]:
+    argument = graph.get_argument(argument_id)
+    if argument is None:
+        raise ValueError(f"Argument {argument_id} not found")
+    compiled = rulebook.compile()
+    claim_confidence, trace = compute_claim_confidence(
+        argument.claim_id, graph, compiled, trace_level
     )
+    strength = _score_argument(argument, claim_confidence, graph, compiled)
+    if trace_level != TRACE_OFF:
+        trace.steps.append(
+            StepRecord(
+                builtin_rules.ARGUMENT_STRENGTH, "Computed argument strength", strength, strength
+            )
+        )
     trace.subject_id = argument_id
     return strength, trace
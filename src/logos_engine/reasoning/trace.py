@@ -1,36 +1,90 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, NamedTuple, Optional, Union
 
 from ..ontology.models import ExplanationTrace, ReasoningStep, UncertaintyMarker
+from ..storage.trace_store import JsonDirectorySink, TraceSink
 from ..utils.ids import new_id
 
+TRACE_OFF = "off"
+TRACE_SUMMARY = "summary"
+TRACE_FULL = "full"
+TRACE_LEVELS = (TRACE_OFF, TRACE_SUMMARY, TRACE_FULL)
+
+
+class StepRecord(NamedTuple):
+    """Unvalidated reasoning step; becomes a `ReasoningStep` when a trace is materialized."""
+
+    rule_id: str
+    description: str
+    delta: float
+    resulting_score: Optional[float]
+
+
+class UncertaintyRecord(NamedTuple):
+    subject_id: str
+    note: str
+    severity: Optional[float] = None
+
+
+@dataclass(slots=True)
+class LazyTrace:
+    """Trace built from plain records; ids and pydantic models are only created on export."""
+
+    subject_id: str
+    steps: List[StepRecord] = field(default_factory=list)
+    uncertainty_markers: List[UncertaintyRecord] = field(default_factory=list)
+
+    def materialize(self) -> ExplanationTrace:
+        return make_trace(
+            self.subject_id,
+            [make_step(*step) for step in self.steps],
+            [make_uncertainty(*marker) for marker in self.uncertainty_markers],
+        )
+
+
+def check_trace_level(level: str) -> str:
+    if level not in TRACE_LEVELS:
+        raise ValueError(f"Unknown trace level {level!r}; expected one of {TRACE_LEVELS}")
+    return level
+
 
 @dataclass
 class TraceLogger:
+    """Collects traces and exports them under `log_dir`.
+
+    Without a `sink`, traces accumulate in `traces` and `export` writes one JSON
+    file each. With a sink (see `storage.trace_store`), each trace is materialized
+    and handed to the sink as it is added, so nothing is held in memory.
+    """
+
     log_dir: Path
-    traces: List[ExplanationTrace] = field(default_factory=list)
+    traces: List[Union[ExplanationTrace, LazyTrace]] = field(default_factory=list)
+    sink: Optional[TraceSink] = None
 
-    def add_trace(self, trace: ExplanationTrace) -> None:
-        self.traces.append(trace)
+    def add_trace(self, trace: Union[ExplanationTrace, LazyTrace]) -> None:
+        if self.sink is None:
+            self.traces.append(trace)
+            return
+        self.sink.write(trace.materialize() if isinstance(trace, LazyTrace) else trace)
 
     def export(self) -> List[Path]:
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-        exported: List[Path] = []
+        if self.sink is not None:
+            self.sink.flush()
+            return self.sink.outputs()
         timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        for trace in self.traces:
-            path = self.log_dir / f"trace_{trace.subject_id}_{timestamp}.json"
-            with path.open("w", encoding="utf-8") as handle:
-                json.dump(trace.model_dump(), handle, indent=2)
-            exported.append(path)
-        return exported
+        sink = JsonDirectorySink(self.log_dir, timestamp)
+        for pending in self.traces:
+            sink.write(pending.materialize() if isinstance(pending, LazyTrace) else pending)
+        return sink.outputs()
 
 
-def make_step(rule_id: str, description: str, delta: float, resulting_score: float | None) -> ReasoningStep:
+def make_step(
+    rule_id: str, description: str, delta: float, resulting_score: float | None
+) -> ReasoningStep:
     return ReasoningStep(
         id=new_id("step"),
         rule_id=rule_id,
@@ -40,7 +94,9 @@ def make_step(rule_id: str, description: str, delta: float, resulting_score: flo
     )
 
 
-def make_trace(subject_id: str, steps: List[ReasoningStep], uncertainties: List[UncertaintyMarker]) -> ExplanationTrace:
+def make_trace(
+    subject_id: str, steps: List[ReasoningStep], uncertainties: List[UncertaintyMarker]
+) -> ExplanationTrace:
     return ExplanationTrace(
         id=new_id("trace"),
         subject_id=subject_id,
@@ -49,5 +105,9 @@ def make_trace(subject_id: str, steps: List[ReasoningStep], uncertainties: List[
     )
 
 
-def make_uncertainty(subject_id: str, note: str, severity: float | None = None) -> UncertaintyMarker:
-    return UncertaintyMarker(id=new_id("uncertainty"), subject_id=subject_id, note=note, severity=severity)
+def make_uncertainty(
+    subject_id: str, note: str, severity: float | None = None
+) -> UncertaintyMarker:
+    return UncertaintyMarker(
+        id=new_id("uncertainty"), subject_id=subject_id, note=note, severity=severity
+    )
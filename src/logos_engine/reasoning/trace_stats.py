@@ -0,0 +1,300 @@
+"""Corpus-wide statistics over exported reasoning traces.
+
+Trace stores (see `storage.trace_store`) and JSON trace directories are scanned
+once, without building pydantic models. Steps are appended to columnar chunks
+(rule code, delta) and folded into the running aggregates every `chunk_size`
+steps, with NumPy when it is installed, so memory stays flat however many steps
+a corpus holds. SQLite stores are read straight from their step and uncertainty
+tables.
+"""
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..storage.trace_store import JsonlTraceReader
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+DELTA_RANGE = (-1.0, 1.0)
+SCORE_RANGE = (0.0, 1.0)
+
+UncertaintyKey = Tuple[str, Optional[float]]
+
+
+@dataclass
+class RuleStats:
+    rule_id: str
+    count: int
+    total: float
+    abs_total: float
+    minimum: float
+    maximum: float
+    histogram: List[int]
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass
+class TraceStats:
+    """Aggregates for a set of traces.
+
+    `histogram` entries split `DELTA_RANGE` (rule deltas) or `SCORE_RANGE` (final
+    score of each trace) into equal bins; values outside a range land in its
+    first or last bin.
+    """
+
+    traces: int
+    steps: int
+    rules: Dict[str, RuleStats]
+    uncertainties: Dict[UncertaintyKey, int]
+    score_histogram: List[int]
+    delta_bins: int
+    score_bins: int
+
+    def top_rules(self, limit: int = 10) -> List[RuleStats]:
+        """Rules with the largest total absolute delta."""
+        return sorted(self.rules.values(), key=lambda rule: (-rule.abs_total, rule.rule_id))[
+            :limit
+        ]
+
+    def bin_edges(self, scores: bool = False) -> List[float]:
+        low, high = SCORE_RANGE if scores else DELTA_RANGE
+        bins = self.score_bins if scores else self.delta_bins
+        width = (high - low) / bins
+        return [low + width * index for index in range(bins + 1)]
+
+
+@dataclass
+class TraceStatsAccumulator:
+    """Single-pass accumulator; feed it with `add_trace` or `add_step`, then call `result`."""
+
+    delta_bins: int = 20
+    score_bins: int = 10
+    chunk_size: int = 65536
+    use_numpy: bool = True
+    traces: int = 0
+    steps: int = 0
+    uncertainties: Counter = field(default_factory=Counter)
+    _rule_codes: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _codes: array = field(default_factory=lambda: array("q"), init=False, repr=False)
+    _deltas: array = field(default_factory=lambda: array("d"), init=False, repr=False)
+    _scores: array = field(default_factory=lambda: array("d"), init=False, repr=False)
+    _count: List[int] = field(default_factory=list, init=False, repr=False)
+    _total: List[float] = field(default_factory=list, init=False, repr=False)
+    _abs_total: List[float] = field(default_factory=list, init=False, repr=False)
+    _min: List[float] = field(default_factory=list, init=False, repr=False)
+    _max: List[float] = field(default_factory=list, init=False, repr=False)
+    _histograms: List[List[int]] = field(default_factory=list, init=False, repr=False)
+    _score_histogram: List[int] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._score_histogram = [0] * self.score_bins
+
+    def add_trace(self, payload: Dict[str, Any]) -> None:
+        """Add one trace given as its exported dict."""
+        self.traces += 1
+        steps = payload.get("steps", [])
+        for step in steps:
+            self.add_step(step["rule_id"], step["delta"])
+        if steps and steps[-1].get("resulting_score") is not None:
+            self.add_score(steps[-1]["resulting_score"])
+        for marker in payload.get("uncertainty_markers", []):
+            self.uncertainties[(marker["note"], marker.get("severity"))] += 1
+
+    def add_step(self, rule_id: str, delta: float) -> None:
+        code = self._rule_codes.get(rule_id)
+        if code is None:
+            code = self._rule_codes[rule_id] = len(self._rule_codes)
+            self._count.append(0)
+            self._total.append(0.0)
+            self._abs_total.append(0.0)
+            self._min.append(math.inf)
+            self._max.append(-math.inf)
+            self._histograms.append([0] * self.delta_bins)
+        self._codes.append(code)
+        self._deltas.append(delta)
+        self.steps += 1
+        if len(self._codes) >= self.chunk_size:
+            self._fold()
+
+    def add_score(self, score: float) -> None:
+        self._scores.append(score)
+        if len(self._scores) >= self.chunk_size:
+            self._fold()
+
+    def result(self) -> TraceStats:
+        self._fold()
+        rules = {
+            rule_id: RuleStats(
+                rule_id=rule_id,
+                count=self._count[code],
+                total=self._total[code],
+                abs_total=self._abs_total[code],
+                minimum=self._min[code],
+                maximum=self._max[code],
+                histogram=list(self._histograms[code]),
+            )
+            for rule_id, code in self._rule_codes.items()
+        }
+        return TraceStats(
+            traces=self.traces,
+            steps=self.steps,
+            rules=rules,
+            uncertainties=dict(self.uncertainties),
+            score_histogram=list(self._score_histogram),
+            delta_bins=self.delta_bins,
+            score_bins=self.score_bins,
+        )
+
+    def _fold(self) -> None:
+        if self.use_numpy and np is not None:
+            self._fold_numpy()
+        else:
+            self._fold_python()
+        del self._codes[:]
+        del self._deltas[:]
+        del self._scores[:]
+
+    def _fold_python(self) -> None:
+        low, high = DELTA_RANGE
+        for code, delta in zip(self._codes, self._deltas, strict=True):
+            self._count[code] += 1
+            self._total[code] += delta
+            self._abs_total[code] += abs(delta)
+            self._min[code] = min(self._min[code], delta)
+            self._max[code] = max(self._max[code], delta)
+            self._histograms[code][_bin(delta, low, high, self.delta_bins)] += 1
+        low, high = SCORE_RANGE
+        for score in self._scores:
+            self._score_histogram[_bin(score, low, high, self.score_bins)] += 1
+
+    def _fold_numpy(self) -> None:
+        rules = len(self._rule_codes)
+        if self._codes:
+            codes = np.frombuffer(self._codes, dtype=np.int64)
+            deltas = np.frombuffer(self._deltas, dtype=np.float64)
+            counts = np.bincount(codes, minlength=rules)
+            totals = np.bincount(codes, weights=deltas, minlength=rules)
+            abs_totals = np.bincount(codes, weights=np.abs(deltas), minlength=rules)
+            minimums = np.full(rules, np.inf)
+            maximums = np.full(rules, -np.inf)
+            np.minimum.at(minimums, codes, deltas)
+            np.maximum.at(maximums, codes, deltas)
+            bins = _bins(deltas, *DELTA_RANGE, self.delta_bins)
+            histograms = np.bincount(
+                codes * self.delta_bins + bins, minlength=rules * self.delta_bins
+            ).reshape(rules, self.delta_bins)
+            for code in np.flatnonzero(counts).tolist():
+                self._count[code] += int(counts[code])
+                self._total[code] += float(totals[code])
+                self._abs_total[code] += float(abs_totals[code])
+                self._min[code] = min(self._min[code], float(minimums[code]))
+                self._max[code] = max(self._max[code], float(maximums[code]))
+                histogram = self._histograms[code]
+                for index, value in enumerate(histograms[code].tolist()):
+                    histogram[index] += value
+        if self._scores:
+            scores = np.frombuffer(self._scores, dtype=np.float64)
+            bins = _bins(scores, *SCORE_RANGE, self.score_bins)
+            counts = np.bincount(bins, minlength=self.score_bins)
+            for index, value in enumerate(counts.tolist()):
+                self._score_histogram[index] += value
+
+
+def iter_trace_payloads(path: Path) -> Iterator[Dict[str, Any]]:
+    """Trace dicts from a JSONL segment or a directory of per-trace JSON files."""
+    if path.is_dir():
+        for trace_file in sorted(path.glob("*.json")):
+            with trace_file.open("r", encoding="utf-8") as handle:
+                yield json.load(handle)
+        return
+    yield from JsonlTraceReader(path).iter_payloads()
+
+
+def collect_trace_stats(
+    paths: Iterable[Path],
+    delta_bins: int = 20,
+    score_bins: int = 10,
+    chunk_size: int = 65536,
+    use_numpy: bool = True,
+) -> TraceStats:
+    """Aggregate every trace in `paths` (JSONL segments, `.db` stores or JSON directories)."""
+    accumulator = TraceStatsAccumulator(
+        delta_bins=delta_bins, score_bins=score_bins, chunk_size=chunk_size, use_numpy=use_numpy
+    )
+    for path in paths:
+        if path.suffix == ".db":
+            _accumulate_sqlite(accumulator, path)
+            continue
+        for payload in iter_trace_payloads(path):
+            accumulator.add_trace(payload)
+    return accumulator.result()
+
+
+def subjects_with_uncertainty(paths: Iterable[Path], note: str) -> Iterator[str]:
+    """Subject ids whose traces carry an uncertainty marker containing `note`."""
+    for path in paths:
+        if path.suffix == ".db":
+            connection = sqlite3.connect(path)
+            try:
+                rows = connection.execute(
+                    "SELECT subject_id FROM trace_uncertainties WHERE instr(note, ?) > 0 "
+                    "GROUP BY subject_id ORDER BY MIN(rowid)",
+                    (note,),
+                )
+                for (subject_id,) in rows:
+                    yield subject_id
+            finally:
+                connection.close()
+            continue
+        seen = set()
+        for payload in iter_trace_payloads(path):
+            subject_id = payload["subject_id"]
+            if subject_id in seen:
+                continue
+            if any(note in marker["note"] for marker in payload.get("uncertainty_markers", [])):
+                seen.add(subject_id)
+                yield subject_id
+
+
+def _accumulate_sqlite(accumulator: TraceStatsAccumulator, path: Path) -> None:
+    connection = sqlite3.connect(path)
+    try:
+        accumulator.traces += connection.execute("SELECT COUNT(*) FROM traces").fetchone()[0]
+        for rule_id, delta in connection.execute(
+            "SELECT rule_id, delta FROM trace_steps ORDER BY rowid"
+        ):
+            accumulator.add_step(rule_id, delta)
+        final_scores = connection.execute(
+            "SELECT resulting_score FROM trace_steps WHERE rowid IN "
+            "(SELECT MAX(rowid) FROM trace_steps GROUP BY trace_rowid) "
+            "AND resulting_score IS NOT NULL ORDER BY rowid"
+        )
+        for (score,) in final_scores:
+            accumulator.add_score(score)
+        for note, severity, count in connection.execute(
+            "SELECT note, severity, COUNT(*) FROM trace_uncertainties GROUP BY note, severity"
+        ):
+            accumulator.uncertainties[(note, severity)] += count
+    finally:
+        connection.close()
+
+
+def _bin(value: float, low: float, high: float, bins: int) -> int:
+    return min(max(int((value - low) / (high - low) * bins), 0), bins - 1)
+
+
+def _bins(values: Any, low: float, high: float, bins: int) -> Any:
+    return np.clip(((values - low) / (high - low) * bins).astype(np.int64), 0, bins - 1)
@@ -1,5 +1,27 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Tuple
+
 RELIABILITY_BASELINE = "rel.baseline"
 RELEVANCE_BASELINE = "relv.baseline"
 ASSUMPTION_PENALTY = "assumption.penalty"
 CLAIM_CONFIDENCE = "claim.confidence"
 ARGUMENT_STRENGTH = "argument.strength"
+RELEVANCE_KEYWORD_MATCH = "rel.match.title"
+RELEVANCE_SCOPE_MISMATCH = "rel.scope.mismatch"
+
+
+def _keyword_match(overlap: bool) -> bool:
+    return overlap
+
+
+def _scope_mismatch(overlap: bool) -> bool:
+    return not overlap
+
+
+# Relevance rule dispatch: rule id -> (predicate on claim/evidence token overlap,
+# description used when the rulebook entry has none). Unlisted rule ids never fire.
+RELEVANCE_RULES: Dict[str, Tuple[Callable[[bool], bool], str]] = {
+    RELEVANCE_KEYWORD_MATCH: (_keyword_match, "match"),
+    RELEVANCE_SCOPE_MISMATCH: (_scope_mismatch, "mismatch"),
+}
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+import hashlib
+import json
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 import yaml
 
+from . import builtin_rules
+
 
 @dataclass
 class Rulebook:
@@ -51,3 +57,93 @@ class Rulebook:
 
     def get_constants(self) -> Dict[str, float]:
         return dict(self.constants)
+
+    def fingerprint(self) -> str:
+        """Hash of the rulebook's content, for keying caches."""
+        payload = json.dumps(asdict(self), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def compile(self) -> "CompiledRulebook":
+        """The immutable form of this rulebook used by the scoring loops.
+
+        The result is cached and reused until the rulebook's content changes, so
+        callers may pass a `Rulebook` to the scoring functions on every call.
+        """
+        content = self._content()
+        cached: Optional[Tuple[Any, CompiledRulebook]] = getattr(self, "_compiled", None)
+        if cached is not None and cached[0] == content:
+            return cached[1]
+        compiled = self._compile()
+        self._compiled = (copy.deepcopy(content), compiled)
+        return compiled
+
+    def _content(self) -> Tuple[Any, ...]:
+        return (
+            self.evidence_reliability_baselines,
+            self.relevance_rules,
+            self.assumption_penalties,
+            self.constants,
+        )
+
+    def _compile(self) -> "CompiledRulebook":
+        constants = self.constants
+        rules: List[CompiledRelevanceRule] = []
+        for rule in self.relevance_rules:
+            rule_id = rule.get("id", "unknown")
+            dispatch = builtin_rules.RELEVANCE_RULES.get(rule_id)
+            if dispatch is None:
+                continue
+            applies, default_description = dispatch
+            rules.append(
+                CompiledRelevanceRule(
+                    rule_id=rule_id,
+                    description=rule.get("description", default_description),
+                    adjustment=float(rule.get("adjustment", 0.0)),
+                    applies=applies,
+                )
+            )
+        return CompiledRulebook(
+            reliability_baselines=MappingProxyType(dict(self.evidence_reliability_baselines)),
+            unknown_reliability=self.evidence_reliability_baselines.get("unknown", 0.5),
+            relevance_baseline=constants.get("relevance_baseline", 0.5),
+            relevance_rules=tuple(rules),
+            matched_relevance_rules=(
+                tuple(rule for rule in rules if rule.applies(False)),
+                tuple(rule for rule in rules if rule.applies(True)),
+            ),
+            default_assumption_penalty=self.assumption_penalties.get("default", 0.1),
+            k=constants.get("k", 0.5),
+            penalty_cap=constants.get("penalty_cap", 0.4),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRelevanceRule:
+    rule_id: str
+    description: str
+    adjustment: float
+    applies: Callable[[bool], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRulebook:
+    reliability_baselines: Mapping[str, float]
+    unknown_reliability: float
+    relevance_baseline: float
+    relevance_rules: Tuple[CompiledRelevanceRule, ...]
+    # Rules that fire, indexed by whether claim and evidence tokens overlap.
+    matched_relevance_rules: Tuple[
+        Tuple[CompiledRelevanceRule, ...], Tuple[CompiledRelevanceRule, ...]
+    ]
+    default_assumption_penalty: float
+    k: float
+    penalty_cap: float
+
+    def reliability_baseline(self, evidence_type: str) -> float:
+        return self.reliability_baselines.get(evidence_type, self.unknown_reliability)
+
+    def compile(self) -> "CompiledRulebook":
+        return self
+
+
+RulebookLike = Union[Rulebook, CompiledRulebook]
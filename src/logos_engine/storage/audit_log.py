@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import gzip
 import json
-from dataclasses import dataclass
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import IO, Any, Dict, List, Optional
+
+# When BufferedAuditLog calls fsync: after every flush, only when a segment is
+# rotated or the log is closed, or never (leave it to the OS).
+FSYNC_FLUSH = "flush"
+FSYNC_ROTATE = "rotate"
+FSYNC_NEVER = "never"
+FSYNC_POLICIES = (FSYNC_FLUSH, FSYNC_ROTATE, FSYNC_NEVER)
 
 
 @dataclass
@@ -13,9 +25,142 @@ class AuditLog:
 
     def append(self, event: Dict[str, Any]) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {
-            "timestamp": datetime.utcnow().isoformat(),
-            **event,
-        }
         with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload) + "\n")
+            handle.write(_format(event))
+
+
+@dataclass
+class BufferedAuditLog(AuditLog):
+    """Audit log that keeps its file open and writes events in batches.
+
+    Events are buffered until `buffer_size` accumulate, `flush()` is called, the
+    background thread fires (every `flush_interval` seconds; None disables it) or
+    the log is closed. After a flush the file is rotated once it exceeds
+    `max_bytes` or is older than `max_age` seconds: it is renamed with a timestamp
+    and, with `compress_rotated`, gzipped. Use it as a context manager or call
+    `close()` so buffered events are not lost.
+    """
+
+    buffer_size: int = 1000
+    flush_interval: Optional[float] = 1.0
+    max_bytes: Optional[int] = 50 * 1024 * 1024
+    max_age: Optional[float] = None
+    compress_rotated: bool = True
+    fsync: str = FSYNC_ROTATE
+    _buffer: List[str] = field(default_factory=list, init=False, repr=False)
+    _handle: Optional[IO[str]] = field(default=None, init=False, repr=False)
+    _opened_at: float = field(default=0.0, init=False, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+    _stop: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Unknown fsync policy {self.fsync!r}; expected one of {FSYNC_POLICIES}"
+            )
+        if self.flush_interval is not None:
+            self._thread = threading.Thread(
+                target=self._flush_periodically, name="audit-log-flush", daemon=True
+            )
+            self._thread.start()
+
+    def __enter__(self) -> "BufferedAuditLog":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def append(self, event: Dict[str, Any]) -> None:
+        line = _format(event)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.buffer_size:
+                self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        with self._lock:
+            self._flush()
+            if self._handle is not None:
+                self._fsync(rotating=True)
+                self._handle.close()
+                self._handle = None
+
+    def rotate(self) -> Optional[Path]:
+        """Close the current segment and move it aside; returns the rotated file."""
+        with self._lock:
+            self._flush()
+            return self._rotate()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            handle = self._open()
+            handle.write("".join(self._buffer))
+            self._buffer.clear()
+            handle.flush()
+            self._fsync(rotating=False)
+        if self._should_rotate():
+            self._rotate()
+
+    def _open(self) -> IO[str]:
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("a", encoding="utf-8")
+            self._opened_at = time.monotonic()
+        return self._handle
+
+    def _should_rotate(self) -> bool:
+        if self._handle is None:
+            return False
+        size = self._handle.tell()
+        if size == 0:
+            return False
+        if self.max_bytes is not None and size >= self.max_bytes:
+            return True
+        return self.max_age is not None and time.monotonic() - self._opened_at >= self.max_age
+
+    def _rotate(self) -> Optional[Path]:
+        if self._handle is not None:
+            self._fsync(rotating=True)
+            self._handle.close()
+            self._handle = None
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return None
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        rotated = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        os.replace(self.path, rotated)
+        if not self.compress_rotated:
+            return rotated
+        compressed = rotated.with_name(f"{rotated.name}.gz")
+        with rotated.open("rb") as source, gzip.open(compressed, "wb") as target:
+            shutil.copyfileobj(source, target)
+        rotated.unlink()
+        return compressed
+
+    def _fsync(self, rotating: bool) -> None:
+        if self._handle is None or self.fsync == FSYNC_NEVER:
+            return
+        if not rotating and self.fsync != FSYNC_FLUSH:
+            return
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def _flush_periodically(self) -> None:
+        interval = self.flush_interval or 1.0
+        while not self._stop.wait(interval):
+            self.flush()
+
+
+def _format(event: Dict[str, Any]) -> str:
+    payload = {
+        "timestamp": datetime.utcnow().isoformat(),
+        **event,
+    }
+    return json.dumps(payload) + "\n"
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..ontology.graph import OntologyGraph
+from .snapshot import load_snapshot, write_snapshot
+
+
+@dataclass
+class CachedIngest:
+    graph: OntologyGraph
+    # JSON-serializable context values the pipeline produced (source_id, ...).
+    context: Dict[str, Any] = field(default_factory=dict)
+    notes_for_auditor: List[str] = field(default_factory=list)
+
+
+@dataclass
+class IngestCache:
+    """Content-addressed store of ingested sub-graphs.
+
+    Entries are keyed by the document (path and content hash) plus the pipeline
+    fingerprint, so any change to one of them misses. Graphs are stored as binary
+    snapshots next to a small JSON file with the context and notes.
+    """
+
+    directory: Path
+
+    @staticmethod
+    def key(document: str, pipeline: str) -> str:
+        payload = "\x1f".join((document, pipeline)).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedIngest]:
+        meta_path, graph_path = self._paths(key)
+        if not meta_path.exists() or not graph_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        return CachedIngest(
+            graph=load_snapshot(graph_path),
+            context=meta.get("context", {}),
+            notes_for_auditor=meta.get("notes_for_auditor", []),
+        )
+
+    def put(self, key: str, entry: CachedIngest) -> None:
+        meta_path, graph_path = self._paths(key)
+        graph_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to temporary names and rename, so readers never see partial entries;
+        # the meta file goes last because `get` requires it.
+        graph_tmp = graph_path.with_name(f"{graph_path.name}.{os.getpid()}.tmp")
+        write_snapshot(entry.graph, graph_tmp)
+        os.replace(graph_tmp, graph_path)
+        meta = {
+            "context": {
+                name: value for name, value in entry.context.items() if _is_json_scalar(value)
+            },
+            "notes_for_auditor": entry.notes_for_auditor,
+        }
+        meta_tmp = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.tmp")
+        meta_tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(meta_tmp, meta_path)
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        bucket = self.directory / key[:2]
+        return bucket / f"{key}.json", bucket / f"{key}.snap"
+
+
+def _is_json_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import gzip
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional
 
 from ..ontology.graph import OntologyGraph
+from ..ontology.models import MODEL_REGISTRY
+
+ProgressCallback = Callable[[int], None]
+
+# Streaming (JSON Lines) records, one per line:
+#   {"kind": "entity", "type": "Claim", "data": {...}}
+#   {"kind": "relation", "edge": [src_id, relation, dst_id]}
+ENTITY_RECORD = "entity"
+RELATION_RECORD = "relation"
+# zlib level 6 writes several times faster than gzip's default of 9, for a few percent more bytes.
+_GZIP_LEVEL = 6
 
 
 def save_graph(graph: OntologyGraph, path: Path) -> None:
@@ -20,5 +32,83 @@ def load_graph(path: Path) -> OntologyGraph:
     with path.open("r", encoding="utf-8") as handle:
         payload = json.load(handle)
     graph = OntologyGraph.from_dict(payload.get("entities", {}))
-    graph.relations = [tuple(edge) for edge in payload.get("relations", [])]
+    graph.add_relations(payload.get("relations", []))
     return graph
+
+
+def iter_graph_records(graph: OntologyGraph) -> Iterator[Dict[str, Any]]:
+    """Stream a graph as records: all entities first, then all relations."""
+    for entity_type, bucket in graph.entities.items():
+        for entity in bucket.values():
+            yield {"kind": ENTITY_RECORD, "type": entity_type, "data": entity.model_dump()}
+    for edge in graph.get_relations():
+        yield {"kind": RELATION_RECORD, "edge": list(edge)}
+
+
+def write_records(
+    records: Iterable[Dict[str, Any]],
+    path: Path,
+    progress: Optional[ProgressCallback] = None,
+    progress_every: int = 10000,
+) -> int:
+    """Write records as JSON Lines, gzip-compressed when `path` ends in `.gz`."""
+    count = 0
+    with _open_text(path, "w") as handle:
+        for record in records:
+            handle.write(json.dumps(record, separators=(",", ":")))
+            handle.write("\n")
+            count += 1
+            if progress is not None and count % progress_every == 0:
+                progress(count)
+    if progress is not None:
+        progress(count)
+    return count
+
+
+def read_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield records from a JSON Lines graph file one line at a time."""
+    with _open_text(path, "r") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def save_graph_jsonl(
+    graph: OntologyGraph,
+    path: Path,
+    progress: Optional[ProgressCallback] = None,
+    progress_every: int = 10000,
+) -> int:
+    return write_records(iter_graph_records(graph), path, progress, progress_every)
+
+
+def load_graph_jsonl(
+    path: Path,
+    progress: Optional[ProgressCallback] = None,
+    progress_every: int = 10000,
+) -> OntologyGraph:
+    graph = OntologyGraph()
+    count = 0
+    for record in read_records(path):
+        kind = record.get("kind")
+        if kind == ENTITY_RECORD:
+            model = MODEL_REGISTRY.get(record.get("type", ""))
+            if model is not None:
+                graph.add_entity(model.model_validate(record["data"]))  # type: ignore[arg-type]
+        elif kind == RELATION_RECORD:
+            src_id, relation, dst_id = record["edge"]
+            graph.add_relation(src_id, relation, dst_id)
+        count += 1
+        if progress is not None and count % progress_every == 0:
+            progress(count)
+    if progress is not None:
+        progress(count)
+    return graph
+
+
+def _open_text(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(  # type: ignore[return-value]
+            path, f"{mode}t", compresslevel=_GZIP_LEVEL, encoding="utf-8"
+        )
+    return path.open(mode, encoding="utf-8")
@@ -0,0 +1,336 @@
+"""Binary graph snapshots.
+
+A snapshot is a single little-endian file:
+
+* a header (magic, reserved flags, counts) and a table of (offset, length) per section;
+* a sorted, de-duplicated UTF-8 string table holding every id, type name and
+  relation name, so string order and string-index order agree;
+* entity columns sorted by id: id and type (string indexes), JSON payload,
+  reliability / relevance / confidence (float64, NaN when unset) and polarity,
+  plus the rows in graph insertion order;
+* relation columns in graph insertion order (src, relation, dst string indexes)
+  plus permutations that order the relations by dst and by src.
+
+`Snapshot` maps the file with `mmap` and answers lookups by binary search over
+the columns, decoding only the strings and payloads it touches. Payloads are
+always decoded with `model_validate_json`: pydantic-core parses and validates JSON
+faster than `json.loads` alone, let alone `json.loads` plus `model_construct`.
+"""
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..ontology.graph import Edge, Entity, OntologyGraph
+from ..ontology.models import MODEL_REGISTRY
+
+MAGIC = b"LOGOSNP1"
+NUMERIC_FIELDS = ("reliability", "relevance", "confidence")
+
+# Section name -> array typecode ("B" for raw bytes).
+SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("string_offsets", "Q"),
+    ("string_data", "B"),
+    ("entity_id", "I"),
+    ("entity_type", "I"),
+    ("entity_order", "I"),
+    ("payload_offsets", "Q"),
+    ("payload_data", "B"),
+    ("reliability", "d"),
+    ("relevance", "d"),
+    ("confidence", "d"),
+    ("polarity", "b"),
+    ("relation_src", "I"),
+    ("relation_name", "I"),
+    ("relation_dst", "I"),
+    ("relation_by_dst", "I"),
+    ("relation_by_src", "I"),
+)
+_HEADER = struct.Struct("<8sIIII")
+_SECTION = struct.Struct("<QQ")
+_ALIGN = 8
+
+
+def write_snapshot(graph: OntologyGraph, path: Path) -> None:
+    inserted = [entity for bucket in graph.entities.values() for entity in bucket.values()]
+    rows = sorted(range(len(inserted)), key=lambda position: inserted[position].id)
+    entities = [inserted[row] for row in rows]
+    relations = graph.get_relations()
+    strings = sorted(
+        {entity.id for entity in entities}
+        | {type(entity).__name__ for entity in entities}
+        | {value for edge in relations for value in edge}
+    )
+    string_index = {value: index for index, value in enumerate(strings)}
+
+    encoded_strings = [value.encode("utf-8") for value in strings]
+    payloads = [
+        json.dumps(entity.model_dump(), separators=(",", ":")).encode("utf-8")
+        for entity in entities
+    ]
+    columns: Dict[str, Any] = {
+        "string_offsets": _offsets(encoded_strings),
+        "string_data": b"".join(encoded_strings),
+        "entity_id": array("I", (string_index[entity.id] for entity in entities)),
+        "entity_type": array("I", (string_index[type(entity).__name__] for entity in entities)),
+        "entity_order": _inverse(rows),
+        "payload_offsets": _offsets(payloads),
+        "payload_data": b"".join(payloads),
+        "polarity": array("b", (getattr(entity, "polarity", 0) for entity in entities)),
+        "relation_src": array("I", (string_index[edge[0]] for edge in relations)),
+        "relation_name": array("I", (string_index[edge[1]] for edge in relations)),
+        "relation_dst": array("I", (string_index[edge[2]] for edge in relations)),
+    }
+    for name in NUMERIC_FIELDS:
+        columns[name] = array("d", (_numeric(getattr(entity, name, None)) for entity in entities))
+    # Stable sorts keep insertion order within one dst (or src).
+    positions = range(len(relations))
+    columns["relation_by_dst"] = array(
+        "I", sorted(positions, key=columns["relation_dst"].__getitem__)
+    )
+    columns["relation_by_src"] = array(
+        "I", sorted(positions, key=columns["relation_src"].__getitem__)
+    )
+
+    blobs = [_to_bytes(columns[name]) for name, _ in SECTIONS]
+    offset = _align(_HEADER.size + _SECTION.size * len(SECTIONS))
+    table: List[Tuple[int, int]] = []
+    for blob in blobs:
+        table.append((offset, len(blob)))
+        offset = _align(offset + len(blob))
+
+    with path.open("wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, 0, len(strings), len(entities), len(relations)))
+        for section in table:
+            handle.write(_SECTION.pack(*section))
+        for (start, _), blob in zip(table, blobs, strict=True):
+            handle.write(b"\0" * (start - handle.tell()))
+            handle.write(blob)
+
+
+class Snapshot:
+    """Memory-mapped, read-only snapshot."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = path.open("rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+        magic, _, self.string_count, self.entity_count, self.relation_count = (
+            _HEADER.unpack_from(self._mmap, 0)
+        )
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a logos-engine snapshot")
+        self._columns: Dict[str, Sequence[Any]] = {}
+        for position, (name, typecode) in enumerate(SECTIONS):
+            start, length = _SECTION.unpack_from(
+                self._mmap, _HEADER.size + position * _SECTION.size
+            )
+            self._columns[name] = self._column(start, length, typecode)
+
+    @classmethod
+    def open(cls, path: Path) -> "Snapshot":
+        return cls(path)
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._columns = {}
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def string(self, index: int) -> str:
+        offsets = self._columns["string_offsets"]
+        data = self._columns["string_data"]
+        return bytes(data[offsets[index] : offsets[index + 1]]).decode("utf-8")
+
+    def string_index(self, value: str) -> Optional[int]:
+        low, high = 0, self.string_count
+        while low < high:
+            middle = (low + high) // 2
+            current = self.string(middle)
+            if current == value:
+                return middle
+            if current < value:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def entity_row(self, entity_id: str) -> Optional[int]:
+        index = self.string_index(entity_id)
+        if index is None:
+            return None
+        column = self._columns["entity_id"]
+        row = bisect_left(column, index)
+        if row < self.entity_count and column[row] == index:
+            return row
+        return None
+
+    def entity_type(self, entity_id: str) -> Optional[str]:
+        row = self.entity_row(entity_id)
+        return None if row is None else self.string(self._columns["entity_type"][row])
+
+    def numeric(self, entity_id: str, name: str) -> Optional[float]:
+        """Reliability, relevance or confidence of an entity, read straight from its column."""
+        row = self.entity_row(entity_id)
+        if row is None:
+            return None
+        value = self._columns[name][row]
+        return None if math.isnan(value) else value
+
+    def polarity(self, entity_id: str) -> Optional[int]:
+        row = self.entity_row(entity_id)
+        return None if row is None else self._columns["polarity"][row]
+
+    def get_entity(self, entity_id: str) -> Optional[Entity]:
+        row = self.entity_row(entity_id)
+        return None if row is None else self._entity(row)
+
+    def iter_entities(self) -> Iterator[Entity]:
+        """Entities in the order they were added to the original graph."""
+        for row in self._columns["entity_order"]:
+            entity = self._entity(row)
+            if entity is not None:
+                yield entity
+
+    def get_relations(
+        self,
+        src_id: Optional[str] = None,
+        relation: Optional[str] = None,
+        dst_id: Optional[str] = None,
+    ) -> List[Edge]:
+        wanted: List[Tuple[str, int]] = []
+        filters = (("relation_src", src_id), ("relation_name", relation), ("relation_dst", dst_id))
+        for name, value in filters:
+            if value is not None:
+                index = self.string_index(value)
+                if index is None:
+                    return []
+                wanted.append((name, index))
+        if dst_id is not None:
+            positions = self._range("relation_by_dst", "relation_dst", wanted[-1][1])
+        elif src_id is not None:
+            positions = self._range("relation_by_src", "relation_src", wanted[0][1])
+        else:
+            positions = range(self.relation_count)
+        columns = self._columns
+        return [
+            (
+                self.string(columns["relation_src"][position]),
+                self.string(columns["relation_name"][position]),
+                self.string(columns["relation_dst"][position]),
+            )
+            for position in positions
+            if all(columns[name][position] == index for name, index in wanted)
+        ]
+
+    def to_graph(self) -> OntologyGraph:
+        graph = OntologyGraph()
+        for entity in self.iter_entities():
+            graph.add_entity(entity)
+        columns = self._columns
+        strings = [self.string(index) for index in range(self.string_count)]
+        for position in range(self.relation_count):
+            graph.add_relation(
+                strings[columns["relation_src"][position]],
+                strings[columns["relation_name"][position]],
+                strings[columns["relation_dst"][position]],
+            )
+        return graph
+
+    def _range(self, permutation: str, column: str, index: int) -> Sequence[int]:
+        order = self._columns[permutation]
+        values = self._columns[column]
+        keyed = _Keyed(order, values)
+        return order[bisect_left(keyed, index) : bisect_right(keyed, index)]
+
+    def _entity(self, row: int) -> Optional[Entity]:
+        model = MODEL_REGISTRY.get(self.string(self._columns["entity_type"][row]))
+        if model is None:
+            return None
+        offsets = self._columns["payload_offsets"]
+        raw = bytes(self._columns["payload_data"][offsets[row] : offsets[row + 1]])
+        return model.model_validate_json(raw)  # type: ignore[return-value]
+
+    def _column(self, start: int, length: int, typecode: str) -> Sequence[Any]:
+        view = memoryview(self._mmap)[start : start + length]
+        self._views.append(view)
+        if typecode == "B":
+            return view
+        if sys.byteorder == "little":
+            cast = view.cast(typecode)  # type: ignore[call-overload]
+            self._views.append(cast)
+            return cast
+        values = array(typecode, bytes(view))
+        values.byteswap()
+        return values
+
+
+def load_snapshot(path: Path) -> OntologyGraph:
+    with Snapshot(path) as snapshot:
+        return snapshot.to_graph()
+
+
+class _Keyed:
+    """Sequence view of `values[order[i]]`, for bisecting a permutation."""
+
+    def __init__(self, order: Sequence[int], values: Sequence[int]) -> None:
+        self._order = order
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, position: int) -> int:
+        return self._values[self._order[position]]
+
+
+def _inverse(rows: Sequence[int]) -> array:
+    """Map each graph insertion position to its row in the id-sorted columns."""
+    order = array("I", bytes(4 * len(rows)))
+    for row, position in enumerate(rows):
+        order[position] = row
+    return order
+
+
+def _offsets(blobs: Sequence[bytes]) -> array:
+    offsets = array("Q", [0])
+    total = 0
+    for blob in blobs:
+        total += len(blob)
+        offsets.append(total)
+    return offsets
+
+
+def _numeric(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _to_bytes(column: Any) -> bytes:
+    if isinstance(column, bytes):
+        return column
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
@@ -1,15 +1,317 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from ..ontology.graph import Edge, Entity, OntologyGraph
+from ..ontology.models import MODEL_REGISTRY, Argument, Assumption, Claim, Evidence, Source
+from ..utils.text import TokenCache
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    id TEXT PRIMARY KEY,
+    entity_type TEXT NOT NULL,
+    source_id TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entities_type ON entities (entity_type);
+CREATE INDEX IF NOT EXISTS idx_entities_source ON entities (source_id);
+CREATE TABLE IF NOT EXISTS relations (
+    src_id TEXT NOT NULL,
+    relation TEXT NOT NULL,
+    dst_id TEXT NOT NULL,
+    UNIQUE (src_id, relation, dst_id)
+);
+CREATE INDEX IF NOT EXISTS idx_relations_dst ON relations (dst_id, relation);
+CREATE INDEX IF NOT EXISTS idx_relations_relation ON relations (relation);
+"""
+
+_UPSERT_ENTITY = (
+    "INSERT INTO entities (id, entity_type, source_id, payload) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET entity_type = excluded.entity_type, "
+    "source_id = excluded.source_id, payload = excluded.payload"
+)
+_INSERT_RELATION = "INSERT OR IGNORE INTO relations (src_id, relation, dst_id) VALUES (?, ?, ?)"
 
 
 @dataclass
 class SQLiteIndex:
+    """SQLite graph store: one row per entity (JSON payload) and one per relation.
+
+    Rows are read back in insertion order, so scoring a store gives the same results
+    as scoring the in-memory graph it was written from.
+    """
+
     path: Path
+    batch_size: int = 5000
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
 
     def initialize(self) -> None:
-        """Placeholder for future SQLite schema initialization."""
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.path.exists():
-            self.path.touch()
+        """Create the database file, schema and indexes if they do not exist."""
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> "SQLiteIndex":
+        self.initialize()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def add_entities(self, entities: Iterable[Entity]) -> int:
+        rows = (
+            (
+                entity.id,
+                type(entity).__name__,
+                getattr(entity, "source_id", None),
+                json.dumps(entity.model_dump()),
+            )
+            for entity in entities
+        )
+        return self._insert_batches(_UPSERT_ENTITY, rows)
+
+    def add_relations(self, edges: Iterable[Edge]) -> int:
+        return self._insert_batches(_INSERT_RELATION, (tuple(edge) for edge in edges))
+
+    def write_graph(self, graph: OntologyGraph) -> None:
+        self.add_entities(
+            entity for bucket in graph.entities.values() for entity in bucket.values()
+        )
+        self.add_relations(graph.relations)
+
+    def load_graph(self) -> OntologyGraph:
+        graph = OntologyGraph()
+        for entity in self.iter_entities():
+            graph.add_entity(entity)
+        graph.add_relations(self.get_relations())
+        return graph
+
+    def view(self, cache_size: int = 10000) -> "SQLiteGraphView":
+        return SQLiteGraphView(self, cache_size=cache_size)
+
+    def get_entity(self, entity_id: str) -> Optional[Entity]:
+        row = self.connection.execute(
+            "SELECT entity_type, payload FROM entities WHERE id = ?", (entity_id,)
+        ).fetchone()
+        return _decode(row) if row else None
+
+    def get_entity_type(self, entity_id: str) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT entity_type FROM entities WHERE id = ?", (entity_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def iter_entities(self, entity_type: Optional[str] = None) -> Iterator[Entity]:
+        for row in self._select_entities("entity_type, payload", entity_type):
+            entity = _decode(row)
+            if entity is not None:
+                yield entity
+
+    def iter_ids(self, entity_type: Optional[str] = None) -> Iterator[str]:
+        for (entity_id,) in self._select_entities("id", entity_type):
+            yield entity_id
+
+    def entity_types(self) -> List[str]:
+        rows = self.connection.execute("SELECT DISTINCT entity_type FROM entities")
+        return [row[0] for row in rows]
+
+    def count_entities(self, entity_type: Optional[str] = None) -> int:
+        if entity_type is None:
+            row = self.connection.execute("SELECT COUNT(*) FROM entities").fetchone()
+        else:
+            row = self.connection.execute(
+                "SELECT COUNT(*) FROM entities WHERE entity_type = ?", (entity_type,)
+            ).fetchone()
+        return int(row[0])
+
+    def entities_for_source(self, source_id: str) -> List[Entity]:
+        rows = self.connection.execute(
+            "SELECT entity_type, payload FROM entities WHERE source_id = ? ORDER BY rowid",
+            (source_id,),
+        )
+        return [entity for entity in map(_decode, rows) if entity is not None]
+
+    def get_relations(
+        self,
+        src_id: Optional[str] = None,
+        relation: Optional[str] = None,
+        dst_id: Optional[str] = None,
+    ) -> List[Edge]:
+        clauses: List[str] = []
+        params: List[str] = []
+        for column, value in (("src_id", src_id), ("relation", relation), ("dst_id", dst_id)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.connection.execute(
+            f"SELECT src_id, relation, dst_id FROM relations{where} ORDER BY rowid", params
+        )
+        return [tuple(row) for row in rows]  # type: ignore[misc]
+
+    def _select_entities(self, columns: str, entity_type: Optional[str]) -> Iterator[Any]:
+        if entity_type is None:
+            return self.connection.execute(f"SELECT {columns} FROM entities ORDER BY rowid")
+        return self.connection.execute(
+            f"SELECT {columns} FROM entities WHERE entity_type = ? ORDER BY rowid",
+            (entity_type,),
+        )
+
+    def _insert_batches(self, statement: str, rows: Iterable[Tuple[Any, ...]]) -> int:
+        connection = self.connection
+        total = 0
+        batch: List[Tuple[Any, ...]] = []
+        with connection:
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    connection.executemany(statement, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                connection.executemany(statement, batch)
+                total += len(batch)
+        return total
+
+
+class SQLiteGraphView:
+    """Read-only, `OntologyGraph`-compatible view that loads entities on demand.
+
+    Supports the accessors used by scoring (`get_entity`, typed getters,
+    `get_relations`, `entities`), so `score_graph` runs directly against a store.
+    Recently loaded entities are kept in a bounded LRU cache.
+    """
+
+    def __init__(self, index: SQLiteIndex, cache_size: int = 10000) -> None:
+        self.index = index
+        self.cache_size = cache_size
+        self.token_cache = TokenCache()
+        self.entities = _EntityTypes(self)
+        self._cache: "OrderedDict[str, Optional[Entity]]" = OrderedDict()
+
+    def get_entity(self, entity_id: str) -> Optional[Entity]:
+        cache = self._cache
+        if entity_id in cache:
+            cache.move_to_end(entity_id)
+            return cache[entity_id]
+        entity = self.index.get_entity(entity_id)
+        self._remember(entity_id, entity)
+        return entity
+
+    def get_entity_type(self, entity_id: str) -> Optional[str]:
+        entity = self.get_entity(entity_id)
+        return type(entity).__name__ if entity is not None else None
+
+    def has_entity(self, entity_id: str) -> bool:
+        return self.get_entity(entity_id) is not None
+
+    def get_source(self, entity_id: str) -> Optional[Source]:
+        entity = self.get_entity(entity_id)
+        return entity if isinstance(entity, Source) else None
+
+    def get_claim(self, entity_id: str) -> Optional[Claim]:
+        entity = self.get_entity(entity_id)
+        return entity if isinstance(entity, Claim) else None
+
+    def get_evidence(self, entity_id: str) -> Optional[Evidence]:
+        entity = self.get_entity(entity_id)
+        return entity if isinstance(entity, Evidence) else None
+
+    def get_assumption(self, entity_id: str) -> Optional[Assumption]:
+        entity = self.get_entity(entity_id)
+        return entity if isinstance(entity, Assumption) else None
+
+    def get_argument(self, entity_id: str) -> Optional[Argument]:
+        entity = self.get_entity(entity_id)
+        return entity if isinstance(entity, Argument) else None
+
+    def get_relations(
+        self,
+        src_id: Optional[str] = None,
+        relation: Optional[str] = None,
+        dst_id: Optional[str] = None,
+    ) -> List[Edge]:
+        return self.index.get_relations(src_id, relation, dst_id)
+
+    @property
+    def relations(self) -> List[Edge]:
+        return self.index.get_relations()
+
+    def _remember(self, entity_id: str, entity: Optional[Entity]) -> None:
+        self._cache[entity_id] = entity
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+class _EntityTypes(Mapping):
+    """`view.entities`: entity type -> lazily loaded bucket."""
+
+    def __init__(self, view: SQLiteGraphView) -> None:
+        self._view = view
+
+    def __getitem__(self, entity_type: str) -> "_EntityBucket":
+        if entity_type not in MODEL_REGISTRY:
+            raise KeyError(entity_type)
+        return _EntityBucket(self._view, entity_type)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._view.index.entity_types())
+
+    def __len__(self) -> int:
+        return len(self._view.index.entity_types())
+
+
+class _EntityBucket(Mapping):
+    """Entities of one type, streamed from the store in insertion order."""
+
+    def __init__(self, view: SQLiteGraphView, entity_type: str) -> None:
+        self._view = view
+        self._entity_type = entity_type
+
+    def __getitem__(self, entity_id: str) -> Entity:
+        entity = self._view.get_entity(entity_id)
+        if entity is None or type(entity).__name__ != self._entity_type:
+            raise KeyError(entity_id)
+        return entity
+
+    def __iter__(self) -> Iterator[str]:
+        return self._view.index.iter_ids(self._entity_type)
+
+    def __len__(self) -> int:
+        return self._view.index.count_entities(self._entity_type)
+
+    def values(self) -> Iterator[Entity]:  # type: ignore[override]
+        for entity in self._view.index.iter_entities(self._entity_type):
+            self._view._remember(entity.id, entity)
+            yield entity
+
+    def items(self) -> Iterator[Tuple[str, Entity]]:  # type: ignore[override]
+        for entity in self.values():
+            yield entity.id, entity
+
+
+def _decode(row: Tuple[str, str]) -> Optional[Entity]:
+    model = MODEL_REGISTRY.get(row[0])
+    if model is None:
+        return None
+    return model.model_validate_json(row[1])  # type: ignore[return-value]
@@ -0,0 +1,378 @@
+"""Consolidated stores for reasoning traces.
+
+`TraceLogger` writes one indented JSON file per trace by default, which does not
+scale to large runs. The sinks here stream traces into a single store as they
+are produced instead:
+
+* `JsonlTraceSink` appends one JSON line per trace to a segment file (gzip when
+  the path ends in `.gz`) and keeps a `<segment>.idx` sidecar mapping each
+  subject id to the offset of its line (or, compressed, of its gzip member).
+* `SQLiteTraceSink` writes a `traces` table indexed by subject id, plus
+  `trace_steps` (indexed by rule id) and `trace_uncertainties` tables.
+
+`open_trace_reader` returns the matching reader for a store; `get` fetches one
+subject's most recent trace without scanning the whole store.
+"""
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import sqlite3
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..ontology.models import ExplanationTrace
+
+SINK_JSON = "json"
+SINK_JSONL = "jsonl"
+SINK_JSONL_GZ = "jsonl.gz"
+SINK_SQLITE = "sqlite"
+TRACE_SINKS = (SINK_JSON, SINK_JSONL, SINK_JSONL_GZ, SINK_SQLITE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS traces (
+    id TEXT NOT NULL,
+    subject_id TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_traces_subject ON traces (subject_id);
+CREATE TABLE IF NOT EXISTS trace_steps (
+    trace_rowid INTEGER NOT NULL,
+    subject_id TEXT NOT NULL,
+    rule_id TEXT NOT NULL,
+    delta REAL NOT NULL,
+    resulting_score REAL
+);
+CREATE INDEX IF NOT EXISTS idx_trace_steps_rule ON trace_steps (rule_id);
+CREATE TABLE IF NOT EXISTS trace_uncertainties (
+    trace_rowid INTEGER NOT NULL,
+    subject_id TEXT NOT NULL,
+    note TEXT NOT NULL,
+    severity REAL
+);
+"""
+
+_INSERT_TRACE = "INSERT INTO traces (id, subject_id, payload) VALUES (?, ?, ?)"
+_INSERT_STEP = (
+    "INSERT INTO trace_steps (trace_rowid, subject_id, rule_id, delta, resulting_score) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_INSERT_UNCERTAINTY = (
+    "INSERT INTO trace_uncertainties (trace_rowid, subject_id, note, severity) "
+    "VALUES (?, ?, ?, ?)"
+)
+# zlib level 6, as for JSONL graph files.
+_GZIP_LEVEL = 6
+
+
+class TraceSink:
+    """Destination for exported traces; `TraceLogger` streams into one."""
+
+    path: Path
+
+    def write(self, trace: ExplanationTrace) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Persist buffered traces."""
+
+    def close(self) -> None:
+        self.flush()
+
+    def outputs(self) -> List[Path]:
+        """Files written so far."""
+        return [self.path]
+
+    def __enter__(self) -> "TraceSink":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+@dataclass
+class JsonDirectorySink(TraceSink):
+    """One indented JSON file per trace, as `TraceLogger` writes without a sink."""
+
+    path: Path
+    timestamp: str = ""
+    _written: List[Path] = field(default_factory=list, init=False, repr=False)
+
+    def write(self, trace: ExplanationTrace) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        target = self.path / f"trace_{trace.subject_id}_{self.timestamp}.json"
+        with target.open("w", encoding="utf-8") as handle:
+            json.dump(trace.model_dump(), handle, indent=2)
+        self._written.append(target)
+
+    def outputs(self) -> List[Path]:
+        return list(self._written)
+
+
+@dataclass
+class JsonlTraceSink(TraceSink):
+    """Append-only JSON Lines trace segment with a subject offset index.
+
+    Traces are buffered and written every `buffer_size` traces; a gzip segment
+    gets one gzip member per write so readers can seek straight to it.
+    """
+
+    path: Path
+    buffer_size: int = 1000
+    _buffer: List[Tuple[str, str]] = field(default_factory=list, init=False, repr=False)
+    _handle: Optional[IO[bytes]] = field(default=None, init=False, repr=False)
+    _index: Optional[IO[str]] = field(default=None, init=False, repr=False)
+
+    @property
+    def compressed(self) -> bool:
+        return self.path.suffix == ".gz"
+
+    def write(self, trace: ExplanationTrace) -> None:
+        line = json.dumps(trace.model_dump(), separators=(",", ":")) + "\n"
+        self._buffer.append((trace.subject_id, line))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        handle, index = self._open()
+        offset = handle.tell()
+        if self.compressed:
+            handle.write(
+                gzip.compress(
+                    "".join(line for _, line in self._buffer).encode("utf-8"),
+                    compresslevel=_GZIP_LEVEL,
+                )
+            )
+            index.writelines(f"{subject_id}\t{offset}\n" for subject_id, _ in self._buffer)
+        else:
+            for subject_id, line in self._buffer:
+                index.write(f"{subject_id}\t{offset}\n")
+                offset += handle.write(line.encode("utf-8"))
+        self._buffer.clear()
+        handle.flush()
+        index.flush()
+
+    def close(self) -> None:
+        self.flush()
+        for stream in (self._handle, self._index):
+            if stream is not None:
+                stream.close()
+        self._handle = None
+        self._index = None
+
+    def _open(self) -> Tuple[IO[bytes], IO[str]]:
+        if self._handle is None or self._index is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("ab")
+            self._index = index_path(self.path).open("a", encoding="utf-8")
+        return self._handle, self._index
+
+
+@dataclass
+class SQLiteTraceSink(TraceSink):
+    """Trace store in SQLite; rows are committed every `batch_size` traces."""
+
+    path: Path
+    batch_size: int = 1000
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+    _pending: int = field(default=0, init=False, repr=False)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = _connect(self.path)
+        return self._connection
+
+    def write(self, trace: ExplanationTrace) -> None:
+        payload = json.dumps(trace.model_dump(), separators=(",", ":"))
+        cursor = self.connection.execute(_INSERT_TRACE, (trace.id, trace.subject_id, payload))
+        rowid = cursor.lastrowid
+        self.connection.executemany(
+            _INSERT_STEP,
+            [
+                (rowid, trace.subject_id, step.rule_id, step.delta, step.resulting_score)
+                for step in trace.steps
+            ],
+        )
+        self.connection.executemany(
+            _INSERT_UNCERTAINTY,
+            [
+                (rowid, trace.subject_id, marker.note, marker.severity)
+                for marker in trace.uncertainty_markers
+            ],
+        )
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def open_trace_sink(kind: str, log_dir: Path, timestamp: str) -> TraceSink:
+    """Sink of `kind` (see `TRACE_SINKS`) writing under `log_dir`."""
+    if kind == SINK_JSON:
+        return JsonDirectorySink(log_dir, timestamp)
+    if kind in (SINK_JSONL, SINK_JSONL_GZ):
+        return JsonlTraceSink(log_dir / f"traces_{timestamp}.{kind}")
+    if kind == SINK_SQLITE:
+        return SQLiteTraceSink(log_dir / "traces.db")
+    raise ValueError(f"Unknown trace sink {kind!r}; expected one of {TRACE_SINKS}")
+
+
+def index_path(segment: Path) -> Path:
+    return segment.with_name(f"{segment.name}.idx")
+
+
+@dataclass
+class JsonlTraceReader:
+    """Reads a `JsonlTraceSink` segment; `get` seeks using the offset index."""
+
+    path: Path
+    _offsets: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+
+    def close(self) -> None:
+        self._offsets = None
+
+    def iter_traces(self) -> Iterator[ExplanationTrace]:
+        for line in self._lines():
+            yield ExplanationTrace.model_validate_json(line)
+
+    def iter_payloads(self) -> Iterator[dict]:
+        """Raw trace dicts, skipping pydantic validation."""
+        for line in self._lines():
+            yield json.loads(line)
+
+    def get(self, subject_id: str) -> Optional[ExplanationTrace]:
+        """Most recent trace for `subject_id`, or None."""
+        offsets = self._load_offsets()
+        if offsets is None:
+            found = None
+            for trace in self.iter_traces():
+                if trace.subject_id == subject_id:
+                    found = trace
+            return found
+        offset = offsets.get(subject_id)
+        if offset is None:
+            return None
+        with self.path.open("rb") as raw:
+            raw.seek(offset)
+            if self.path.suffix != ".gz":
+                return ExplanationTrace.model_validate_json(raw.readline())
+            found = None
+            # Members hold one flush each; a subject written twice in one flush keeps its last.
+            for line in io.TextIOWrapper(_single_member(raw), encoding="utf-8"):
+                payload = json.loads(line)
+                if payload["subject_id"] == subject_id:
+                    found = payload
+            return ExplanationTrace.model_validate(found) if found is not None else None
+
+    def _lines(self) -> Iterator[str]:
+        if self.path.suffix == ".gz":
+            handle: IO[str] = gzip.open(self.path, "rt", encoding="utf-8")  # type: ignore[assignment]
+        else:
+            handle = self.path.open("r", encoding="utf-8")
+        with handle:
+            for line in handle:
+                if line.strip():
+                    yield line
+
+    def _load_offsets(self) -> Optional[Dict[str, int]]:
+        if self._offsets is None:
+            index = index_path(self.path)
+            if not index.exists():
+                return None
+            offsets: Dict[str, int] = {}
+            with index.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    subject_id, _, offset = line.rstrip("\n").rpartition("\t")
+                    offsets[subject_id] = int(offset)
+            self._offsets = offsets
+        return self._offsets
+
+
+@dataclass
+class SQLiteTraceReader:
+    """Reads a `SQLiteTraceSink` database."""
+
+    path: Path
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = _connect(self.path)
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def iter_traces(self) -> Iterator[ExplanationTrace]:
+        for (payload,) in self.connection.execute("SELECT payload FROM traces ORDER BY rowid"):
+            yield ExplanationTrace.model_validate_json(payload)
+
+    def iter_payloads(self) -> Iterator[dict]:
+        for (payload,) in self.connection.execute("SELECT payload FROM traces ORDER BY rowid"):
+            yield json.loads(payload)
+
+    def get(self, subject_id: str) -> Optional[ExplanationTrace]:
+        row = self.connection.execute(
+            "SELECT payload FROM traces WHERE subject_id = ? ORDER BY rowid DESC LIMIT 1",
+            (subject_id,),
+        ).fetchone()
+        return ExplanationTrace.model_validate_json(row[0]) if row is not None else None
+
+    def subjects_for_rule(self, rule_id: str) -> List[str]:
+        """Subjects with at least one step from `rule_id`, in write order."""
+        rows = self.connection.execute(
+            "SELECT subject_id FROM trace_steps WHERE rule_id = ? "
+            "GROUP BY subject_id ORDER BY MIN(rowid)",
+            (rule_id,),
+        )
+        return [subject_id for (subject_id,) in rows]
+
+
+TraceReader = Union[JsonlTraceReader, SQLiteTraceReader]
+
+
+def open_trace_reader(path: Path) -> TraceReader:
+    """Reader for a trace store, chosen by file suffix (`.db` is SQLite)."""
+    if path.suffix == ".db":
+        return SQLiteTraceReader(path)
+    return JsonlTraceReader(path)
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _single_member(raw: IO[bytes]) -> IO[bytes]:
+    """Decompress only the gzip member starting at the current position."""
+    inflater = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    chunks: List[bytes] = []
+    while not inflater.eof:
+        block = raw.read(64 * 1024)
+        if not block:
+            break
+        chunks.append(inflater.decompress(block))
+    return io.BytesIO(b"".join(chunks))
@@ -0,0 +1 @@
+"""Seeded synthetic graphs and documents for load tests and benchmarks."""
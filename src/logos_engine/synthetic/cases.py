@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from ..ontology.graph import Edge, Entity
+from ..storage.json_graph_store import ENTITY_RECORD, write_records
+from ..storage.sqlite_index import SQLiteIndex
+from .documents import write_document
+from .graphs import SyntheticGraphSpec, iter_graph_items, iter_graph_records
+
+FORMAT_JSONL = "jsonl"
+FORMAT_JSONL_GZ = "jsonl.gz"
+FORMAT_SQLITE = "db"
+GRAPH_FORMATS = (FORMAT_JSONL, FORMAT_JSONL_GZ, FORMAT_SQLITE)
+
+
+@dataclass(frozen=True)
+class CaseSpec:
+    """A synthetic case: one document and one pre-built graph, both seeded."""
+
+    graph: SyntheticGraphSpec = field(default_factory=SyntheticGraphSpec)
+    paragraphs: int = 100
+    sentences_per_paragraph: int = 5
+    claim_density: float = 0.5
+    graph_format: str = FORMAT_JSONL_GZ
+
+    def __post_init__(self) -> None:
+        if self.graph_format not in GRAPH_FORMATS:
+            raise ValueError(
+                f"Unknown graph format {self.graph_format!r}; expected one of {GRAPH_FORMATS}"
+            )
+
+
+def write_case(directory: Path, spec: CaseSpec) -> Dict[str, Any]:
+    """Write `document.txt`, `graph.<format>` and a `case.json` manifest to `directory`.
+
+    The graph is streamed to disk, so cases far larger than memory can be written.
+    Returns the manifest.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    seed = spec.graph.seed
+    document_bytes = write_document(
+        directory / "document.txt",
+        paragraphs=spec.paragraphs,
+        sentences_per_paragraph=spec.sentences_per_paragraph,
+        claim_density=spec.claim_density,
+        seed=seed,
+    )
+    graph_path = directory / f"graph.{spec.graph_format}"
+    if graph_path.exists():
+        graph_path.unlink()
+    counts = {"entities": 0, "relations": 0}
+    if spec.graph_format == FORMAT_SQLITE:
+        with SQLiteIndex(graph_path) as store:
+            _write_sqlite(store, iter_graph_items(spec.graph), counts)
+    else:
+        write_records(_counted(iter_graph_records(spec.graph), counts), graph_path)
+
+    manifest = {
+        "seed": seed,
+        "spec": asdict(spec),
+        "document": "document.txt",
+        "document_bytes": document_bytes,
+        "graph": graph_path.name,
+        **counts,
+    }
+    (directory / "case.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def write_cases(
+    output_dir: Path,
+    spec: CaseSpec,
+    count: int = 1,
+    progress: Optional[Callable[[Path, Dict[str, Any]], None]] = None,
+) -> List[Path]:
+    """Write `count` cases seeded `spec.graph.seed`, `+1`, ... into `output_dir/case_<seed>`."""
+    directories: List[Path] = []
+    for offset in range(count):
+        case_spec = replace(spec, graph=replace(spec.graph, seed=spec.graph.seed + offset))
+        directory = output_dir / f"case_{case_spec.graph.seed:06d}"
+        manifest = write_case(directory, case_spec)
+        directories.append(directory)
+        if progress is not None:
+            progress(directory, manifest)
+    return directories
+
+
+def _write_sqlite(
+    store: SQLiteIndex, items: Iterable[Union[Entity, Edge]], counts: Dict[str, int]
+) -> None:
+    """Write graph items in one pass, buffering at most `store.batch_size` of each kind."""
+    entities: List[Entity] = []
+    edges: List[Edge] = []
+    for item in items:
+        if isinstance(item, tuple):
+            edges.append(item)
+            if len(edges) >= store.batch_size:
+                counts["relations"] += store.add_relations(edges)
+                edges = []
+        else:
+            entities.append(item)
+            if len(entities) >= store.batch_size:
+                counts["entities"] += store.add_entities(entities)
+                entities = []
+    counts["entities"] += store.add_entities(entities)
+    counts["relations"] += store.add_relations(edges)
+
+
+def _counted(
+    records: Iterator[Dict[str, Any]], counts: Dict[str, int]
+) -> Iterator[Dict[str, Any]]:
+    for record in records:
+        counts["entities" if record["kind"] == ENTITY_RECORD else "relations"] += 1
+        yield record
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Iterator
+
+# Claim sentences use the claim extractor's cue words; neutral sentences avoid them.
+_SUBJECTS = ("The intervention", "The sample", "The model", "The survey", "The trial", "The method")
+_MODALS = ("should", "must", "will")
+_CLAIMS = (
+    "improve outcomes", "generalize to new cohorts", "reduce error", "be robust",
+    "be reproducible", "inform policy",
+)
+_NEUTRAL = (
+    "was measured in {year}", "appears in table {number}", "was described by the authors",
+    "was collected over {number} weeks", "was reviewed by {number} coders",
+)
+
+
+def iter_paragraphs(
+    paragraphs: int = 10,
+    sentences_per_paragraph: int = 5,
+    claim_density: float = 0.5,
+    seed: int = 0,
+) -> Iterator[str]:
+    """Generated paragraphs; `claim_density` is the share of claim-like sentences."""
+    rng = random.Random(seed)
+    for _ in range(paragraphs):
+        yield " ".join(
+            _claim_sentence(rng) if rng.random() < claim_density else _neutral_sentence(rng)
+            for _ in range(sentences_per_paragraph)
+        )
+
+
+def generate_document(
+    paragraphs: int = 10,
+    sentences_per_paragraph: int = 5,
+    claim_density: float = 0.5,
+    seed: int = 0,
+) -> str:
+    """Plain-text document of generated sentences, paragraphs separated by blank lines."""
+    return "\n\n".join(iter_paragraphs(paragraphs, sentences_per_paragraph, claim_density, seed))
+
+
+def write_document(
+    path: Path,
+    paragraphs: int = 10,
+    sentences_per_paragraph: int = 5,
+    claim_density: float = 0.5,
+    seed: int = 0,
+) -> int:
+    """Stream `generate_document` to `path` without holding it in memory; returns its size."""
+    size = 0
+    with path.open("w", encoding="utf-8") as handle:
+        for index, paragraph in enumerate(
+            iter_paragraphs(paragraphs, sentences_per_paragraph, claim_density, seed)
+        ):
+            chunk = f"\n\n{paragraph}" if index else paragraph
+            size += handle.write(chunk)
+    return size
+
+
+def _claim_sentence(rng: random.Random) -> str:
+    return f"{rng.choice(_SUBJECTS)} {rng.choice(_MODALS)} {rng.choice(_CLAIMS)}."
+
+
+def _neutral_sentence(rng: random.Random) -> str:
+    body = rng.choice(_NEUTRAL).format(year=rng.randint(1990, 2024), number=rng.randint(2, 40))
+    return f"{rng.choice(_SUBJECTS)} {body}."
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+from ..ontology.graph import Edge, Entity, OntologyGraph
+from ..ontology.models import Argument, Assumption, Claim, Evidence, Source
+from ..ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
+from ..storage.json_graph_store import ENTITY_RECORD, RELATION_RECORD
+
+EVIDENCE_TYPES = ("empirical", "anecdotal", "expert", "unknown")
+
+_SUBJECTS = (
+    "the intervention", "the sample", "the model", "the survey", "the policy",
+    "the trial", "the dataset", "the method", "the framework", "the estimate",
+)
+_PREDICATES = (
+    "improves outcomes", "is representative", "generalizes", "reduces error",
+    "is robust", "holds across cohorts", "is reproducible", "matters for policy",
+)
+
+
+@dataclass(frozen=True)
+class SyntheticGraphSpec:
+    """Shape of a generated graph; the same spec always yields the same graph."""
+
+    claims: int = 100
+    evidence_per_claim: int = 3
+    # Expected number of assumptions per claim (may exceed 1).
+    assumption_density: float = 0.5
+    # Each claim-level assumption rests on a chain of this many assumptions in total.
+    assumption_chain: int = 1
+    # Share of evidence edges that challenge rather than support their claim.
+    challenge_ratio: float = 0.25
+    evidence_types: Tuple[str, ...] = EVIDENCE_TYPES
+    claims_per_source: int = 50
+    seed: int = 0
+
+
+def iter_graph_items(spec: SyntheticGraphSpec) -> Iterator[Union[Entity, Edge]]:
+    """Stream the entities and edges of the graph for `spec`, one claim at a time."""
+    rng = random.Random(spec.seed)
+    claims_per_source = max(spec.claims_per_source, 1)
+    source_id = ""
+    for index in range(spec.claims):
+        if index % claims_per_source == 0:
+            source_id = f"source_{index // claims_per_source:07d}"
+            yield Source(id=source_id, title=f"Synthetic {source_id}", source_type="synthetic")
+        claim_id = f"claim_{index:07d}"
+        yield Claim(id=claim_id, text=sentence(rng), source_id=source_id)
+
+        evidence_ids: List[str] = []
+        for position in range(spec.evidence_per_claim):
+            evidence_id = f"evidence_{index:07d}_{position:03d}"
+            challenges = rng.random() < spec.challenge_ratio
+            yield Evidence(
+                id=evidence_id,
+                text=sentence(rng),
+                evidence_type=rng.choice(spec.evidence_types),
+                source_id=source_id,
+                polarity=-1 if challenges else 1,
+            )
+            yield (evidence_id, CHALLENGES if challenges else SUPPORTS, claim_id)
+            evidence_ids.append(evidence_id)
+
+        assumption_ids: List[str] = []
+        for position in range(_count(rng, spec.assumption_density)):
+            target = claim_id
+            for depth in range(max(spec.assumption_chain, 1)):
+                assumption_id = f"assumption_{index:07d}_{position:03d}"
+                if depth:
+                    assumption_id = f"{assumption_id}_{depth:02d}"
+                yield Assumption(id=assumption_id, text=sentence(rng), source_id=source_id)
+                yield (assumption_id, UNDERLIES, target)
+                if not depth:
+                    assumption_ids.append(assumption_id)
+                target = assumption_id
+
+        yield Argument(
+            id=f"argument_{index:07d}",
+            claim_id=claim_id,
+            evidence_ids=evidence_ids,
+            assumption_ids=assumption_ids,
+        )
+
+
+def generate_graph(spec: SyntheticGraphSpec) -> OntologyGraph:
+    """Build a graph with sources, claims, evidence, assumptions and one argument per claim."""
+    graph = OntologyGraph()
+    for item in iter_graph_items(spec):
+        if isinstance(item, tuple):
+            graph.add_relation(*item)
+        else:
+            graph.add_entity(item)
+    return graph
+
+
+def iter_graph_records(spec: SyntheticGraphSpec) -> Iterator[Dict[str, Any]]:
+    """The same graph as JSON Lines records (see `storage.json_graph_store`)."""
+    for item in iter_graph_items(spec):
+        if isinstance(item, tuple):
+            yield {"kind": RELATION_RECORD, "edge": list(item)}
+        else:
+            yield {"kind": ENTITY_RECORD, "type": type(item).__name__, "data": item.model_dump()}
+
+
+def sentence(rng: random.Random) -> str:
+    return f"{rng.choice(_SUBJECTS).capitalize()} {rng.choice(_PREDICATES)}."
+
+
+def _count(rng: random.Random, density: float) -> int:
+    """Whole part of `density`, plus one more with probability of its fraction."""
+    whole = int(density)
+    return whole + (1 if rng.random() < density - whole else 0)
@@ -1,7 +1,115 @@
 from __future__ import annotations
 
+import hashlib
+import itertools
+import os
+import random
+import sys
+import threading
 import uuid
+from pathlib import Path
+from typing import Callable, Optional
 
+CHUNK_SIZE = 1 << 20
 
-def new_id(prefix: str) -> str:
+# `new_id` providers: random UUIDs (the default), a per-process counter, or a
+# seeded generator that gives the same ids on every run with the same seed.
+ID_UUID = "uuid"
+ID_COUNTER = "counter"
+ID_SEEDED = "seeded"
+ID_MODES = (ID_UUID, ID_COUNTER, ID_SEEDED)
+
+IdProvider = Callable[[str], str]
+
+
+def uuid_ids(prefix: str) -> str:
     return f"{prefix}_{uuid.uuid4().hex[:8]}"
+
+
+class CounterIds:
+    """`prefix_<token><n>` ids: a random per-process token plus a hex counter.
+
+    The token is drawn once (and again after a fork), so ids never repeat within a
+    process and are unique across processes without a syscall per id.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def __call__(self, prefix: str) -> str:
+        return f"{prefix}_{self._token}{next(self._counter):x}"
+
+    def _reset(self) -> None:
+        self._token = os.urandom(4).hex()
+        self._counter = itertools.count()
+
+
+class SeededIds:
+    """Deterministic ids from a seeded generator, for tests and replays.
+
+    Ids repeat across runs only if they are requested in the same order.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self, prefix: str) -> str:
+        with self._lock:
+            bits = self._random.getrandbits(64)
+        return f"{prefix}_{bits:016x}"
+
+
+_provider: IdProvider = uuid_ids
+_interning = False
+
+
+def new_id(prefix: str) -> str:
+    return _provider(prefix)
+
+
+def set_id_provider(provider: IdProvider) -> IdProvider:
+    """Use `provider` for `new_id` in this process; returns the previous provider."""
+    global _provider
+    previous = _provider
+    _provider = provider
+    return previous
+
+
+def configure_ids(
+    mode: str = ID_UUID, seed: Optional[int] = None, intern: bool = False
+) -> IdProvider:
+    """Select the `new_id` provider by mode and whether graph keys are interned."""
+    global _interning
+    if mode == ID_UUID:
+        provider: IdProvider = uuid_ids
+    elif mode == ID_COUNTER:
+        provider = CounterIds()
+    elif mode == ID_SEEDED:
+        provider = SeededIds(seed or 0)
+    else:
+        raise ValueError(f"Unknown id mode {mode!r}; expected one of {ID_MODES}")
+    _interning = intern
+    return set_id_provider(provider)
+
+
+def intern_id(value: str) -> str:
+    """`sys.intern(value)` when interning is enabled, so equal ids share one object."""
+    return sys.intern(value) if _interning else value
+
+
+def content_id(prefix: str, *parts: str) -> str:
+    """Id derived from `parts`: the same inputs always give the same id."""
+    digest = hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return f"{prefix}_{digest[:16]}"
+
+
+def file_digest(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    """SHA-256 hex digest of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -1,15 +1,170 @@
 from __future__ import annotations
 
 import re
-from typing import List
+import sys
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
+CLAIM_CUES = ("should", "must", "is", "are", "will")
+# All cue words in one alternation, so each sentence is scanned once.
+CLAIM_PATTERN = re.compile(rf"\b(?:{'|'.join(CLAIM_CUES)})\b", re.IGNORECASE)
+# Sentence end, paragraph break (blank line) or page break (form feed).
+_BOUNDARY = re.compile(r"[.!?](?=\s)|\n[ \t\r]*\n|\f")
+# A paragraph break that may still be completed by the next chunk.
+_PENDING_BREAK = re.compile(r"\n[ \t\r]*\Z")
 
-CLAIM_PATTERN = re.compile(r"\b(?:should|must|is|are|will)\b.*?\.", re.IGNORECASE)
+CHUNK_SIZE = 1 << 16
+MAX_SENTENCE_CHARS = 10000
+
+
+class Sentence(NamedTuple):
+    """A sentence and where it is: 1-based page and paragraph (within the page), and
+    character offsets into the document."""
+
+    text: str
+    page: int
+    paragraph: int
+    start_offset: int
+    end_offset: int
+
+
+def read_chunks(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Read a UTF-8 text file in chunks of `chunk_size` characters."""
+    with path.open("r", encoding="utf-8") as handle:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def iter_sentences(
+    chunks: Iterable[str], max_sentence_chars: int = MAX_SENTENCE_CHARS
+) -> Iterator[Sentence]:
+    """Segment streamed text into sentences in one pass.
+
+    Only the text after the last boundary is buffered. A sentence longer than
+    `max_sentence_chars` is cut every `max_sentence_chars` characters from its
+    start, so the result does not depend on how the text is chunked.
+    """
+    buffer = ""
+    base = 0  # document offset of buffer[0]
+    page = paragraph = 1
+    paragraph_has_text = False
+    for chunk in chunks:
+        buffer += chunk
+        consumed = 0
+        for match in _BOUNDARY.finditer(buffer):
+            marker = match.group(0)
+            end = match.end() if marker in ".!?" else match.start()
+            for sentence in _sentences(
+                buffer, consumed, end, base, page, paragraph, max_sentence_chars
+            ):
+                paragraph_has_text = True
+                yield sentence
+            consumed = match.end()
+            if marker == "\f":
+                page, paragraph, paragraph_has_text = page + 1, 1, False
+            elif marker not in ".!?" and paragraph_has_text:
+                paragraph, paragraph_has_text = paragraph + 1, False
+        # Emit the leading pieces of an overlong pending sentence early; they are
+        # the same pieces `_sentences` cuts once its boundary arrives.
+        pending = _PENDING_BREAK.search(buffer, consumed)
+        limit = pending.start() if pending is not None else len(buffer)
+        while limit - consumed > max_sentence_chars:
+            end = consumed + max_sentence_chars
+            piece = _sentence(buffer, consumed, end, base, page, paragraph)
+            if piece is not None:
+                paragraph_has_text = True
+                yield piece
+            consumed = end
+        buffer = buffer[consumed:]
+        base += consumed
+    yield from _sentences(buffer, 0, len(buffer), base, page, paragraph, max_sentence_chars)
+
+
+def _sentences(
+    buffer: str, start: int, end: int, base: int, page: int, paragraph: int, max_chars: int
+) -> Iterator[Sentence]:
+    """Sentences for `buffer[start:end]`, cut every `max_chars` characters."""
+    while end - start > max_chars:
+        sentence = _sentence(buffer, start, start + max_chars, base, page, paragraph)
+        if sentence is not None:
+            yield sentence
+        start += max_chars
+    sentence = _sentence(buffer, start, end, base, page, paragraph)
+    if sentence is not None:
+        yield sentence
+
+
+def _sentence(
+    buffer: str, start: int, end: int, base: int, page: int, paragraph: int
+) -> Optional[Sentence]:
+    raw = buffer[start:end]
+    text = raw.strip()
+    if not text:
+        return None
+    offset = base + start + (len(raw) - len(raw.lstrip()))
+    return Sentence(" ".join(text.split()), page, paragraph, offset, offset + len(text))
+
+
+def is_claim(text: str) -> bool:
+    return CLAIM_PATTERN.search(text) is not None
+
+
+def iter_claims(sentences: Iterable[Sentence], fallback: int = 3) -> Iterator[Sentence]:
+    """Yield sentences containing a claim cue as they stream past.
+
+    If the document has no cue at all, its first `fallback` sentences are yielded
+    at the end instead; only those are buffered.
+    """
+    found = False
+    first: List[Sentence] = []
+    for sentence in sentences:
+        if is_claim(sentence.text):
+            found = True
+            yield sentence
+        elif not found and len(first) < fallback:
+            first.append(sentence)
+    if not found:
+        yield from first
 
 
 def extract_claims(text: str, limit: int = 3) -> List[str]:
-    matches = [match.group(0).strip() for match in CLAIM_PATTERN.finditer(text)]
-    if matches:
-        return matches[:limit]
-    sentences = [sentence.strip() for sentence in text.split(".") if sentence.strip()]
-    return sentences[:limit]
+    """Claim sentences of an in-memory text (at most `limit`)."""
+    return [sentence.text for sentence in islice(iter_claims(iter_sentences([text])), limit)]
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Lowercased whitespace tokens, interned so repeated words share one string."""
+    return frozenset(sys.intern(token) for token in text.lower().split())
+
+
+@dataclass
+class TokenCache:
+    """Token sets keyed by entity id.
+
+    An entry is rebuilt when the text it was built from no longer matches, so
+    entities replaced or edited in place never return stale tokens.
+    """
+
+    _entries: Dict[str, Tuple[str, FrozenSet[str]]] = field(default_factory=dict)
+
+    def tokens(self, entity_id: str, text: str) -> FrozenSet[str]:
+        entry = self._entries.get(entity_id)
+        if entry is not None and (entry[0] is text or entry[0] == text):
+            return entry[1]
+        tokens = tokenize(text)
+        self._entries[entity_id] = (text, tokens)
+        return tokens
+
+    def invalidate(self, entity_id: str) -> None:
+        self._entries.pop(entity_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,29 @@
+from logos_engine.agents.argument_builder import ArgumentBuilder
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Argument, Assumption, Claim, Evidence
+from logos_engine.ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
+
+
+def test_arguments_only_reference_linked_evidence_and_assumptions():
+    graph = OntologyGraph()
+    for claim_id in ("c1", "c2", "c3"):
+        graph.add_entity(Claim(id=claim_id, text=f"Claim {claim_id}."))
+    for evidence_id in ("e1", "e2", "e3"):
+        graph.add_entity(Evidence(id=evidence_id, text="Evidence.", evidence_type="empirical"))
+    graph.add_entity(Assumption(id="a1", text="Assumption."))
+    graph.add_relation("e1", SUPPORTS, "c1")
+    graph.add_relation("e2", CHALLENGES, "c1")
+    graph.add_relation("e2", SUPPORTS, "c1")
+    graph.add_relation("a1", UNDERLIES, "c1")
+    graph.add_relation("e3", SUPPORTS, "c2")
+    graph.add_relation("c3", SUPPORTS, "c2")
+
+    result = ArgumentBuilder().run(graph, {})
+
+    arguments = [graph.get_argument(argument_id) for argument_id in result.created_entities]
+    assert [(a.claim_id, a.evidence_ids, a.assumption_ids) for a in arguments] == [
+        ("c1", ["e1", "e2"], ["a1"]),
+        ("c2", ["e3"], []),
+        ("c3", [], []),
+    ]
+    assert arguments[0] == Argument.model_validate(arguments[0].model_dump())
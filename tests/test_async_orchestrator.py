@@ -0,0 +1,66 @@
+import asyncio
+
+from logos_engine.agents.async_orchestrator import AsyncOrchestrator
+from logos_engine.agents.base import AgentResult, AsyncAgent
+from logos_engine.agents.orchestrator import Orchestrator
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Source
+
+
+class _SlowSource(AsyncAgent):
+    name = "slow_source"
+    reads = ("path",)
+    produces = ("Source",)
+    active = 0
+    peak = 0
+
+    async def arun(self, graph, context) -> AgentResult:
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        await asyncio.sleep(0.01)
+        cls.active -= 1
+        if context["path"] == "bad":
+            raise ValueError("unreadable")
+        graph.add_entity(Source(id="s1", title=context["path"], source_type="test"))
+        return AgentResult(created_entities=["s1"])
+
+
+def test_async_agent_sync_adapter():
+    graph = OntologyGraph()
+    result = Orchestrator(agents=[_SlowSource()]).run(graph, {"path": "doc"})
+    assert result.created_entities == ["s1"]
+    assert graph.get_source("s1").title == "doc"
+
+
+def test_process_bounds_documents_in_flight():
+    orchestrator = AsyncOrchestrator(agents=[_SlowSource()], max_documents=3, max_pending=2)
+    paths = [f"doc{index}" for index in range(10)] + ["bad"]
+
+    async def collect():
+        return [document async for document in orchestrator.process(paths)]
+
+    _SlowSource.peak = 0
+    documents = asyncio.run(collect())
+
+    assert sorted(document.path for document in documents) == sorted(paths)
+    assert _SlowSource.peak == 3
+    failed = [document for document in documents if document.error]
+    assert [document.path for document in failed] == ["bad"]
+    for document in documents:
+        if not document.error:
+            assert len(document.graph.entities["Source"]) == 1
+
+
+def test_async_pipeline_matches_sync_pipeline(tmp_path):
+    document = tmp_path / "doc.txt"
+    document.write_text("The results are important. The data must be robust.", encoding="utf-8")
+    sync_graph = OntologyGraph()
+    sync_result = Orchestrator().run(sync_graph, {"path": str(document)})
+    async_result = asyncio.run(AsyncOrchestrator().ingest(str(document)))
+
+    assert async_result.error is None
+    assert async_result.notes_for_auditor == sync_result.notes_for_auditor
+    assert {name: len(bucket) for name, bucket in async_result.graph.entities.items()} == {
+        name: len(bucket) for name, bucket in sync_graph.entities.items()
+    }
@@ -0,0 +1,65 @@
+import gzip
+import json
+import time
+
+import pytest
+
+from logos_engine.storage.audit_log import FSYNC_FLUSH, AuditLog, BufferedAuditLog
+
+
+def _events(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_audit_log_appends_events(tmp_path):
+    log = AuditLog(tmp_path / "logs" / "audit.jsonl")
+    log.append({"event": "a"})
+    log.append({"event": "b"})
+    assert [event["event"] for event in _events(log.path)] == ["a", "b"]
+    assert "timestamp" in _events(log.path)[0]
+
+
+def test_buffered_audit_log_batches_until_flush(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    with BufferedAuditLog(path, buffer_size=3, flush_interval=None, fsync=FSYNC_FLUSH) as log:
+        log.append({"event": 1})
+        log.append({"event": 2})
+        assert not path.exists()
+        log.append({"event": 3})
+        assert [event["event"] for event in _events(path)] == [1, 2, 3]
+        log.append({"event": 4})
+    assert [event["event"] for event in _events(path)] == [1, 2, 3, 4]
+
+
+def test_buffered_audit_log_rotates_and_compresses(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    with BufferedAuditLog(path, buffer_size=1, flush_interval=None, max_bytes=200) as log:
+        for index in range(10):
+            log.append({"event": "step", "index": index, "padding": "x" * 40})
+    segments = sorted(tmp_path.glob("audit.*.jsonl.gz"))
+    assert segments
+    indexes = []
+    for segment in segments:
+        with gzip.open(segment, "rt", encoding="utf-8") as handle:
+            indexes.extend(json.loads(line)["index"] for line in handle)
+    if path.exists():
+        indexes.extend(event["index"] for event in _events(path))
+    assert indexes == list(range(10))
+
+
+def test_buffered_audit_log_background_flush(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    log = BufferedAuditLog(path, flush_interval=0.01)
+    try:
+        log.append({"event": "tick"})
+        deadline = time.monotonic() + 5
+        while not (path.exists() and path.stat().st_size) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [event["event"] for event in _events(path)] == ["tick"]
+    finally:
+        log.close()
+
+
+def test_buffered_audit_log_rejects_unknown_fsync_policy(tmp_path):
+    with pytest.raises(ValueError):
+        BufferedAuditLog(tmp_path / "audit.jsonl", flush_interval=None, fsync="sometimes")
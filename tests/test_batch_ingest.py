@@ -0,0 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from logos_engine.agents.batch_ingest import discover_documents, ingest_batch
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Argument, Claim, Evidence
+from logos_engine.ontology.relations import SUPPORTS
+from logos_engine.utils.ids import set_id_provider
+
+
+def test_merge_renames_colliding_ids():
+    left = OntologyGraph()
+    left.add_entity(Claim(id="claim_1", text="Left claim."))
+    left.add_entity(Evidence(id="ev_1", text="Shared evidence.", evidence_type="empirical"))
+    right = OntologyGraph()
+    right.add_entity(Claim(id="claim_1", text="Right claim."))
+    right.add_entity(Evidence(id="ev_1", text="Shared evidence.", evidence_type="empirical"))
+    right.add_entity(Argument(id="arg_1", claim_id="claim_1", evidence_ids=["ev_1"]))
+    right.add_relation("ev_1", SUPPORTS, "claim_1")
+
+    renamed = left.merge(right)
+
+    assert list(renamed) == ["claim_1"]
+    new_id = renamed["claim_1"]
+    assert left.get_claim("claim_1").text == "Left claim."
+    assert left.get_claim(new_id).text == "Right claim."
+    assert len(left.entities["Evidence"]) == 1
+    assert left.get_argument("arg_1").claim_id == new_id
+    assert left.relations == [("ev_1", SUPPORTS, new_id)]
+
+
+def test_merge_skips_fresh_ids_already_in_use():
+    left = OntologyGraph()
+    left.add_entity(Claim(id="claim_1", text="Left claim."))
+    left.add_entity(Claim(id="claim_taken", text="Existing claim."))
+    right = OntologyGraph()
+    right.add_entity(Claim(id="claim_1", text="Right claim."))
+    right.add_entity(Claim(id="claim_incoming", text="Incoming claim."))
+    candidates = iter(["claim_taken", "claim_incoming", "claim_free"])
+    previous = set_id_provider(lambda prefix: next(candidates))
+    try:
+        renamed = left.merge(right)
+    finally:
+        set_id_provider(previous)
+
+    assert renamed == {"claim_1": "claim_free"}
+    assert left.get_claim("claim_taken").text == "Existing claim."
+    assert left.get_claim("claim_incoming").text == "Incoming claim."
+    assert left.get_claim("claim_free").text == "Right claim."
+
+
+def test_ingest_batch_merges_in_input_order(tmp_path):
+    for name, subject in (("b.txt", "Beta"), ("a.txt", "Alpha"), (".hidden.txt", "Hidden")):
+        (tmp_path / name).write_text(f"{subject} results are important.", encoding="utf-8")
+    (tmp_path / "broken.txt").write_bytes(b"\xff\xfe\x00")
+    paths = discover_documents(str(tmp_path))
+    assert [path.name for path in paths] == ["a.txt", "b.txt", "broken.txt"]
+
+    inline = ingest_batch(paths, workers=1)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pooled = ingest_batch(paths, executor=executor)
+
+    assert inline.documents == [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+    assert list(inline.failures) == [str(tmp_path / "broken.txt")]
+    assert pooled.documents == inline.documents
+    assert len(pooled.graph.entities["Claim"]) == len(inline.graph.entities["Claim"]) == 2
+    titles = [source.title for source in inline.graph.entities["Source"].values()]
+    assert titles == ["a.txt", "b.txt"]
+    assert discover_documents(str(tmp_path / "*.txt")) == paths
+
+
+def test_ingest_batch_keeps_claims_of_duplicate_documents(tmp_path):
+    paths = []
+    for name in ("a.txt", "b.txt"):
+        path = tmp_path / name
+        path.write_text("Alpha results are important.", encoding="utf-8")
+        paths.append(path)
+
+    graph = ingest_batch(paths, workers=1).graph
+
+    assert graph.validate() == []
+    sources = list(graph.entities["Source"].values())
+    assert [source.title for source in sources] == ["a.txt", "b.txt"]
+    claims = list(graph.entities["Claim"].values())
+    assert sorted(claim.source_id for claim in claims) == sorted(source.id for source in sources)
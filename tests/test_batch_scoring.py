@@ -0,0 +1,85 @@
+from pathlib import Path
+
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Argument, Assumption, Claim, Evidence
+from logos_engine.ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
+from logos_engine.reasoning.batch import score_graph
+from logos_engine.reasoning.scoring import compute_argument_strength, compute_claim_confidence
+from logos_engine.rules import builtin_rules
+from logos_engine.rules.rulebook import Rulebook
+
+
+def _build_graph() -> OntologyGraph:
+    graph = OntologyGraph()
+    graph.add_entity(Claim(id="c1", text="The system is reliable."))
+    graph.add_entity(Claim(id="c2", text="The rollout will succeed."))
+    graph.add_entity(Evidence(id="e1", text="The system passed tests.", evidence_type="empirical"))
+    graph.add_entity(Evidence(id="e2", text="A user saw a crash.", evidence_type="anecdotal"))
+    graph.add_entity(Evidence(id="e3", text="Forum post.", evidence_type="blog", polarity=-1))
+    graph.add_entity(Assumption(id="a1", text="Tests are representative."))
+    graph.add_relation("e1", SUPPORTS, "c1")
+    graph.add_relation("e2", CHALLENGES, "c1")
+    graph.add_relation("e1", SUPPORTS, "c2")
+    graph.add_relation("e3", CHALLENGES, "c2")
+    graph.add_relation("a1", UNDERLIES, "c1")
+    graph.add_entity(Argument(id="arg1", claim_id="c1", evidence_ids=["e1", "e2"]))
+    graph.add_entity(Argument(id="arg2", claim_id="c2", evidence_ids=["e1", "e3"]))
+    return graph
+
+
+def test_score_graph_matches_scalar_scoring():
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    graph = _build_graph()
+    scores = score_graph(graph, rulebook)
+
+    for claim_id in ("c1", "c2"):
+        confidence, trace = compute_claim_confidence(claim_id, graph, rulebook)
+        assert scores.claim_confidences[claim_id] == confidence
+        assert [step.rule_id for step in scores.traces[claim_id].steps] == [
+            step.rule_id for step in trace.steps
+        ]
+    for argument_id in ("arg1", "arg2"):
+        strength, trace = compute_argument_strength(argument_id, graph, rulebook)
+        assert scores.argument_strengths[argument_id] == strength
+        assert scores.traces[argument_id].subject_id == argument_id
+        assert scores.traces[argument_id].steps[-1].rule_id == builtin_rules.ARGUMENT_STRENGTH
+        assert len(scores.traces[argument_id].steps) == len(trace.steps)
+
+    claim_trace = scores.traces["c1"]
+    assert claim_trace.steps[-1].rule_id != builtin_rules.ARGUMENT_STRENGTH
+    assert len(scores.traces["c2"].uncertainty_markers) == 1
+
+
+def test_score_graph_streams_traces_to_callback():
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    graph = _build_graph()
+    streamed = []
+    scores = score_graph(graph, rulebook, on_trace=streamed.append)
+
+    assert scores.traces == {}
+    assert [trace.subject_id for trace in streamed] == ["c1", "arg1", "c2", "arg2"]
+    expected = score_graph(graph, rulebook)
+    assert scores.claim_confidences == expected.claim_confidences
+    assert scores.argument_strengths == expected.argument_strengths
+    for trace in streamed:
+        assert trace.steps == expected.traces[trace.subject_id].steps
+
+
+def test_score_graph_traces_match_when_arguments_reference_later_evidence():
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    graph = OntologyGraph()
+    graph.add_entity(Claim(id="c1", text="The first claim."))
+    graph.add_entity(Claim(id="c2", text="The second claim."))
+    graph.add_entity(Evidence(id="e2", text="Second claim data.", evidence_type="weird"))
+    graph.add_relation("e2", SUPPORTS, "c2")
+    graph.add_entity(Argument(id="a1", claim_id="c1", evidence_ids=["e2"]))
+
+    scores = score_graph(graph, rulebook)
+
+    for claim_id in ("c1", "c2"):
+        confidence, trace = compute_claim_confidence(claim_id, graph, rulebook)
+        assert scores.claim_confidences[claim_id] == confidence
+        assert scores.traces[claim_id] == trace
+    strength, trace = compute_argument_strength("a1", graph, rulebook)
+    assert scores.argument_strengths["a1"] == strength
+    assert scores.traces["a1"] == trace
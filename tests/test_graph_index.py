@@ -0,0 +1,72 @@
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Claim, Evidence
+from logos_engine.ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
+
+
+def _graph() -> OntologyGraph:
+    graph = OntologyGraph()
+    graph.add_relation("e1", SUPPORTS, "c1")
+    graph.add_relation("e2", CHALLENGES, "c1")
+    graph.add_relation("e1", SUPPORTS, "c2")
+    graph.add_relation("a1", UNDERLIES, "c1")
+    return graph
+
+
+def test_indexed_lookups_match_filters():
+    graph = _graph()
+    assert graph.get_relations(dst_id="c1") == [
+        ("e1", SUPPORTS, "c1"),
+        ("e2", CHALLENGES, "c1"),
+        ("a1", UNDERLIES, "c1"),
+    ]
+    assert graph.get_relations(src_id="e1") == [("e1", SUPPORTS, "c1"), ("e1", SUPPORTS, "c2")]
+    assert graph.get_relations(relation=UNDERLIES, dst_id="c1") == [("a1", UNDERLIES, "c1")]
+    assert graph.get_relations(src_id="e1", dst_id="c2") == [("e1", SUPPORTS, "c2")]
+    assert graph.get_relations(relation=CHALLENGES) == [("e2", CHALLENGES, "c1")]
+    assert len(graph.get_relations()) == 4
+    assert graph.get_relations(dst_id="missing") == []
+
+
+def test_duplicate_and_removal():
+    graph = _graph()
+    assert not graph.add_relation("e1", SUPPORTS, "c1")
+    assert len(graph.relations) == 4
+
+    assert graph.remove_relation("e1", SUPPORTS, "c1")
+    assert not graph.remove_relation("e1", SUPPORTS, "c1")
+    assert not graph.has_relation("e1", SUPPORTS, "c1")
+    assert graph.get_relations(src_id="e1") == [("e1", SUPPORTS, "c2")]
+    assert graph.get_relations(relation=SUPPORTS, dst_id="c1") == []
+    assert len(graph.relations) == 3
+
+
+def test_entity_index_and_typed_accessors():
+    graph = OntologyGraph()
+    claim = Claim(id="c1", text="Claims are indexed.")
+    evidence = Evidence(id="e1", text="Index test.", evidence_type="empirical")
+    graph.add_entity(claim)
+    graph.add_entity(evidence)
+
+    assert graph.get_entity("c1") is claim
+    assert graph.get_entity_type("e1") == "Evidence"
+    assert graph.get_claim("c1") is claim
+    assert graph.get_claim("e1") is None
+    assert graph.get_evidence("e1") is evidence
+    assert graph.get_entity("missing") is None
+
+    replacement = Evidence(id="c1", text="Now evidence.", evidence_type="expert")
+    graph.add_entity(replacement)
+    assert graph.get_claim("c1") is None
+    assert graph.get_evidence("c1") is replacement
+    assert "c1" not in graph.entities["Claim"]
+
+
+def test_constructor_indexes_given_entities_and_relations():
+    claim = Claim(id="c1", text="Indexed claim.")
+    edges = [("e1", SUPPORTS, "c1"), ("e1", SUPPORTS, "c1")]
+    graph = OntologyGraph(entities={"Claim": {"c1": claim}}, relations=edges)
+    assert graph.get_claim("c1") is claim
+    assert graph.relations == [("e1", SUPPORTS, "c1")]
+    assert graph.get_relations(dst_id="c1") == [("e1", SUPPORTS, "c1")]
+    graph.relations.append(("e2", SUPPORTS, "c1"))
+    assert graph.relations == [("e1", SUPPORTS, "c1")]
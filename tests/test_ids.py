@@ -0,0 +1,59 @@
+import sys
+
+import pytest
+
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Claim
+from logos_engine.utils.ids import (
+    ID_COUNTER,
+    ID_SEEDED,
+    CounterIds,
+    SeededIds,
+    configure_ids,
+    new_id,
+    set_id_provider,
+    uuid_ids,
+)
+
+
+@pytest.fixture
+def restore_ids():
+    yield
+    configure_ids()
+
+
+def test_counter_ids_are_unique_and_keep_prefix():
+    first, second = CounterIds(), CounterIds()
+    ids = {first("step") for _ in range(1000)} | {second("step") for _ in range(1000)}
+    assert len(ids) == 2000
+    assert all(value.rsplit("_", 1)[0] == "step" for value in ids)
+
+
+def test_seeded_ids_replay(restore_ids):
+    configure_ids(ID_SEEDED, seed=7)
+    run = [new_id("trace") for _ in range(5)]
+    configure_ids(ID_SEEDED, seed=7)
+    assert [new_id("trace") for _ in range(5)] == run
+    assert run[0] == SeededIds(7)("trace")
+    assert len(set(run)) == 5
+
+
+def test_configure_ids_selects_provider_and_interning(restore_ids):
+    configure_ids(ID_COUNTER, intern=True)
+    assert new_id("step") != new_id("step")
+    graph = OntologyGraph()
+    claim_id = "".join(["claim_", "x"])
+    graph.add_entity(Claim(id=claim_id, text="Trials are robust"))
+    graph.add_relation("".join(["ev_", "1"]), "SUPPORTS", claim_id)
+    key = next(iter(graph._index))
+    assert key is sys.intern("claim_x")
+    src_id, _, dst_id = graph.get_relations()[0]
+    assert src_id is sys.intern("ev_1") and dst_id is key
+    with pytest.raises(ValueError):
+        configure_ids("random")
+
+
+def test_set_id_provider_returns_previous(restore_ids):
+    previous = set_id_provider(lambda prefix: f"{prefix}_fixed")
+    assert previous is uuid_ids
+    assert new_id("step") == "step_fixed"
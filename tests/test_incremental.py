@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Argument, Assumption, Claim, Evidence
+from logos_engine.ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
+from logos_engine.reasoning.incremental import IncrementalScorer
+from logos_engine.reasoning.scoring import compute_argument_strength, compute_claim_confidence
+from logos_engine.rules.rulebook import Rulebook
+
+
+def _assert_matches_scalar(scorer: IncrementalScorer, graph: OntologyGraph, rulebook) -> None:
+    assert set(scorer.claim_confidences) == set(graph.entities.get("Claim", {}))
+    for claim_id, confidence in scorer.claim_confidences.items():
+        assert confidence == compute_claim_confidence(claim_id, graph, rulebook)[0]
+    for argument_id, strength in scorer.argument_strengths.items():
+        assert strength == compute_argument_strength(argument_id, graph, rulebook)[0]
+
+
+def test_incremental_rescoring_tracks_changes():
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    graph = OntologyGraph()
+    for index in range(3):
+        graph.add_entity(Claim(id=f"c{index}", text=f"Claim {index} is supported."))
+    graph.add_entity(Evidence(id="e0", text="Claim 0 data.", evidence_type="empirical"))
+    graph.add_relation("e0", SUPPORTS, "c0")
+    graph.add_entity(Argument(id="arg0", claim_id="c0", evidence_ids=["e0", "e1"]))
+
+    assert not graph.tracking_changes and not graph.take_changes()
+    scorer = IncrementalScorer(graph, rulebook)
+    assert graph.tracking_changes
+    _assert_matches_scalar(scorer, graph, rulebook)
+    assert scorer.refresh() == set()
+
+    graph.add_entity(Evidence(id="e1", text="A failure report.", evidence_type="anecdotal"))
+    graph.add_relation("e1", CHALLENGES, "c0")
+    assert scorer.refresh() == {"c0", "arg0"}
+    _assert_matches_scalar(scorer, graph, rulebook)
+
+    graph.add_entity(Assumption(id="a1", text="Samples are random."))
+    graph.add_relation("a1", UNDERLIES, "c2")
+    assert scorer.refresh() == {"c2"}
+    _assert_matches_scalar(scorer, graph, rulebook)
+
+    graph.add_entity(Evidence(id="e1", text="Claim 0 replicated.", evidence_type="expert"))
+    assert scorer.refresh() == {"c0", "arg0"}
+    _assert_matches_scalar(scorer, graph, rulebook)
+
+    graph.remove_relation("e0", SUPPORTS, "c0")
+    graph.add_entity(Claim(id="c3", text="A new claim."))
+    assert scorer.refresh() == {"c0", "c3", "arg0"}
+    _assert_matches_scalar(scorer, graph, rulebook)
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from logos_engine.agents.batch_ingest import ingest_document
+from logos_engine.agents.orchestrator import Orchestrator
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.storage.ingest_cache import IngestCache
+
+
+def _write(tmp_path: Path, text: str) -> str:
+    path = tmp_path / "doc.txt"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_pipeline_ids_are_content_derived(tmp_path):
+    path = _write(tmp_path, "The model is robust. The data must be representative.")
+    graphs = []
+    for _ in range(2):
+        graph = OntologyGraph()
+        Orchestrator().run(graph, {"path": path})
+        graphs.append(graph)
+    assert graphs[0].to_dict() == graphs[1].to_dict()
+    assert graphs[0].relations == graphs[1].relations
+
+
+
+def test_pipeline_ids_are_namespaced_per_document(tmp_path):
+    text = "The model is robust. The data must be representative."
+    graphs = []
+    for name in ("a.txt", "b.txt"):
+        (tmp_path / name).write_text(text, encoding="utf-8")
+        graph = OntologyGraph()
+        Orchestrator().run(graph, {"path": str(tmp_path / name)})
+        graphs.append(graph)
+
+    first, second = (
+        {entity_id for bucket in graph.entities.values() for entity_id in bucket}
+        for graph in graphs
+    )
+    assert first and not first & second
+    merged = OntologyGraph()
+    assert merged.merge(graphs[0]) == {}
+    assert merged.merge(graphs[1]) == {}
+
+def test_ingest_cache_hits_only_for_unchanged_inputs(tmp_path):
+    cache = IngestCache(tmp_path / "cache")
+    path = _write(tmp_path, "The model is robust. The data must be representative.")
+
+    first = ingest_document(path, cache=cache)
+    second = ingest_document(path, cache=cache)
+    assert not first.cached and second.cached
+    assert second.graph.to_dict() == first.graph.to_dict()
+    assert second.graph.relations == first.graph.relations
+    assert second.notes_for_auditor == first.notes_for_auditor
+    assert second.context["source_id"] == first.context["source_id"]
+    assert second.context["path"] == path
+
+    _write(tmp_path, "The model is fragile.")
+    changed = ingest_document(path, cache=cache)
+    assert not changed.cached
+    assert [claim.text for claim in changed.graph.entities["Claim"].values()] == [
+        "The model is fragile."
+    ]
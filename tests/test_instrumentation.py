@@ -0,0 +1,63 @@
+import asyncio
+import json
+import pstats
+import tracemalloc
+
+from logos_engine.agents.async_orchestrator import AsyncOrchestrator
+from logos_engine.agents.instrumentation import Instrumentation
+from logos_engine.agents.orchestrator import Orchestrator
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.storage.audit_log import AuditLog
+
+
+def test_orchestrator_records_agent_metrics(tmp_path):
+    document = tmp_path / "doc.txt"
+    document.write_text("The results are important. The data must be robust.", encoding="utf-8")
+    audit_path = tmp_path / "audit.jsonl"
+    instrumentation = Instrumentation(
+        track_memory=True,
+        profile_agent="claim_extractor",
+        profile_dir=tmp_path / "profiles",
+        audit_log=AuditLog(audit_path),
+    )
+    orchestrator = Orchestrator(instrumentation=instrumentation)
+    result = orchestrator.run(OntologyGraph(), {"path": str(document)})
+
+    assert [entry.agent for entry in result.metrics] == [
+        agent.name for agent in orchestrator.agents
+    ]
+    by_agent = {entry.agent: entry for entry in result.metrics}
+    assert by_agent["evidence_mapper"].entities_created == 2
+    assert by_agent["evidence_mapper"].relations_created == 2
+    assert all(entry.document == str(document) for entry in result.metrics)
+    assert all(entry.wall_time >= 0 and entry.cpu_time is not None for entry in result.metrics)
+    assert all(entry.peak_memory is not None for entry in result.metrics)
+    assert not tracemalloc.is_tracing()
+
+    profile_path = by_agent["claim_extractor"].profile_path
+    assert profile_path is not None
+    assert pstats.Stats(profile_path).total_calls > 0
+    assert by_agent["evidence_mapper"].profile_path is None
+
+    events = [json.loads(line) for line in audit_path.read_text(encoding="utf-8").splitlines()]
+    assert [event["agent"] for event in events] == [entry.agent for entry in result.metrics]
+    assert all(event["event"] == "agent_metrics" for event in events)
+
+
+def test_async_orchestrator_records_agent_metrics(tmp_path):
+    document = tmp_path / "doc.txt"
+    document.write_text("The results are important.", encoding="utf-8")
+    result = asyncio.run(AsyncOrchestrator().arun(OntologyGraph(), {"path": str(document)}))
+    assert len(result.metrics) == 7
+    assert result.metrics[0].agent == "document_ingestor"
+    assert result.metrics[0].peak_memory is None
+
+
+def test_memory_tracking_leaves_existing_tracing_on():
+    tracemalloc.start()
+    try:
+        instrumentation = Instrumentation(track_memory=True)
+        instrumentation._stop_memory(instrumentation._start_memory())
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
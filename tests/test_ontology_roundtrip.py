@@ -1,8 +1,15 @@
 from pathlib import Path
 
 from logos_engine.ontology.graph import OntologyGraph
-from logos_engine.ontology.models import Claim
-from logos_engine.storage.json_graph_store import load_graph, save_graph
+from logos_engine.ontology.models import Claim, Evidence
+from logos_engine.ontology.relations import SUPPORTS
+from logos_engine.storage.json_graph_store import (
+    load_graph,
+    load_graph_jsonl,
+    read_records,
+    save_graph,
+    save_graph_jsonl,
+)
 from logos_engine.utils.ids import new_id
 
 
@@ -16,3 +23,26 @@ def test_graph_roundtrip(tmp_path):
     loaded = load_graph(path)
 
     assert loaded.get_entity(claim.id) is not None
+
+
+def test_graph_jsonl_roundtrip(tmp_path):
+    graph = OntologyGraph()
+    claim = Claim(id="c1", text="Streaming keeps memory bounded.")
+    evidence = Evidence(id="e1", text="Measured memory.", evidence_type="empirical")
+    graph.add_entity(claim)
+    graph.add_entity(evidence)
+    graph.add_relation(evidence.id, SUPPORTS, claim.id)
+
+    for name in ("graph.jsonl", "graph.jsonl.gz"):
+        path = tmp_path / name
+        progress = []
+        written = save_graph_jsonl(graph, path, progress=progress.append, progress_every=1)
+        assert written == 3
+        assert progress == [1, 2, 3, 3]
+
+        kinds = [record["kind"] for record in read_records(path)]
+        assert kinds == ["entity", "entity", "relation"]
+
+        loaded = load_graph_jsonl(path)
+        assert loaded.to_dict() == graph.to_dict()
+        assert loaded.relations == graph.relations
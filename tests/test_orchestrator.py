@@ -0,0 +1,90 @@
+import threading
+
+from logos_engine.agents.base import AgentResult, BaseAgent
+from logos_engine.agents.orchestrator import Orchestrator
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Claim, Evidence
+from logos_engine.ontology.relations import SUPPORTS
+
+
+class _ClaimWriter(BaseAgent):
+    name = "claim_writer"
+    reads = ()
+    produces = ("Claim",)
+
+    def run(self, graph, context) -> AgentResult:
+        graph.add_entity(Claim(id="c1", text="A claim."))
+        return AgentResult(created_entities=["c1"])
+
+
+class _EvidenceWriter(BaseAgent):
+    reads = ("Claim",)
+
+    def __init__(self, name: str, barrier: threading.Barrier) -> None:
+        self.name = name
+        self.produces = (name,)
+        self.barrier = barrier
+
+    def run(self, graph, context) -> AgentResult:
+        # Both writers must be inside `run` at once, or the barrier times out.
+        self.barrier.wait()
+        evidence_id = f"{self.name}_evidence"
+        graph.add_entity(Evidence(id=evidence_id, text=self.name, evidence_type="empirical"))
+        graph.add_relation(evidence_id, SUPPORTS, "c1")
+        context[self.name] = True
+        return AgentResult(created_entities=[evidence_id])
+
+
+class _Undeclared(BaseAgent):
+    name = "undeclared"
+
+    def run(self, graph, context) -> AgentResult:
+        return AgentResult(notes_for_auditor=[str(len(graph.relations))])
+
+
+def test_default_pipeline_schedule():
+    waves = [[agent.name for agent in wave] for wave in Orchestrator().schedule()]
+    assert waves == [
+        ["document_ingestor"],
+        ["claim_extractor"],
+        ["evidence_mapper", "assumption_detector"],
+        ["argument_builder", "explanation_composer"],
+        ["logic_auditor"],
+    ]
+
+
+def test_independent_agents_run_concurrently_and_merge_in_order():
+    barrier = threading.Barrier(2, timeout=5)
+    orchestrator = Orchestrator(
+        agents=[
+            _ClaimWriter(),
+            _EvidenceWriter("second", barrier),
+            _EvidenceWriter("first", barrier),
+            _Undeclared(),
+        ]
+    )
+    assert [len(wave) for wave in orchestrator.schedule()] == [1, 2, 1]
+
+    graph = OntologyGraph()
+    context: dict = {}
+    result = orchestrator.run(graph, context)
+
+    assert result.created_entities == ["c1", "second_evidence", "first_evidence"]
+    assert result.notes_for_auditor == ["2"]
+    assert list(graph.entities["Evidence"]) == ["second_evidence", "first_evidence"]
+    assert context == {"second": True, "first": True}
+
+
+def test_sequential_run_matches_concurrent_run(tmp_path):
+    document = tmp_path / "doc.txt"
+    document.write_text("The results are important. The data must be robust.", encoding="utf-8")
+    graphs = []
+    for max_workers in (1, 4):
+        graph = OntologyGraph()
+        Orchestrator(max_workers=max_workers).run(graph, {"path": str(document)})
+        graphs.append(graph)
+    sequential, concurrent = graphs
+    assert {name: len(bucket) for name, bucket in sequential.entities.items()} == {
+        name: len(bucket) for name, bucket in concurrent.entities.items()
+    }
+    assert len(sequential.relations) == len(concurrent.relations)
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from logos_engine.rules.rulebook import Rulebook
 
 
@@ -7,3 +9,37 @@ def test_rulebook_loads():
     rulebook = Rulebook.from_path(Path("config/rules.yaml"))
     assert "empirical" in rulebook.evidence_reliability_baselines
     assert rulebook.get_constants()["k"] > 0
+
+
+def test_rulebook_compile():
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    rulebook.relevance_rules.append({"id": "rel.custom.unknown", "adjustment": 0.5})
+    compiled = rulebook.compile()
+
+    assert compiled.k == rulebook.get_constants()["k"]
+    assert compiled.reliability_baseline("empirical") == 0.8
+    assert compiled.reliability_baseline("blog") == rulebook.get_reliability_baseline("blog")
+    assert [rule.rule_id for rule in compiled.relevance_rules] == [
+        "rel.match.title",
+        "rel.scope.mismatch",
+    ]
+    assert [rule.rule_id for rule in compiled.matched_relevance_rules[True]] == [
+        "rel.match.title"
+    ]
+    assert compiled.compile() is compiled
+    with pytest.raises(AttributeError):
+        compiled.k = 1.0  # type: ignore[misc]
+
+
+def test_rulebook_compile_is_cached_until_edited():
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    compiled = rulebook.compile()
+    assert rulebook.compile() is compiled
+
+    rulebook.constants["k"] = 0.9
+    recompiled = rulebook.compile()
+    assert recompiled is not compiled
+    assert recompiled.k == 0.9
+
+    rulebook.relevance_rules[0]["adjustment"] = 0.25
+    assert rulebook.compile().relevance_rules[0].adjustment == 0.25
@@ -1,9 +1,12 @@
 from pathlib import Path
 
+import pytest
+
 from logos_engine.ontology.graph import OntologyGraph
 from logos_engine.ontology.models import Assumption, Claim, Evidence
 from logos_engine.ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
 from logos_engine.reasoning.scoring import compute_claim_confidence
+from logos_engine.reasoning.trace import TRACE_FULL, TRACE_OFF, TRACE_SUMMARY
 from logos_engine.rules import builtin_rules
 from logos_engine.rules.rulebook import Rulebook
 from logos_engine.utils.ids import new_id
@@ -54,3 +57,25 @@ def test_scoring_penalty_and_trace():
     assert 0.0 <= score_with <= 1.0
     assert score_with <= score_without
     assert any(step.rule_id == builtin_rules.CLAIM_CONFIDENCE for step in trace_with.steps)
+
+
+def test_trace_levels_keep_scores():
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    graph = _build_graph(with_assumption=True)
+    claim_id = list(graph.entities["Claim"].keys())[0]
+
+    full_score, full_trace = compute_claim_confidence(claim_id, graph, rulebook, TRACE_FULL)
+    summary_score, summary_trace = compute_claim_confidence(
+        claim_id, graph, rulebook, TRACE_SUMMARY
+    )
+    off_score, off_trace = compute_claim_confidence(claim_id, graph, rulebook, TRACE_OFF)
+
+    assert full_score == summary_score == off_score
+    assert [step.rule_id for step in summary_trace.steps] == [
+        builtin_rules.CLAIM_CONFIDENCE,
+        builtin_rules.ASSUMPTION_PENALTY,
+    ]
+    assert len(full_trace.steps) > len(summary_trace.steps)
+    assert off_trace.steps == [] and off_trace.uncertainty_markers == []
+    with pytest.raises(ValueError):
+        compute_claim_confidence(claim_id, graph, rulebook, "verbose")
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Argument, Claim, Evidence, Span
+from logos_engine.ontology.relations import CHALLENGES, SUPPORTS
+from logos_engine.reasoning.batch import score_graph
+from logos_engine.rules.rulebook import Rulebook
+from logos_engine.storage.snapshot import Snapshot, load_snapshot, write_snapshot
+
+
+def _build_graph() -> OntologyGraph:
+    graph = OntologyGraph()
+    graph.add_entity(Claim(id="c2", text="Later claim.", confidence=0.25))
+    graph.add_entity(Claim(id="c1", text="Café results hold.", span=Span(span_id="s", page=2)))
+    graph.add_entity(
+        Evidence(id="e1", text="Café trial.", evidence_type="empirical", reliability=0.8)
+    )
+    graph.add_entity(Evidence(id="e2", text="Doubt.", evidence_type="anecdotal", polarity=-1))
+    graph.add_entity(Argument(id="arg1", claim_id="c1", evidence_ids=["e1", "e2"]))
+    graph.add_relation("e2", CHALLENGES, "c1")
+    graph.add_relation("e1", SUPPORTS, "c2")
+    graph.add_relation("e1", SUPPORTS, "c1")
+    return graph
+
+
+def test_snapshot_queries_without_loading(tmp_path):
+    graph = _build_graph()
+    path = tmp_path / "graph.snap"
+    write_snapshot(graph, path)
+
+    with Snapshot.open(path) as snapshot:
+        assert snapshot.entity_count == 5
+        assert snapshot.entity_type("e2") == "Evidence"
+        assert snapshot.entity_row("missing") is None
+        assert snapshot.numeric("e1", "reliability") == 0.8
+        assert snapshot.numeric("e2", "reliability") is None
+        assert snapshot.numeric("c2", "confidence") == 0.25
+        assert snapshot.polarity("e2") == -1
+        assert snapshot.get_relations(dst_id="c1") == graph.get_relations(dst_id="c1")
+        assert snapshot.get_relations(src_id="e1") == graph.get_relations(src_id="e1")
+        assert snapshot.get_relations(relation=SUPPORTS, dst_id="c2") == [("e1", SUPPORTS, "c2")]
+        assert snapshot.get_relations(dst_id="nowhere") == []
+        assert snapshot.get_entity("c1") == graph.get_entity("c1")
+
+
+def test_snapshot_load_matches_graph(tmp_path):
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    graph = _build_graph()
+    path = tmp_path / "graph.snap"
+    write_snapshot(graph, path)
+
+    loaded = load_snapshot(path)
+    assert loaded.to_dict() == graph.to_dict()
+    assert loaded.relations == graph.relations
+    assert loaded.get_claim("c1").span.page == 2
+    assert score_graph(loaded, rulebook).claim_confidences == (
+        score_graph(graph, rulebook).claim_confidences
+    )
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Argument, Assumption, Claim, Evidence, Source, Span
+from logos_engine.ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
+from logos_engine.reasoning.batch import score_graph
+from logos_engine.rules.rulebook import Rulebook
+from logos_engine.storage.sqlite_index import SQLiteIndex
+
+
+def _build_graph() -> OntologyGraph:
+    graph = OntologyGraph()
+    graph.add_entity(Source(id="s1", title="Paper", source_type="local_document"))
+    graph.add_entity(
+        Claim(id="c1", text="The method is robust.", source_id="s1", span=Span(span_id="sp1"))
+    )
+    graph.add_entity(Evidence(id="e1", text="Robust in trials.", evidence_type="empirical"))
+    graph.add_entity(Evidence(id="e2", text="One failure.", evidence_type="anecdotal"))
+    graph.add_entity(Assumption(id="a1", text="Trials are representative.", source_id="s1"))
+    graph.add_entity(Argument(id="arg1", claim_id="c1", evidence_ids=["e1", "e2"]))
+    graph.add_relation("e1", SUPPORTS, "c1")
+    graph.add_relation("e2", CHALLENGES, "c1")
+    graph.add_relation("a1", UNDERLIES, "c1")
+    return graph
+
+
+def test_sqlite_store_roundtrip_and_queries(tmp_path):
+    graph = _build_graph()
+    with SQLiteIndex(tmp_path / "graph.db") as store:
+        store.write_graph(graph)
+        store.add_relations([("e1", SUPPORTS, "c1")])
+
+        assert store.count_entities() == 6
+        assert store.count_entities("Evidence") == 2
+        assert store.get_relations(dst_id="c1") == graph.get_relations(dst_id="c1")
+        assert store.get_relations(relation=UNDERLIES) == [("a1", UNDERLIES, "c1")]
+        assert {entity.id for entity in store.entities_for_source("s1")} == {"c1", "a1"}
+        assert store.get_entity("c1") == graph.get_entity("c1")
+
+        loaded = store.load_graph()
+        assert loaded.relations == graph.relations
+        assert loaded.to_dict() == graph.to_dict()
+        journal_mode = store.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == "wal"
+
+
+def test_sqlite_view_scores_like_graph(tmp_path):
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    graph = _build_graph()
+    with SQLiteIndex(tmp_path / "graph.db") as store:
+        store.write_graph(graph)
+        view = store.view(cache_size=2)
+
+        assert view.get_claim("c1") == graph.get_claim("c1")
+        assert view.get_claim("e1") is None
+        assert list(view.entities["Claim"]) == ["c1"]
+        assert len(view.entities["Evidence"]) == 2
+
+        expected = score_graph(graph, rulebook)
+        actual = score_graph(view, rulebook)  # type: ignore[arg-type]
+        assert actual.claim_confidences == expected.claim_confidences
+        assert actual.argument_strengths == expected.argument_strengths
@@ -0,0 +1,61 @@
+import json
+from dataclasses import replace
+
+from logos_engine.ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
+from logos_engine.storage.json_graph_store import load_graph_jsonl
+from logos_engine.storage.sqlite_index import SQLiteIndex
+from logos_engine.synthetic.cases import CaseSpec, write_case, write_cases
+from logos_engine.synthetic.documents import generate_document
+from logos_engine.synthetic.graphs import SyntheticGraphSpec, generate_graph
+
+
+def test_generate_graph_is_seeded_and_shaped():
+    spec = SyntheticGraphSpec(
+        claims=40, evidence_per_claim=2, assumption_density=1.5, challenge_ratio=0.5, seed=7
+    )
+    graph = generate_graph(spec)
+
+    assert generate_graph(spec).to_dict() == graph.to_dict()
+    assert generate_graph(SyntheticGraphSpec(claims=40, seed=8)).to_dict() != graph.to_dict()
+    assert len(graph.entities["Claim"]) == 40
+    assert len(graph.entities["Evidence"]) == 80
+    assert len(graph.entities["Argument"]) == 40
+    assert 40 <= len(graph.entities["Assumption"]) <= 80
+    evidence_edges = graph.get_relations(relation=SUPPORTS) + graph.get_relations(
+        relation=CHALLENGES
+    )
+    assert len(evidence_edges) == 80
+    assert graph.get_relations(relation=CHALLENGES)
+    assert len(graph.get_relations(relation=UNDERLIES)) == len(graph.entities["Assumption"])
+    assert graph.validate() == []
+
+
+def test_generate_document_is_seeded():
+    document = generate_document(paragraphs=3, sentences_per_paragraph=2, seed=1)
+    assert document == generate_document(paragraphs=3, sentences_per_paragraph=2, seed=1)
+    assert document.count("\n\n") == 2
+
+
+def test_write_cases_streams_graphs_that_load_back(tmp_path):
+    graph_spec = SyntheticGraphSpec(claims=30, assumption_density=1.0, assumption_chain=3)
+    directories = write_cases(tmp_path, CaseSpec(graph=graph_spec, paragraphs=4), count=2)
+    assert [directory.name for directory in directories] == ["case_000000", "case_000001"]
+
+    manifest = json.loads((directories[1] / "case.json").read_text(encoding="utf-8"))
+    expected = generate_graph(replace(graph_spec, seed=1))
+    loaded = load_graph_jsonl(directories[1] / manifest["graph"])
+    assert loaded.to_dict() == expected.to_dict()
+    assert loaded.relations == expected.relations
+    assert manifest["entities"] == sum(len(bucket) for bucket in expected.entities.values())
+    assert len(expected.get_relations(relation=UNDERLIES)) == 90
+    assert (directories[0] / "document.txt").read_text(encoding="utf-8").count("\n\n") == 3
+
+    sqlite_case = write_case(
+        tmp_path / "sqlite", CaseSpec(graph=graph_spec, paragraphs=1, graph_format="db")
+    )
+    expected = generate_graph(graph_spec)
+    with SQLiteIndex(tmp_path / "sqlite" / sqlite_case["graph"]) as store:
+        loaded = store.load_graph()
+    assert loaded.to_dict() == expected.to_dict()
+    assert loaded.relations == expected.relations
+    assert sqlite_case["relations"] == len(expected.relations)
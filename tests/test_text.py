@@ -0,0 +1,104 @@
+import random
+
+from logos_engine.agents.claim_extractor import ClaimExtractor
+from logos_engine.agents.document_ingestor import DocumentIngestor
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Claim
+from logos_engine.utils.text import (
+    TokenCache,
+    extract_claims,
+    iter_claims,
+    iter_sentences,
+    tokenize,
+)
+
+
+def test_tokenize_lowercases_and_dedupes():
+    assert tokenize("The data is the Data") == frozenset({"the", "data", "is"})
+
+
+def test_token_cache_reuses_and_refreshes():
+    cache = TokenCache()
+    first = cache.tokens("c1", "Trials are robust")
+    assert cache.tokens("c1", "Trials are robust") is first
+    assert cache.tokens("c1", "Trials are weak") == frozenset({"trials", "are", "weak"})
+    cache.invalidate("c1")
+    assert len(cache) == 0
+
+
+def test_graph_invalidates_tokens_on_add_entity():
+    graph = OntologyGraph()
+    graph.add_entity(Claim(id="c1", text="Old text"))
+    graph.token_cache.tokens("c1", "Old text")
+    graph.add_entity(Claim(id="c1", text="New text"))
+    assert len(graph.token_cache) == 0
+
+
+DOCUMENT = (
+    "Intro text here.  The model is robust. It was run\n\nin 2019! "
+    "Next para must hold.\fPage two should work. no cue"
+)
+
+
+def test_iter_sentences_tracks_spans_across_chunk_sizes():
+    sentences = list(iter_sentences([DOCUMENT]))
+    assert [(s.text, s.page, s.paragraph) for s in sentences] == [
+        ("Intro text here.", 1, 1),
+        ("The model is robust.", 1, 1),
+        ("It was run", 1, 1),
+        ("in 2019!", 1, 2),
+        ("Next para must hold.", 1, 2),
+        ("Page two should work.", 2, 1),
+        ("no cue", 2, 1),
+    ]
+    for sentence in sentences:
+        assert DOCUMENT[sentence.start_offset : sentence.end_offset] == sentence.text
+    for size in (1, 2, 3, 7):
+        chunks = [DOCUMENT[start : start + size] for start in range(0, len(DOCUMENT), size)]
+        assert list(iter_sentences(chunks)) == sentences
+
+
+def test_iter_sentences_cuts_runs_without_boundaries():
+    sentences = list(iter_sentences(["x" * 25], max_sentence_chars=10))
+    assert [len(sentence.text) for sentence in sentences] == [10, 10, 5]
+    assert sentences[-1].start_offset == 20
+
+
+def test_iter_sentences_cuts_overlong_sentences_independently_of_chunking():
+    document = "Short one. " + "x" * 250 + ". tail\n  \n" + "y " * 80 + "\n\nEnd."
+    sentences = list(iter_sentences([document], max_sentence_chars=100))
+    assert [len(sentence.text) for sentence in sentences[1:4]] == [99, 100, 52]
+    assert max(sentence.end_offset - sentence.start_offset for sentence in sentences) <= 100
+    rng = random.Random(0)
+    for _ in range(50):
+        cuts = sorted(rng.sample(range(1, len(document)), rng.randint(1, 40)))
+        bounds = zip([0] + cuts, cuts + [len(document)], strict=True)
+        chunks = [document[start:end] for start, end in bounds]
+        assert list(iter_sentences(chunks, max_sentence_chars=100)) == sentences
+
+
+def test_iter_claims_streams_cues_and_falls_back():
+    claims = [s.text for s in iter_claims(iter_sentences([DOCUMENT]))]
+    assert claims == ["The model is robust.", "Next para must hold.", "Page two should work."]
+    fallback = iter_claims(iter_sentences(["One. Two. Three. Four."]), fallback=2)
+    assert [s.text for s in fallback] == ["One.", "Two."]
+    assert extract_claims(DOCUMENT, limit=1) == ["The model is robust."]
+
+
+def test_claim_extractor_streams_document_with_spans(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    graph = OntologyGraph()
+    context = {"path": str(path)}
+    DocumentIngestor().run(graph, context)
+    result = ClaimExtractor().run(graph, context)
+
+    claims = [graph.get_claim(claim_id) for claim_id in result.created_entities]
+    assert [claim.text for claim in claims] == [
+        "The model is robust.",
+        "Next para must hold.",
+        "Page two should work.",
+    ]
+    span = claims[2].span
+    assert (span.page, span.paragraph) == (2, 1)
+    assert DOCUMENT[span.start_offset : span.end_offset] == claims[2].text
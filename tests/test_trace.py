@@ -1,5 +1,12 @@
-from logos_engine.reasoning.trace import TraceLogger, make_trace
-from logos_engine.reasoning.trace import make_step, make_uncertainty
+from logos_engine.reasoning.trace import (
+    LazyTrace,
+    StepRecord,
+    TraceLogger,
+    UncertaintyRecord,
+    make_step,
+    make_trace,
+    make_uncertainty,
+)
 
 
 def test_trace_export(tmp_path):
@@ -11,3 +18,19 @@ def test_trace_export(tmp_path):
     exported = logger.export()
     assert exported
     assert exported[0].exists()
+
+
+def test_lazy_trace_materializes_on_export(tmp_path):
+    logger = TraceLogger(tmp_path)
+    trace = LazyTrace(
+        "subject",
+        [StepRecord("rule", "desc", 0.1, 0.2)],
+        [UncertaintyRecord("subject", "note", 0.5)],
+    )
+    materialized = trace.materialize()
+    assert materialized.steps[0].rule_id == "rule"
+    assert materialized.uncertainty_markers[0].severity == 0.5
+
+    logger.add_trace(trace)
+    exported = logger.export()
+    assert exported[0].exists()
@@ -0,0 +1,69 @@
+import pytest
+
+from logos_engine.reasoning.trace import LazyTrace, StepRecord, TraceLogger, UncertaintyRecord
+from logos_engine.reasoning.trace_stats import (
+    TraceStatsAccumulator,
+    collect_trace_stats,
+    subjects_with_uncertainty,
+)
+from logos_engine.storage.trace_store import JsonlTraceSink, SQLiteTraceSink
+
+TRACES = [
+    LazyTrace(
+        "claim-0",
+        [StepRecord("rel", "d", 0.8, 0.8), StepRecord("chal", "d", -0.3, 0.5)],
+        [UncertaintyRecord("claim-0", "Unknown evidence type", 0.4)],
+    ),
+    LazyTrace("claim-1", [StepRecord("rel", "d", 0.6, 0.6)], []),
+    LazyTrace(
+        "claim-2",
+        [StepRecord("rel", "d", 0.2, 0.2), StepRecord("conf", "d", 0.75, 0.95)],
+        [UncertaintyRecord("claim-2", "Unknown evidence type", 0.4)],
+    ),
+]
+
+
+def _write(tmp_path, kind):
+    if kind == "dir":
+        logger = TraceLogger(tmp_path / "traces")
+        for trace in TRACES:
+            logger.add_trace(trace)
+        logger.export()
+        return tmp_path / "traces"
+    path = tmp_path / f"traces.{kind}"
+    sink = SQLiteTraceSink(path) if kind == "db" else JsonlTraceSink(path)
+    with sink:
+        for trace in TRACES:
+            sink.write(trace.materialize())
+    return path
+
+
+@pytest.mark.parametrize("kind", ["jsonl", "jsonl.gz", "db", "dir"])
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_collect_trace_stats_across_stores(tmp_path, kind, use_numpy):
+    path = _write(tmp_path, kind)
+    stats = collect_trace_stats([path], delta_bins=4, score_bins=2, chunk_size=2,
+                                use_numpy=use_numpy)
+
+    assert (stats.traces, stats.steps) == (3, 5)
+    rel = stats.rules["rel"]
+    assert rel.count == 3
+    assert rel.total == pytest.approx(1.6)
+    assert (rel.minimum, rel.maximum) == (0.2, 0.8)
+    assert rel.histogram == [0, 0, 1, 2]
+    assert stats.rules["chal"].histogram == [0, 1, 0, 0]
+    assert [rule.rule_id for rule in stats.top_rules(2)] == ["rel", "conf"]
+    assert stats.uncertainties == {("Unknown evidence type", 0.4): 2}
+    assert stats.score_histogram == [0, 3]
+    assert list(subjects_with_uncertainty([path], "Unknown evidence")) == ["claim-0", "claim-2"]
+
+
+def test_accumulator_clamps_out_of_range_values():
+    accumulator = TraceStatsAccumulator(delta_bins=2, score_bins=2)
+    accumulator.add_step("rule", -5.0)
+    accumulator.add_step("rule", 5.0)
+    accumulator.add_score(1.0)
+    stats = accumulator.result()
+    assert stats.rules["rule"].histogram == [1, 1]
+    assert stats.score_histogram == [0, 1]
+    assert stats.bin_edges() == [-1.0, 0.0, 1.0]
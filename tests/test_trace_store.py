@@ -0,0 +1,62 @@
+import pytest
+
+from logos_engine.reasoning.trace import (
+    LazyTrace,
+    StepRecord,
+    TraceLogger,
+    UncertaintyRecord,
+)
+from logos_engine.storage.trace_store import (
+    JsonlTraceSink,
+    SQLiteTraceSink,
+    index_path,
+    open_trace_reader,
+)
+
+
+def _trace(subject_id, delta=0.1):
+    return LazyTrace(
+        subject_id,
+        [StepRecord("rule.a", "desc", delta, 0.5), StepRecord("rule.b", "desc", -0.2, 0.3)],
+        [UncertaintyRecord(subject_id, "unknown evidence type", 0.4)],
+    )
+
+
+@pytest.mark.parametrize("name", ["traces.jsonl", "traces.jsonl.gz", "traces.db"])
+def test_sinks_stream_traces_and_fetch_one_subject(tmp_path, name):
+    path = tmp_path / name
+    sink = SQLiteTraceSink(path, batch_size=2) if name.endswith(".db") else JsonlTraceSink(
+        path, buffer_size=2
+    )
+    logger = TraceLogger(tmp_path, sink=sink)
+    for index in range(5):
+        logger.add_trace(_trace(f"claim-{index}"))
+    logger.add_trace(_trace("claim-1", delta=0.9))
+    assert logger.traces == []
+    with sink:
+        assert logger.export() == [path]
+
+    reader = open_trace_reader(path)
+    traces = list(reader.iter_traces())
+    assert [trace.subject_id for trace in traces] == [
+        "claim-0", "claim-1", "claim-2", "claim-3", "claim-4", "claim-1"
+    ]
+    latest = reader.get("claim-1")
+    assert latest is not None and latest.steps[0].delta == 0.9
+    assert reader.get("claim-3").uncertainty_markers[0].severity == 0.4
+    assert reader.get("missing") is None
+    if name.endswith(".db"):
+        assert reader.subjects_for_rule("rule.b")[:2] == ["claim-0", "claim-1"]
+    else:
+        assert index_path(path).exists()
+    reader.close()
+
+
+def test_jsonl_segment_appends_across_sinks(tmp_path):
+    path = tmp_path / "traces.jsonl.gz"
+    for subject_id in ("a", "b"):
+        with JsonlTraceSink(path) as sink:
+            sink.write(_trace(subject_id).materialize())
+    reader = open_trace_reader(path)
+    assert [trace.subject_id for trace in reader.iter_traces()] == ["a", "b"]
+    assert reader.get("b").subject_id == "b"
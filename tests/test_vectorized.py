@@ -0,0 +1,56 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from logos_engine.ontology.graph import OntologyGraph
+from logos_engine.ontology.models import Assumption, Claim, Evidence
+from logos_engine.ontology.relations import CHALLENGES, SUPPORTS, UNDERLIES
+from logos_engine.reasoning.scoring import compute_claim_confidence
+from logos_engine.rules.rulebook import Rulebook
+
+pytest.importorskip("numpy")
+
+from logos_engine.reasoning.vectorized import compute_claim_confidences  # noqa: E402
+
+WORDS = ["data", "model", "is", "robust", "trial", "effect", "weak", "sample"]
+TYPES = ["empirical", "anecdotal", "expert", "unknown", "blog"]
+
+
+def _random_graph(seed: int) -> OntologyGraph:
+    rng = random.Random(seed)
+    graph = OntologyGraph()
+    for claim_index in range(40):
+        claim_id = f"c{claim_index}"
+        graph.add_entity(Claim(id=claim_id, text=" ".join(rng.sample(WORDS, 3))))
+        for evidence_index in range(rng.randint(0, 6)):
+            evidence_id = f"e{claim_index}_{evidence_index}"
+            graph.add_entity(
+                Evidence(
+                    id=evidence_id,
+                    text=" ".join(rng.sample(WORDS, 2)),
+                    evidence_type=rng.choice(TYPES),
+                )
+            )
+            graph.add_relation(evidence_id, rng.choice([SUPPORTS, CHALLENGES]), claim_id)
+        for assumption_index in range(rng.randint(0, 7)):
+            assumption_id = f"a{claim_index}_{assumption_index}"
+            graph.add_entity(Assumption(id=assumption_id, text="Assumed."))
+            graph.add_relation(assumption_id, UNDERLIES, claim_id)
+    return graph
+
+
+def test_vectorized_matches_scalar_bit_for_bit():
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    graph = _random_graph(seed=7)
+    confidences = compute_claim_confidences(graph, rulebook)
+
+    assert len(confidences) == 40
+    for claim_id, confidence in confidences.items():
+        expected, _ = compute_claim_confidence(claim_id, graph, rulebook)
+        assert confidence == expected
+
+
+def test_vectorized_empty_graph():
+    rulebook = Rulebook.from_path(Path("config/rules.yaml"))
+    assert compute_claim_confidences(OntologyGraph(), rulebook) == {}